@@ -10,6 +10,8 @@ from datetime import datetime
 from collections import Counter
 import json
 
+from excel_report import ReportWriter
+
 def create_professional_excel_report():
     """Create a comprehensive Excel report with multiple sheets"""
 
@@ -24,8 +26,8 @@ def create_professional_excel_report():
     jobs_df = pd.read_csv(csv_file)
     print(f"📋 Loaded {len(jobs_df)} job records")
 
-    # Create Excel writer
-    with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
+    # Streaming writer: rows go to disk as each sheet is added, styles are shared
+    with ReportWriter(excel_file) as writer:
 
         # Sheet 1: Complete Job Listings
         jobs_df_clean = jobs_df[[
@@ -34,7 +36,7 @@ def create_professional_excel_report():
             'Status', 'Type'
         ]].copy()
 
-        jobs_df_clean.to_excel(writer, sheet_name='Vacatures Overzicht', index=False)
+        writer.add_dataframe('Vacatures Overzicht', jobs_df_clean, zebra=True)
         print("✅ Sheet 1: Vacatures Overzicht")
 
         # Sheet 2: Contact Information Only
@@ -42,7 +44,7 @@ def create_professional_excel_report():
             'Werkgever', 'Email', 'Telefoon', 'Contactpersoon', 'Website'
         ]].copy()
         contacts_df = contacts_df.drop_duplicates(subset=['Werkgever'])
-        contacts_df.to_excel(writer, sheet_name='Contact Gegevens', index=False)
+        writer.add_dataframe('Contact Gegevens', contacts_df, zebra=True)
         print("✅ Sheet 2: Contact Gegevens")
 
         # Sheet 3: Statistics Summary
@@ -93,7 +95,7 @@ def create_professional_excel_report():
             stats_data.append([region, count])
 
         stats_df = pd.DataFrame(stats_data, columns=['Categorie', 'Waarde'])
-        stats_df.to_excel(writer, sheet_name='Statistieken', index=False)
+        writer.add_dataframe('Statistieken', stats_df)
         print("✅ Sheet 3: Statistieken")
 
         # Sheet 4: Employer Analysis
@@ -116,7 +118,7 @@ def create_professional_excel_report():
 
         employer_df = pd.DataFrame(employer_analysis)
         employer_df = employer_df.sort_values('Aantal Vacatures', ascending=False)
-        employer_df.to_excel(writer, sheet_name='Werkgever Analyse', index=False)
+        writer.add_dataframe('Werkgever Analyse', employer_df, zebra=True)
         print("✅ Sheet 4: Werkgever Analyse")
 
         # Sheet 5: Recent Jobs (Last 2 weeks)
@@ -129,7 +131,7 @@ def create_professional_excel_report():
                 'Publicatiedatum', 'Deadline', 'Keyword'
             ]].copy()
             recent_jobs_clean = recent_jobs_clean.sort_values('Publicatiedatum', ascending=False)
-            recent_jobs_clean.to_excel(writer, sheet_name='Recente Vacatures', index=False)
+            writer.add_dataframe('Recente Vacatures', recent_jobs_clean)
             print(f"✅ Sheet 5: Recente Vacatures ({len(recent_jobs_df)} jobs)")
 
         # Sheet 6: Instructions and Tips
@@ -163,44 +165,9 @@ def create_professional_excel_report():
         ]
 
         instructions_df = pd.DataFrame(instructions_data, columns=['Instructies & Tips', 'Details'])
-        instructions_df.to_excel(writer, sheet_name='Gebruikersinstructies', index=False)
+        writer.add_dataframe('Gebruikersinstructies', instructions_df)
         print("✅ Sheet 6: Gebruikersinstructies")
 
-        # Apply formatting to all sheets
-        workbook = writer.book
-
-        for sheet_name in workbook.sheetnames:
-            worksheet = workbook[sheet_name]
-
-            # Header formatting
-            if worksheet.max_row > 0:
-                for cell in worksheet[1]:  # First row
-                    if cell.value:
-                        cell.font = cell.font.copy(bold=True, color='FFFFFF')
-                        cell.fill = cell.fill.copy(start_color='366092', end_color='366092', fill_type='solid')
-
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-
-                for cell in column:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-
-            # Add alternating row colors for data sheets
-            if sheet_name in ['Vacatures Overzicht', 'Contact Gegevens', 'Werkgever Analyse']:
-                from openpyxl.styles import PatternFill
-                light_fill = PatternFill(start_color='F8F9FA', end_color='F8F9FA', fill_type='solid')
-
-                for row_num in range(2, worksheet.max_row + 1):  # Skip header
-                    if row_num % 2 == 0:
-                        for cell in worksheet[row_num]:
-                            cell.fill = light_fill
-
     print(f"\n📊 Professional Excel report created: {excel_file}")
     print(f"📄 Contains 6 sheets with comprehensive job data and analysis")
 
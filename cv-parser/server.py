@@ -9,7 +9,16 @@ Parse Dolly Gas CVs en match tegen JobDigger vacatures
 import json
 import re
 import os
+import sys
+import asyncio
 import base64
+import hashlib
+import sqlite3
+import string
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from enum import Enum
 
@@ -17,15 +26,66 @@ from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field, ConfigDict
 import httpx
 
+try:
+    import ahocorasick  # pyahocorasick
+except ImportError:
+    ahocorasick = None
+
 # =============================================================================
 # SERVER INITIALIZATION
 # =============================================================================
 
-mcp = FastMCP("cv_parser_mcp")
-
 # HuggingFace API config
-HF_API_URL = "https://api-inference.huggingface.co/models/sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+HF_MODEL = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+HF_API_URL = f"https://api-inference.huggingface.co/models/{HF_MODEL}"
 HF_TOKEN = os.environ.get('HF_TOKEN', '')
+HF_MAX_CONNECTIONS = int(os.environ.get('HF_MAX_CONNECTIONS', '10'))
+HF_BATCH_SIZE = int(os.environ.get('HF_BATCH_SIZE', '32'))  # sentences per sentence-similarity request
+
+# Similarity cache: in-process LRU + SQLite, survives restarts
+SIMILARITY_CACHE_DB = os.environ.get('SIMILARITY_CACHE_DB', os.path.expanduser('~/.cv-parser/similarity_cache.db'))
+SIMILARITY_CACHE_MEMORY = int(os.environ.get('SIMILARITY_CACHE_MEMORY', '50000'))  # scores kept in process
+SIMILARITY_CACHE_MB = int(os.environ.get('SIMILARITY_CACHE_MB', '64'))  # on-disk size cap
+
+try:
+    import h2  # noqa: F401  (httpx[http2])
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Process-wide pooled client: keep-alive connections skip the TCP+TLS handshake on every call"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=HTTP2,
+            headers={"Authorization": f"Bearer {HF_TOKEN}"} if HF_TOKEN else {},
+            limits=httpx.Limits(
+                max_connections=HF_MAX_CONNECTIONS,
+                max_keepalive_connections=HF_MAX_CONNECTIONS,
+                keepalive_expiry=60.0
+            )
+        )
+    return _http_client
+
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Close the pooled HTTP client when the server shuts down"""
+    try:
+        yield {}
+    finally:
+        await close_http_client()
+
+mcp = FastMCP("cv_parser_mcp", lifespan=lifespan)
 
 # =============================================================================
 # TAXONOMIES & CONFIG
@@ -55,6 +115,10 @@ SKILL_KEYWORDS = {
     'technisch_tekenen': ['autocad', 'solidworks', 'inventor', 'tekening', 'cad', '3d', 'engineering']
 }
 
+# total_score weights; semantic only with MatchCVInput.semantic
+SCORE_WEIGHTS = {'title': 0.6, 'location': 0.4}
+SEMANTIC_SCORE_WEIGHTS = {'title': 0.4, 'location': 0.3, 'semantic': 0.3}
+
 GELDERLAND_CITIES = [
     'arnhem', 'nijmegen', 'apeldoorn', 'ede', 'doetinchem', 'harderwijk',
     'ermelo', 'tiel', 'wageningen', 'barneveld', 'zutphen', 'nijkerk',
@@ -67,6 +131,109 @@ ADJACENT_CITIES = [
     'bunschoten', 'leusden', 'veenendaal', 'rhenen', 'houten', 'nieuwegein'
 ]
 
+OTHER_CITIES = ['amsterdam', 'rotterdam', 'den haag', 'eindhoven', 'tilburg']
+
+# Region -> cities, in lookup order, and the location score per region
+CITY_REGIONS = {'Gelderland': GELDERLAND_CITIES, 'Adjacent': ADJACENT_CITIES, 'Randstad': OTHER_CITIES}
+REGION_SCORES = {'Gelderland': 95, 'Adjacent': 80, 'Randstad': 60}
+
+# =============================================================================
+# KEYWORD ENGINE
+# =============================================================================
+
+def trie_pattern(keywords: List[str]) -> str:
+    """Regex alternation shaped as a prefix trie, longest keyword preferred"""
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[''] = True
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+class KeywordHits:
+    """Taxonomy hits in one text: keyword -> start positions, with per-category views"""
+
+    def __init__(self, engine: "KeywordEngine", positions: Dict[str, List[int]]):
+        self.engine = engine
+        self.positions = positions
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self.positions
+
+    def counts(self, group: str) -> Dict[str, int]:
+        """Keywords found per category (every category, in taxonomy order)"""
+        counts = dict.fromkeys(self.engine.groups[group], 0)
+        for keyword in self.positions:
+            for hit_group, category in self.engine.categories_of[keyword]:
+                if hit_group == group:
+                    counts[category] += 1
+        return counts
+
+    def categories(self, group: str) -> List[str]:
+        """Categories with at least one hit, in taxonomy order"""
+        found = {category for keyword in self.positions
+                 for hit_group, category in self.engine.categories_of[keyword] if hit_group == group}
+        return sorted(found, key=self.engine.order[group].__getitem__)
+
+class KeywordEngine:
+    """
+    Every taxonomy keyword compiled into one automaton at import time.
+
+    A text is scanned once instead of once per keyword, and the hits are shared
+    by all extractors. Hits keep `kw in text` semantics: every occurrence counts,
+    including keywords inside longer ones ('monteur' in 'elektromonteur').
+    Uses pyahocorasick when installed, else a single trie-shaped regex.
+    """
+
+    def __init__(self, groups: Dict[str, Dict[str, List[str]]]):
+        self.groups = groups
+        self.order = {group: {category: i for i, category in enumerate(categories)}
+                      for group, categories in groups.items()}
+        self.categories_of: Dict[str, List[tuple]] = {}
+        for group, categories in groups.items():
+            for category, keywords in categories.items():
+                for keyword in keywords:
+                    self.categories_of.setdefault(keyword, []).append((group, category))
+        keywords = sorted(self.categories_of)
+
+        if ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for keyword in keywords:
+                self.automaton.add_word(keyword, keyword)
+            self.automaton.make_automaton()
+        else:
+            self.automaton = None
+            self.pattern = re.compile(trie_pattern(keywords))
+            # The regex reports the longest keyword per start; shorter ones there are its prefixes
+            self.prefixes = {kw: [p for p in keywords if kw.startswith(p)] for kw in keywords}
+        self.scan_short = lru_cache(maxsize=4096)(self.scan)
+
+    def scan(self, text_lower: str) -> KeywordHits:
+        positions: Dict[str, List[int]] = {}
+        if self.automaton is not None:
+            for end, keyword in self.automaton.iter(text_lower):
+                positions.setdefault(keyword, []).append(end - len(keyword) + 1)
+        else:
+            search = self.pattern.search
+            match = search(text_lower)
+            while match:
+                start = match.start()
+                for keyword in self.prefixes[match.group()]:
+                    positions.setdefault(keyword, []).append(start)
+                match = search(text_lower, start + 1)
+        return KeywordHits(self, positions)
+
+KEYWORDS = KeywordEngine({'title': TITLE_TAXONOMY, 'skill': SKILL_KEYWORDS, 'city': CITY_REGIONS})
+
 # =============================================================================
 # PYDANTIC MODELS
 # =============================================================================
@@ -85,6 +252,7 @@ class MatchCVInput(BaseModel):
     cv_text: str = Field(..., description="Plain text content van het CV", min_length=50)
     vacatures: List[Dict[str, Any]] = Field(..., description="Lijst van vacatures", min_length=1)
     limit: int = Field(default=10, ge=1, le=50)
+    semantic: bool = Field(default=False, description="Meng HuggingFace semantic similarity (CV vs vacaturetekst) in de score")
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
 
 class SemanticMatchInput(BaseModel):
@@ -97,17 +265,163 @@ class ExtractSkillsInput(BaseModel):
     cv_text: str = Field(..., description="CV tekst", min_length=50)
     response_format: ResponseFormat = Field(default=ResponseFormat.JSON)
 
+class Locatie(BaseModel):
+    city: str
+    region: str
+    score: int
+
+class SkillProfiel(BaseModel):
+    primary: Optional[str] = None
+    primary_score: int = 0
+    secondary: Optional[str] = None
+    secondary_score: int = 0
+    top_skills: List[str] = Field(default_factory=list)
+    all_scores: Dict[str, int] = Field(default_factory=dict)
+
+class KandidaatProfiel(BaseModel):
+    naam: str
+    email: str
+    telefoon: str
+    locatie: Locatie
+    functie: str
+    ervaring_jaren: int
+    skills: SkillProfiel
+
+# =============================================================================
+# SIMILARITY CACHE
+# =============================================================================
+
+class SimilarityCache:
+    """
+    Similarity scores keyed by model + hash of both normalized texts.
+
+    Lookups hit an in-process LRU first, then SQLite. When the database grows
+    past `max_bytes` the least recently read scores are dropped until it is
+    back at 90%.
+    """
+
+    ROW_BYTES = 150  # on-disk bytes per score, including the key and accessed indexes
+
+    def __init__(self, path: str, model: str, max_memory: int = 50000, max_bytes: int = 64 * 2**20):
+        self.model = model
+        self.max_memory = max_memory
+        self.max_bytes = max_bytes
+        self.memory: "OrderedDict[str, float]" = OrderedDict()
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0}
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS scores (key TEXT PRIMARY KEY, score REAL NOT NULL, accessed REAL NOT NULL)'
+        )
+        self.db.execute('CREATE INDEX IF NOT EXISTS scores_accessed ON scores (accessed)')
+        self.db.commit()
+        self.disk_entries = self.db.execute('SELECT COUNT(*) FROM scores').fetchone()[0]
+
+    def key(self, source: str, sentence: str) -> str:
+        text = '\0'.join([self.model, ' '.join(source.split()), ' '.join(sentence.split())])
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+    def _remember(self, key: str, score: float) -> None:
+        self.memory[key] = score
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_memory:
+            self.memory.popitem(last=False)
+
+    def _rows(self, query: str, keys: List[str]) -> list:
+        """Run `query` with its IN ({}) list filled in chunks (SQLite caps bound parameters)"""
+        rows = []
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            rows += self.db.execute(query.format(','.join('?' * len(chunk))), chunk).fetchall()
+        return rows
+
+    def get_many(self, keys: List[str]) -> Dict[str, float]:
+        found = {}
+        for key in keys:
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                found[key] = self.memory[key]
+        self.stats['memory_hits'] += sum(1 for key in keys if key in found)
+        lookup = list(dict.fromkeys(k for k in keys if k not in found))
+        rows = self._rows('SELECT key, score FROM scores WHERE key IN ({})', lookup)
+        for key, score in rows:
+            found[key] = score
+            self._remember(key, score)
+        if rows:
+            now = time.time()
+            self.db.executemany('UPDATE scores SET accessed = ? WHERE key = ?', [(now, k) for k, _ in rows])
+            self.db.commit()
+        disk = {key for key, _ in rows}
+        self.stats['disk_hits'] += sum(1 for key in keys if key in disk)
+        self.stats['misses'] += sum(1 for key in keys if key not in found)
+        return found
+
+    def put_many(self, scores: Dict[str, float]) -> None:
+        now = time.time()
+        for key, score in scores.items():
+            self._remember(key, score)
+        existing = len(self._rows('SELECT key FROM scores WHERE key IN ({})', list(scores)))
+        self.db.executemany('INSERT OR REPLACE INTO scores VALUES (?, ?, ?)', [(k, v, now) for k, v in scores.items()])
+        self.disk_entries += len(scores) - existing
+        if self.disk_entries * self.ROW_BYTES > self.max_bytes:
+            evict = self.disk_entries - int(self.max_bytes * 0.9) // self.ROW_BYTES
+            self.db.execute(
+                'DELETE FROM scores WHERE key IN (SELECT key FROM scores ORDER BY accessed LIMIT ?)', (evict,)
+            )
+            self.disk_entries -= evict
+            self.stats['evictions'] += evict
+        self.db.commit()
+
+    def status(self) -> Dict[str, Any]:
+        lookups = self.stats['memory_hits'] + self.stats['disk_hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'hit_rate': round((lookups - self.stats['misses']) / lookups, 4) if lookups else 0.0,
+            'memory_entries': len(self.memory),
+            'disk_entries': self.disk_entries,
+            'disk_mb': round(self.disk_entries * self.ROW_BYTES / 2**20, 2),
+            'max_mb': self.max_bytes / 2**20
+        }
+
+_similarity_cache: Optional[SimilarityCache] = None
+
+def get_similarity_cache() -> SimilarityCache:
+    global _similarity_cache
+    if _similarity_cache is None:
+        args = (HF_MODEL, SIMILARITY_CACHE_MEMORY, SIMILARITY_CACHE_MB * 2**20)
+        try:
+            _similarity_cache = SimilarityCache(SIMILARITY_CACHE_DB, *args)
+        except (OSError, sqlite3.Error) as e:
+            # Read-only or missing home directory: keep scoring with a memory-only cache
+            print(f"Similarity cache unavailable ({e}), keeping it in memory only", file=sys.stderr)
+            _similarity_cache = SimilarityCache(':memory:', *args)
+    return _similarity_cache
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+NAME_LINES = 8  # the name is looked for in the first lines only
+NAME_SKIP = ['curriculum', 'cv', 'resume', 'profiel', 'pagina']
+# Patterns are anchored on a literal ('@', 'jaar ervaring', ...) so re can skip ahead to
+# candidates instead of trying a match at every offset of the CV
+EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + '._%+-')
+PHONE_RES = [re.compile(p) for p in (
+    r'06[-\s]?\d{2}[-\s]?\d{2}[-\s]?\d{2}[-\s]?\d{2}', r'06[-\s]?\d{8}', r'\+31[-\s]?6[-\s]?\d{8}'
+)]
+PHONE_SEPARATORS_RE = re.compile(r'[-\s]')
+# Preceded by (\d+)\+?\s* - checked by hand in experience_years()
+EXPERIENCE_RES = [re.compile(r'jaar\s*ervaring'), re.compile(r'years?\s*experience')]
+YEAR_RE = re.compile(r'(19[89]\d|20[0-2]\d)')
+
 def extract_name(text: str) -> str:
-    lines = text.strip().split('\n')
-    for line in lines[:8]:
+    lines = text.strip().split('\n', NAME_LINES)
+    for line in lines[:NAME_LINES]:
         line = line.strip()
         if not line or len(line) < 4:
             continue
-        if any(skip in line.lower() for skip in ['curriculum', 'cv', 'resume', 'profiel', 'pagina']):
+        if any(skip in line.lower() for skip in NAME_SKIP):
             continue
         words = line.split()
         if 2 <= len(words) <= 4:
@@ -117,46 +431,43 @@ def extract_name(text: str) -> str:
     return "Onbekend"
 
 def extract_email(text: str) -> str:
-    pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    match = re.search(pattern, text)
-    return match.group(0) if match else ""
+    # Try each '@' from the start of the name part in front of it
+    at = text.find('@')
+    while at != -1:
+        start = at
+        while start and text[start - 1] in EMAIL_LOCAL_CHARS:
+            start -= 1
+        if start < at:
+            match = EMAIL_RE.match(text, start)
+            if match:
+                return match.group(0)
+        at = text.find('@', at + 1)
+    return ""
 
 def extract_phone(text: str) -> str:
-    patterns = [r'06[-\s]?\d{2}[-\s]?\d{2}[-\s]?\d{2}[-\s]?\d{2}', r'06[-\s]?\d{8}', r'\+31[-\s]?6[-\s]?\d{8}']
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    for pattern in PHONE_RES:
+        match = pattern.search(text)
         if match:
-            return re.sub(r'[-\s]', '', match.group(0))
+            return PHONE_SEPARATORS_RE.sub('', match.group(0))
     return ""
 
-def extract_location(text: str) -> Dict[str, Any]:
-    text_lower = text.lower()
-    for city in GELDERLAND_CITIES:
-        if city in text_lower:
-            return {'city': city.title(), 'region': 'Gelderland', 'score': 95}
-    for city in ADJACENT_CITIES:
-        if city in text_lower:
-            return {'city': city.title(), 'region': 'Adjacent', 'score': 80}
-    other = ['amsterdam', 'rotterdam', 'den haag', 'eindhoven', 'tilburg']
-    for city in other:
-        if city in text_lower:
-            return {'city': city.title(), 'region': 'Randstad', 'score': 60}
+def extract_location(text: str, hits: Optional[KeywordHits] = None) -> Dict[str, Any]:
+    hits = hits or KEYWORDS.scan(text.lower())
+    for region, cities in CITY_REGIONS.items():
+        for city in cities:
+            if city in hits:
+                return {'city': city.title(), 'region': region, 'score': REGION_SCORES[region]}
     return {'city': 'Onbekend', 'region': 'Unknown', 'score': 50}
 
-def extract_function(text: str) -> str:
-    text_lower = text.lower()
-    for category, keywords in TITLE_TAXONOMY.items():
-        for keyword in keywords:
-            if keyword in text_lower:
-                return category.replace('_', ' ').title()
+def extract_function(text: str, hits: Optional[KeywordHits] = None) -> str:
+    categories = (hits or KEYWORDS.scan(text.lower())).categories('title')
+    if categories:
+        return categories[0].replace('_', ' ').title()
     return "Technisch"
 
-def extract_skills(text: str) -> Dict[str, Any]:
-    text_lower = text.lower()
-    scores = {}
-    for skill, keywords in SKILL_KEYWORDS.items():
-        count = sum(1 for kw in keywords if kw in text_lower)
-        scores[skill] = min(count * 15, 100)
+def extract_skills(text: str, hits: Optional[KeywordHits] = None) -> Dict[str, Any]:
+    counts = (hits or KEYWORDS.scan(text.lower())).counts('skill')
+    scores = {skill: min(count * 15, 100) for skill, count in counts.items()}
     sorted_skills = sorted(scores.items(), key=lambda x: x[1], reverse=True)
     top_skills = [s[0] for s in sorted_skills if s[1] > 0][:3]
     return {
@@ -168,30 +479,43 @@ def extract_skills(text: str) -> Dict[str, Any]:
         'all_scores': dict(sorted_skills)
     }
 
-def extract_years(text: str) -> int:
-    patterns = [r'(\d+)\+?\s*jaar\s*ervaring', r'(\d+)\+?\s*years?\s*experience']
-    for pattern in patterns:
-        match = re.search(pattern, text.lower())
-        if match:
-            return min(int(match.group(1)), 40)
-    years = re.findall(r'(19[89]\d|20[0-2]\d)', text)
+def extract_years(text: str, text_lower: Optional[str] = None) -> int:
+    text_lower = text_lower if text_lower is not None else text.lower()
+    for pattern in EXPERIENCE_RES:
+        years = experience_years(text_lower, pattern)
+        if years is not None:
+            return min(years, 40)
+    years = YEAR_RE.findall(text)
     if len(years) >= 2:
         years_int = [int(y) for y in years]
         return min(max(years_int) - min(years_int), 40)
     return 5
 
+def experience_years(text_lower: str, pattern: re.Pattern) -> Optional[int]:
+    """First "<n>[+] <pattern>": walk back from each pattern hit over whitespace, '+' and digits"""
+    for match in pattern.finditer(text_lower):
+        end = match.start()
+        while end and text_lower[end - 1].isspace():
+            end -= 1
+        if end and text_lower[end - 1] == '+':
+            end -= 1
+        start = end
+        while start and text_lower[start - 1].isdecimal():
+            start -= 1
+        if start < end:
+            return int(text_lower[start:end])
+    return None
+
 def match_title(cv_function: str, vacancy_title: str) -> int:
     cv_lower = cv_function.lower()
     vac_lower = vacancy_title.lower()
     if cv_lower in vac_lower or vac_lower in cv_lower:
         return 100
-    cv_cat = None
-    vac_cat = None
-    for category, keywords in TITLE_TAXONOMY.items():
-        if any(kw in cv_lower for kw in keywords):
-            cv_cat = category
-        if any(kw in vac_lower for kw in keywords):
-            vac_cat = category
+    # Last matching category wins
+    cv_cats = KEYWORDS.scan_short(cv_lower).categories('title')
+    vac_cats = KEYWORDS.scan_short(vac_lower).categories('title')
+    cv_cat = cv_cats[-1] if cv_cats else None
+    vac_cat = vac_cats[-1] if vac_cats else None
     if cv_cat and vac_cat:
         if cv_cat == vac_cat:
             return 90
@@ -214,28 +538,81 @@ def match_location(cv_loc: Dict, vac_loc: str) -> int:
     if cv_city and cv_city in vac_lower:
         return 100
     if cv_region == 'Gelderland':
-        if any(city in vac_lower for city in GELDERLAND_CITIES):
+        vac_regions = KEYWORDS.scan_short(vac_lower).categories('city')
+        if 'Gelderland' in vac_regions:
             return 90
-        if any(city in vac_lower for city in ADJACENT_CITIES):
+        if 'Adjacent' in vac_regions:
             return 75
     return 50
 
+async def hf_sentence_similarity(source: str, sentences: List[str]) -> Optional[List[float]]:
+    """One sentence-similarity request; None when the API fails"""
+    try:
+        response = await get_http_client().post(
+            HF_API_URL,
+            json={"inputs": {"source_sentence": source, "sentences": sentences}}
+        )
+        if response.status_code == 200:
+            result = response.json()
+            if isinstance(result, list) and len(result) == len(sentences):
+                return [float(score) for score in result]
+        return None
+    except Exception:
+        return None
+
+async def hf_semantic_scores(source: str, sentences: List[str]) -> List[float]:
+    """
+    Similarity of `source` to every sentence (0.5 where the API fails).
+
+    Cached pairs are served from the similarity cache; the rest go out in
+    chunks of HF_BATCH_SIZE, sent concurrently.
+    """
+    source = source[:1000]
+    sentences = [sentence[:1000] for sentence in sentences]
+    cache = get_similarity_cache()
+    keys = [cache.key(source, sentence) for sentence in sentences]
+    scores = cache.get_many(keys)
+
+    missing = list(dict.fromkeys((key, sentence) for key, sentence in zip(keys, sentences) if key not in scores))
+    chunks = [missing[i:i + HF_BATCH_SIZE] for i in range(0, len(missing), HF_BATCH_SIZE)]
+    results = await asyncio.gather(*(hf_sentence_similarity(source, [s for _, s in chunk]) for chunk in chunks))
+    fetched = {}
+    for chunk, result in zip(chunks, results):
+        if result is not None:
+            fetched.update((key, score) for (key, _), score in zip(chunk, result))
+    if fetched:
+        cache.put_many(fetched)
+        scores.update(fetched)
+    return [scores.get(key, 0.5) for key in keys]
+
 async def hf_semantic_match(text1: str, text2: str) -> float:
-    headers = {"Authorization": f"Bearer {HF_TOKEN}"} if HF_TOKEN else {}
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                HF_API_URL,
-                headers=headers,
-                json={"inputs": {"source_sentence": text1[:1000], "sentences": [text2[:1000]]}}
-            )
-            if response.status_code == 200:
-                result = response.json()
-                if isinstance(result, list) and len(result) > 0:
-                    return float(result[0])
-            return 0.5
-        except Exception:
-            return 0.5
+    scores = await hf_semantic_scores(text1, [text2])
+    return scores[0]
+
+def vacancy_text(vac: Dict[str, Any], title: str) -> str:
+    description = vac.get('omschrijving', vac.get('Omschrijving', vac.get('beschrijving', '')))
+    return f"{title}. {description}" if description else title
+
+# =============================================================================
+# CV ANALYZER
+# =============================================================================
+
+def analyze_cv(text: str) -> KandidaatProfiel:
+    """
+    Full kandidaat profile in one pass: the CV is lowercased and scanned for
+    taxonomy keywords once, and every extractor works on those shared buffers.
+    """
+    text_lower = text.lower()
+    hits = KEYWORDS.scan(text_lower)
+    return KandidaatProfiel(
+        naam=extract_name(text),
+        email=extract_email(text),
+        telefoon=extract_phone(text),
+        locatie=extract_location(text, hits),
+        functie=extract_function(text, hits),
+        ervaring_jaren=extract_years(text, text_lower),
+        skills=extract_skills(text, hits)
+    )
 
 # =============================================================================
 # MCP TOOLS
@@ -244,57 +621,59 @@ async def hf_semantic_match(text1: str, text2: str) -> float:
 @mcp.tool(name="parse_cv")
 async def parse_cv(params: ParseCVInput) -> str:
     """Parse CV tekst en extract kandidaat informatie."""
-    text = params.cv_text
-    kandidaat = {
-        'naam': extract_name(text),
-        'email': extract_email(text),
-        'telefoon': extract_phone(text),
-        'locatie': extract_location(text),
-        'functie': extract_function(text),
-        'ervaring_jaren': extract_years(text),
-        'skills': extract_skills(text)
-    }
+    kandidaat = analyze_cv(params.cv_text)
     if params.response_format == ResponseFormat.JSON:
-        return json.dumps(kandidaat, indent=2, ensure_ascii=False)
-    skills = kandidaat['skills']
+        return json.dumps(kandidaat.model_dump(), indent=2, ensure_ascii=False)
+    skills = kandidaat.skills
     return f"""## Kandidaat Profiel
 
 | Veld | Waarde |
 |------|--------|
-| **Naam** | {kandidaat['naam']} |
-| **Email** | {kandidaat['email'] or '-'} |
-| **Telefoon** | {kandidaat['telefoon'] or '-'} |
-| **Locatie** | {kandidaat['locatie']['city']} ({kandidaat['locatie']['region']}) |
-| **Functie** | {kandidaat['functie']} |
-| **Ervaring** | {kandidaat['ervaring_jaren']} jaar |
+| **Naam** | {kandidaat.naam} |
+| **Email** | {kandidaat.email or '-'} |
+| **Telefoon** | {kandidaat.telefoon or '-'} |
+| **Locatie** | {kandidaat.locatie.city} ({kandidaat.locatie.region}) |
+| **Functie** | {kandidaat.functie} |
+| **Ervaring** | {kandidaat.ervaring_jaren} jaar |
 
 ### Top Skills
-- **{skills['primary']}**: {skills['primary_score']}%
-- **{skills['secondary']}**: {skills['secondary_score']}%
+- **{skills.primary}**: {skills.primary_score}%
+- **{skills.secondary}**: {skills.secondary_score}%
 """
 
 @mcp.tool(name="match_cv_to_vacancies")
 async def match_cv_to_vacancies(params: MatchCVInput) -> str:
     """Match CV tegen vacatures en geef ranked resultaten."""
     text = params.cv_text
-    cv_function = extract_function(text)
-    cv_location = extract_location(text)
+    hits = KEYWORDS.scan(text.lower())
+    cv_function = extract_function(text, hits)
+    cv_location = extract_location(text, hits)
+    vacatures = [(vac, str(vac.get('vacature', vac.get('Vacature', ''))))
+                 for vac in params.vacatures]
+    vacatures = [(vac, title) for vac, title in vacatures if title]
+    semantic_scores = None
+    if params.semantic:
+        semantic_scores = await hf_semantic_scores(text, [vacancy_text(vac, title) for vac, title in vacatures])
+    weights = SEMANTIC_SCORE_WEIGHTS if params.semantic else SCORE_WEIGHTS
     results = []
-    for vac in params.vacatures:
-        vac_title = str(vac.get('vacature', vac.get('Vacature', '')))
+    for i, (vac, vac_title) in enumerate(vacatures):
         vac_company = str(vac.get('bedrijf', vac.get('Bedrijfsnaam', '')))
         vac_plaats = str(vac.get('plaats', vac.get('Plaats', '')))
-        if not vac_title:
-            continue
         title_score = match_title(cv_function, vac_title)
         location_score = match_location(cv_location, vac_plaats)
-        total = int(title_score * 0.6 + location_score * 0.4)
-        tier = 'TIER1' if total >= 80 else ('TIER2' if total >= 60 else 'TIER3')
-        results.append({
+        total = title_score * weights['title'] + location_score * weights['location']
+        result = {
             'bedrijf': vac_company, 'vacature': vac_title, 'plaats': vac_plaats,
-            'title_match': title_score, 'location_match': location_score,
-            'total_score': total, 'tier': tier
-        })
+            'title_match': title_score, 'location_match': location_score
+        }
+        if semantic_scores is not None:
+            semantic_score = int(round(min(max(semantic_scores[i], 0.0), 1.0) * 100))
+            total += semantic_score * weights['semantic']
+            result['semantic_match'] = semantic_score
+        total = int(total)
+        result['total_score'] = total
+        result['tier'] = 'TIER1' if total >= 80 else ('TIER2' if total >= 60 else 'TIER3')
+        results.append(result)
     results = sorted(results, key=lambda x: x['total_score'], reverse=True)[:params.limit]
     if params.response_format == ResponseFormat.JSON:
         return json.dumps({
@@ -304,10 +683,16 @@ async def match_cv_to_vacancies(params: MatchCVInput) -> str:
             'tier2_count': len([r for r in results if r['tier'] == 'TIER2'])
         }, indent=2, ensure_ascii=False)
     lines = [f"## CV Matches\n\n**Kandidaat:** {cv_function} | {cv_location['city']}\n"]
-    lines.append("| # | Bedrijf | Vacature | Score | Tier |")
-    lines.append("|---|---------|----------|-------|------|")
-    for i, m in enumerate(results, 1):
-        lines.append(f"| {i} | {m['bedrijf'][:25]} | {m['vacature'][:25]} | {m['total_score']} | {m['tier']} |")
+    if params.semantic:
+        lines.append("| # | Bedrijf | Vacature | Semantic | Score | Tier |")
+        lines.append("|---|---------|----------|----------|-------|------|")
+        for i, m in enumerate(results, 1):
+            lines.append(f"| {i} | {m['bedrijf'][:25]} | {m['vacature'][:25]} | {m['semantic_match']} | {m['total_score']} | {m['tier']} |")
+    else:
+        lines.append("| # | Bedrijf | Vacature | Score | Tier |")
+        lines.append("|---|---------|----------|-------|------|")
+        for i, m in enumerate(results, 1):
+            lines.append(f"| {i} | {m['bedrijf'][:25]} | {m['vacature'][:25]} | {m['total_score']} | {m['tier']} |")
     return '\n'.join(lines)
 
 @mcp.tool(name="semantic_match")
@@ -317,6 +702,11 @@ async def semantic_match(params: SemanticMatchInput) -> str:
     interpretation = "Zeer sterk" if score >= 0.8 else "Sterk" if score >= 0.6 else "Matig" if score >= 0.4 else "Zwak"
     return json.dumps({'similarity_score': round(score, 4), 'interpretation': interpretation}, indent=2)
 
+@mcp.tool(name="cache_status")
+async def cache_status() -> str:
+    """Hit/miss statistieken van de similarity cache (geheugen + schijf)."""
+    return json.dumps(get_similarity_cache().status(), indent=2)
+
 @mcp.tool(name="extract_skills")
 async def extract_skills_tool(params: ExtractSkillsInput) -> str:
     """Extract en score skills uit CV tekst."""
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+ANN recall benchmark for the CV-Vacancy Matcher
+Compares approximate vacature retrieval (IVF / HNSW) with exact search on the
+full match pipeline (embedding score + keyword bonus) and reports recall@k
+and per-query latency.
+
+    python3 benchmark_ann.py --vacatures 20000 --queries 200
+    python3 benchmark_ann.py --backend ivf --nprobe 4 8 16 32
+    python3 benchmark_ann.py --real   # use the vectors in VACATURE_INDEX_DIR
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import statistics
+from typing import Dict, List
+
+import numpy as np
+
+TITLES = ["Ploegleider", "Teamleider", "Process Engineer", "Operator", "Monteur", "Planner",
+          "Productieleider", "Kwaliteitsmanager", "Onderhoudstechnicus", "Operations Manager"]
+SKILLS = ["lean", "productie", "six-sigma", "plc", "kwaliteit", "leiderschap", "assemblage",
+          "onderhoud", "planning", "veiligheid", "mechanica", "elektrotechniek"]
+CITIES = ["Eindhoven", "Veldhoven", "Arnhem", "Nijmegen", "Apeldoorn", "Ede", "Veghel"]
+
+# =============================================================================
+# DATA
+# =============================================================================
+
+def clustered_vectors(count: int, centres: np.ndarray, rng) -> np.ndarray:
+    """Topic centres plus noise: real sentence embeddings cluster like this, uniform noise doesn't"""
+    vectors = centres[rng.integers(len(centres), size=count)] + rng.normal(scale=0.8, size=(count, centres.shape[1]))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors.astype(np.float32)
+
+def synthetic_vacatures(server, count: int) -> List:
+    rnd = random.Random(0)
+    return [server.Vacature(str(i), f"{rnd.choice(TITLES)} {i}", f"Bedrijf {i % 500}", rnd.choice(CITIES),
+                            rnd.sample(SKILLS, 3)) for i in range(count)]
+
+def synthetic_kandidaten(server, count: int) -> List:
+    rnd = random.Random(1)
+    return [server.Kandidaat("Test", str(i), gewenste_functie=rnd.choice(TITLES),
+                             skills=rnd.sample(SKILLS, 3), locatie=rnd.choice(CITIES)) for i in range(count)]
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def run(server, kandidaten, vacatures, top_k: int) -> (List[List[str]], List[float]):
+    ids, latencies = [], []
+    for k in kandidaten:
+        start = time.perf_counter()
+        matches = server.match_kandidaat_vacatures(k, vacatures, top_k)
+        latencies.append(time.perf_counter() - start)
+        ids.append([m.vacature.id for m in matches])
+    return ids, latencies
+
+def recall(exact: List[List[str]], approx: List[List[str]]) -> float:
+    hits = sum(len(set(e) & set(a)) for e, a in zip(exact, approx))
+    return hits / max(1, sum(len(e) for e in exact))
+
+def main(args):
+    os.environ["VACATURE_INDEX_DIR"] = args.index_dir or tempfile.mkdtemp(prefix="ann-benchmark-")
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import server
+
+    rng = np.random.default_rng(0)
+    if args.real:
+        matrix = np.load(os.path.join(os.environ["VACATURE_INDEX_DIR"], "embeddings.npy"))
+        args.vacatures = len(matrix)
+    else:
+        centres = rng.normal(size=(args.topics, args.dim))
+        matrix = clustered_vectors(args.vacatures, centres, rng)
+    vacatures = synthetic_vacatures(server, args.vacatures)
+    kandidaten = synthetic_kandidaten(server, args.queries)
+    if args.real:
+        # Perturbed catalogue rows stand in for kandidaat embeddings
+        queries = matrix[rng.choice(len(matrix), args.queries)] + rng.normal(scale=0.02, size=(args.queries, matrix.shape[1]))
+    else:
+        queries = clustered_vectors(args.queries, centres, rng)
+
+    # Serve the generated vectors instead of calling HuggingFace
+    vectors: Dict[str, np.ndarray] = {v.search_text(): row for v, row in zip(vacatures, matrix)}
+    vectors.update({k.search_text(): q for k, q in zip(kandidaten, queries)})
+    server.get_embeddings = lambda texts: [vectors[t] for t in texts]
+    server._index = None
+
+    index = server.get_index()
+    index.vectors(vacatures)
+    server.CONFIG["ann_min_vacatures"] = 0
+
+    server.CONFIG["ann_backend"] = "off"
+    exact, exact_lat = run(server, kandidaten, vacatures, args.top_k)
+
+    header = f"{'backend':<10}{'nprobe':>8}{'build s':>9}{'recall@' + str(args.top_k):>11}{'p50 ms':>9}{'p99 ms':>9}"
+    print(f"{args.vacatures} vacatures, {args.queries} queries, shortlist {server.CONFIG['ann_candidates']}")
+    print(header)
+    print("-" * len(header))
+    print(f"{'exact':<10}{'-':>8}{'-':>9}{1.0:>11.3f}{percentile(exact_lat, 50):>9.1f}{percentile(exact_lat, 99):>9.1f}")
+
+    for nprobe in (args.nprobe if args.backend == "ivf" else [None]):
+        server.CONFIG["ann_backend"] = args.backend
+        if nprobe:
+            server.CONFIG["ivf_nprobe"] = nprobe
+        index._ann = None
+        start = time.perf_counter()
+        index.ann_for(index.vectors(vacatures))
+        build = time.perf_counter() - start
+        approx, lat = run(server, kandidaten, vacatures, args.top_k)
+        print(f"{args.backend:<10}{nprobe or '-':>8}{build:>9.2f}{recall(exact, approx):>11.3f}"
+              f"{percentile(lat, 50):>9.1f}{percentile(lat, 99):>9.1f}")
+
+def percentile(values: List[float], pct: int) -> float:
+    """Milliseconds"""
+    if len(values) < 2:
+        return values[0] * 1000 if values else 0.0
+    return statistics.quantiles(values, n=100)[pct - 1] * 1000
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recall/latency of ANN vacature retrieval vs exact search")
+    parser.add_argument("--vacatures", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--topics", type=int, default=300, help="Clusters in the synthetic embeddings")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--backend", default="ivf", choices=["ivf", "hnsw"])
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 8, 16, 32], help="IVF buckets scanned per query")
+    parser.add_argument("--real", action="store_true", help="Use embeddings.npy from the index directory")
+    parser.add_argument("--index-dir", help="Index directory (default: a temporary one)")
+    main(parser.parse_args())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Streaming Excel Report Writer
+Copy of the repo-root excel_report.py, shipped with the matcher so it deploys
+on its own (keep the two in sync).
+
+Uses openpyxl write-only mode: rows go straight to disk, so memory stays flat
+for multi-thousand-row exports. Styles are registered once as named styles
+instead of being copied onto every cell afterwards.
+
+    with ReportWriter("report.xlsx") as report:
+        report.add_sheet("Vacatures", ["Vacature", "Werkgever"], rows, zebra=True)
+        report.add_dataframe("Statistieken", stats_df)
+"""
+
+import itertools
+from typing import Iterable, List, Optional, Sequence
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
+from openpyxl.utils import get_column_letter
+
+HEADER_COLOR = "366092"
+ZEBRA_COLOR = "F8F9FA"
+MAX_COLUMN_WIDTH = 50
+WIDTH_SAMPLE_ROWS = 500  # column widths are sized from the header plus this many rows
+
+
+class ReportWriter:
+    """Write-only workbook with a shared 'header' and 'zebra' style"""
+
+    def __init__(self, path: str, header_color: str = HEADER_COLOR):
+        self.path = path
+        self._styles = {}
+        self.workbook = Workbook(write_only=True)
+        self.workbook.add_named_style(NamedStyle(
+            name="header",
+            font=Font(bold=True, color="FFFFFF"),
+            fill=PatternFill("solid", start_color=header_color, end_color=header_color),
+            alignment=Alignment(horizontal="center"),
+        ))
+        self.workbook.add_named_style(NamedStyle(
+            name="zebra",
+            fill=PatternFill("solid", start_color=ZEBRA_COLOR, end_color=ZEBRA_COLOR),
+        ))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.save()
+
+    def add_sheet(self, title: str, headers: Sequence[str], rows: Iterable[Sequence],
+                  zebra: bool = False, widths: Optional[List[float]] = None) -> int:
+        """Stream `rows` into a new sheet; returns the number of data rows written"""
+        ws = self.workbook.create_sheet(title)
+        rows = iter(rows)
+
+        # Write-only sheets need their column widths before the first row
+        sample = list(itertools.islice(rows, WIDTH_SAMPLE_ROWS))
+        for col, width in enumerate(widths or column_widths(headers, sample), 1):
+            ws.column_dimensions[get_column_letter(col)].width = width
+        ws.freeze_panes = "A2"
+
+        ws.append([self._cell(ws, h, "header") for h in headers])
+        count = 0
+        for count, row in enumerate(itertools.chain(sample, rows), 1):
+            # Sheet row count + 1; even sheet rows get the zebra fill
+            if zebra and count % 2 == 1:
+                ws.append([self._cell(ws, value, "zebra") for value in row])
+            else:
+                ws.append([clean(value) for value in row])
+        return count
+
+    def add_dataframe(self, title: str, df, zebra: bool = False) -> int:
+        """pandas DataFrame as a sheet (NaN written as empty cells)"""
+        return self.add_sheet(title, [str(c) for c in df.columns], df.itertuples(index=False, name=None), zebra)
+
+    def save(self):
+        self.workbook.save(self.path)
+
+    def _cell(self, ws, value, style: str) -> WriteOnlyCell:
+        cell = WriteOnlyCell(ws, value=clean(value))
+        # Resolve the named style once, then share its style array (cells are serialized immediately)
+        if style not in self._styles:
+            cell.style = style
+            self._styles[style] = cell._style
+        cell._style = self._styles[style]
+        return cell
+
+
+def clean(value):
+    """Values openpyxl can't store as-is: NaN/NaT become empty, other objects text"""
+    if value is None or isinstance(value, (str, int, bool)):
+        return value
+    if value != value:  # NaN / NaT
+        return None
+    if isinstance(value, float) or hasattr(value, "isoformat"):
+        return value
+    if hasattr(value, "item"):  # numpy scalars
+        return value.item()
+    return str(value)
+
+
+def column_widths(headers: Sequence[str], rows: List[Sequence]) -> List[float]:
+    """Longest value per column + 2, capped at MAX_COLUMN_WIDTH"""
+    widths = [len(str(h)) for h in headers]
+    for row in rows:
+        for col, value in enumerate(row[:len(widths)]):
+            if value is not None:
+                widths[col] = max(widths[col], len(str(value)))
+    return [min(w + 2, MAX_COLUMN_WIDTH) for w in widths]
@@ -28,12 +28,28 @@ Usage:
 """
 
 import os
+import sys
 import json
 import csv
+import urllib.error
 import urllib.request
 import base64
+import random
+import itertools
+import re
+import time
+import sqlite3
+import hashlib
+import threading
+import uuid
+from abc import ABC, abstractmethod
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import Queue, Empty
 from dataclasses import dataclass, field, asdict
-from typing import List, Optional
+from functools import cached_property
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 from fastmcp import FastMCP
 
@@ -44,17 +60,39 @@ from fastmcp import FastMCP
 CONFIG = {
     "hf_token": os.environ.get("HF_TOKEN", ""),
     "hf_model": "sentence-transformers/all-MiniLM-L6-v2",
+    # "auto": local model if sentence-transformers is installed, else HuggingFace API
+    "embedding_backend": os.environ.get("EMBEDDING_BACKEND", "auto"),  # auto | local | onnx | hf
+    "embedding_batch_size": int(os.environ.get("EMBEDDING_BATCH_SIZE", "64")),
+    "embedding_max_length": int(os.environ.get("EMBEDDING_MAX_LENGTH", "128")),  # tokens; MiniLM max is 256
+    "embedding_threads": int(os.environ.get("EMBEDDING_THREADS", "0")),  # 0 = library default
+    "embedding_batch_wait": 0.005,  # seconds to collect concurrent requests into one batch
+    "embedding_cache_db": os.environ.get("EMBEDDING_CACHE_DB", ""),  # default: <index_dir>/embedding_cache.db
+    "embedding_cache_memory": int(os.environ.get("EMBEDDING_CACHE_MEMORY", "10000")),  # vectors kept in process
+    "embedding_cache_mb": int(os.environ.get("EMBEDDING_CACHE_MB", "256")),  # on-disk size cap
     "resend_api_key": os.environ.get("RESEND_API_KEY", ""),
+    "resend_api_url": os.environ.get("RESEND_API_URL", "https://api.resend.com"),
     "from_email": "CV Matcher <onboarding@resend.dev>",
     "reply_to": "warts@recruitin.nl",
     "typeform_url": "https://form.typeform.com/to/uwu2PZyR",
     "vacatures_path": os.environ.get("VACATURES_CSV", "vacatures.csv"),
+    "index_dir": os.environ.get("VACATURE_INDEX_DIR", os.path.expanduser("~/.cv-vacancy-matcher")),
+    "kandidaten_db": os.environ.get("KANDIDATEN_DB", ""),  # default: <index_dir>/kandidaten.db
+    "email_queue_db": os.environ.get("EMAIL_QUEUE_DB", ""),  # default: <index_dir>/outbox.db
+    "email_concurrency": 4,  # parallel requests to Resend
+    "email_max_attempts": 5,
+    # Approximate search: "auto" (hnswlib if installed, else IVF), "hnsw", "ivf" or "off"
+    "ann_backend": os.environ.get("VACATURE_ANN", "auto"),
+    "ann_min_vacatures": int(os.environ.get("VACATURE_ANN_MIN", "5000")),
+    "ann_candidates": 300,  # vacatures per kandidaat that get the keyword rescore
+    "ivf_nprobe": int(os.environ.get("VACATURE_IVF_NPROBE", "32")),
 }
 
 # ============================================
 # DATA CLASSES
 # ============================================
 
+TOKEN_RE = re.compile(r"\w+")
+
 @dataclass
 class Kandidaat:
     voornaam: str
@@ -71,6 +109,14 @@ class Kandidaat:
     
     def search_text(self):
         return f"{self.gewenste_functie} {' '.join(self.skills)} {self.locatie}"
+    
+    @cached_property
+    def functie_lower(self) -> str:
+        return self.gewenste_functie.lower()
+    
+    @cached_property
+    def skill_set(self) -> frozenset:
+        return frozenset(s.lower() for s in self.skills)
 
 @dataclass 
 class Vacature:
@@ -87,6 +133,24 @@ class Vacature:
     
     def search_text(self):
         return f"{self.titel} {self.bedrijf} {' '.join(self.skills)} {self.locatie}"
+    
+    # Derived fields, computed once per loaded vacature (not part of asdict())
+    @cached_property
+    def titel_lower(self) -> str:
+        return self.titel.lower()
+    
+    @cached_property
+    def title_tokens(self) -> frozenset:
+        return frozenset(TOKEN_RE.findall(self.titel_lower))
+    
+    @cached_property
+    def skill_set(self) -> frozenset:
+        return frozenset(s.lower() for s in self.skills)
+    
+    @cached_property
+    def content_hash(self) -> str:
+        """Key of this vacature's embedding in the index"""
+        return hashlib.sha1(self.search_text().encode("utf-8")).hexdigest()
 
 @dataclass
 class Match:
@@ -94,14 +158,115 @@ class Match:
     score: float
     ai_score: float
 
+class TokenIndex:
+    """Inverted index: token -> sorted row numbers, optionally over a lowercased text field"""
+    
+    def __init__(self, token_sets: List[frozenset], values: Optional[List[str]] = None):
+        self.values = values
+        postings: Dict[str, List[int]] = {}
+        for row, tokens in enumerate(token_sets):
+            for token in tokens:
+                postings.setdefault(token, []).append(row)
+        self.postings = {t: np.array(rows, dtype=np.int64) for t, rows in postings.items()}
+    
+    def rows(self, token: str) -> np.ndarray:
+        return self.postings.get(token, np.empty(0, dtype=np.int64))
+    
+    @cached_property
+    def grams(self) -> Dict[str, set]:
+        """Every 1-3 character substring -> the tokens containing it (built on first substring search)"""
+        grams: Dict[str, set] = {}
+        for token in self.postings:
+            for n in (1, 2, 3):
+                for i in range(len(token) - n + 1):
+                    grams.setdefault(token[i:i + n], set()).add(token)
+        return grams
+    
+    def tokens_containing(self, part: str) -> List[str]:
+        """Tokens with `part` as a substring, via the trigram sets instead of a vocabulary scan"""
+        if len(part) <= 3:
+            return list(self.grams.get(part, ()))
+        sets = sorted((self.grams.get(part[i:i + 3], set()) for i in range(len(part) - 2)), key=len)
+        return [t for t in sets[0].intersection(*sets[1:]) if part in t]
+    
+    def substring_rows(self, query: str) -> np.ndarray:
+        """Rows whose value contains `query`; same result as `query in value` for every row"""
+        tokens = TOKEN_RE.findall(query)
+        if not tokens:
+            candidates = range(len(self.values))
+        else:
+            # Each query token lies inside a single token of any value that contains the query
+            longest = max(tokens, key=len)
+            lists = [self.postings[token] for token in self.tokens_containing(longest)]
+            candidates = np.unique(np.concatenate(lists)) if lists else []
+        return np.array([r for r in candidates if query in self.values[r]], dtype=np.int64)
+
+@dataclass
+class KandidaatMatch:
+    kandidaat: Kandidaat
+    score: float
+    ai_score: float
+
+@dataclass
+class Catalogue:
+    """Parsed vacatures plus lookups, reused until the CSV changes"""
+    vacatures: List[Vacature]
+    by_id: Dict[str, Vacature]
+    source: tuple = ()  # (path, mtime_ns, size) it was parsed from
+    
+    # Search indexes, built on first use
+    @cached_property
+    def rows(self) -> Dict[str, int]:
+        """id -> position in vacatures (first occurrence, like by_id)"""
+        rows: Dict[str, int] = {}
+        for i, v in enumerate(self.vacatures):
+            rows.setdefault(v.id, i)
+        return rows
+    
+    @cached_property
+    def title_index(self) -> TokenIndex:
+        return TokenIndex([v.title_tokens for v in self.vacatures], [v.titel_lower for v in self.vacatures])
+    
+    @cached_property
+    def location_index(self) -> TokenIndex:
+        locaties = [v.locatie.lower() for v in self.vacatures]
+        return TokenIndex([frozenset(TOKEN_RE.findall(l)) for l in locaties], locaties)
+    
+    @cached_property
+    def skill_index(self) -> TokenIndex:
+        return TokenIndex([v.skill_set for v in self.vacatures])
+    
+    @cached_property
+    def salary_order(self) -> np.ndarray:
+        return np.argsort([v.salaris_min for v in self.vacatures], kind="stable")
+    
+    @cached_property
+    def salary_sorted(self) -> np.ndarray:
+        return np.array([self.vacatures[i].salaris_min for i in self.salary_order])
+    
+    def filter_rows(self, locatie: str = "", min_salaris: int = 0) -> np.ndarray:
+        """Rows (in catalogue order) matching the lijst_vacatures filters"""
+        rows = None
+        if locatie:
+            rows = self.location_index.substring_rows(locatie.lower())
+        if min_salaris > 0:
+            start = np.searchsorted(self.salary_sorted, min_salaris, side="left")
+            by_salary = np.sort(self.salary_order[start:])
+            rows = by_salary if rows is None else np.intersect1d(rows, by_salary, assume_unique=True)
+        return np.arange(len(self.vacatures)) if rows is None else rows
+    
+    def keyword_rows(self, kandidaat: Kandidaat) -> np.ndarray:
+        """Rows with a title or skill hit for `kandidaat`; every other vacature scores 0 in keyword_match"""
+        parts = [self.title_index.substring_rows(kandidaat.functie_lower)]
+        parts += [self.skill_index.rows(s) for s in kandidaat.skill_set]
+        return np.unique(np.concatenate(parts))
+
 # ============================================
 # CORE FUNCTIONS
 # ============================================
 
-def load_vacatures(path: str = None) -> List[Vacature]:
-    """Load vacatures from CSV"""
-    path = path or CONFIG["vacatures_path"]
-    
+def parse_vacatures(path: str) -> List[Vacature]:
+    """Parse vacatures from CSV"""
     if not os.path.exists(path):
         # Return sample data if no CSV
         return [
@@ -140,108 +305,886 @@ def load_vacatures(path: str = None) -> List[Vacature]:
             ))
     return vacatures
 
-def get_embeddings(texts: List[str]) -> List[List[float]]:
-    """Get embeddings from HuggingFace"""
-    token = CONFIG["hf_token"]
-    if not token:
-        return []
-    
+_catalogues: Dict[str, Catalogue] = {}
+_catalogue_lock = threading.Lock()
+
+def load_catalogue(path: str = None) -> Catalogue:
+    """Vacature catalogue for `path`; the CSV is only re-parsed when its mtime or size changes"""
+    path = os.path.abspath(path or CONFIG["vacatures_path"])
     try:
+        st = os.stat(path)
+        source = (path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        source = (path, None, None)
+    
+    with _catalogue_lock:
+        cached = _catalogues.get(path)
+        if cached and cached.source == source:
+            return cached
+        
+        vacatures = parse_vacatures(path)
+        for v in vacatures:
+            v.titel_lower, v.title_tokens, v.skill_set, v.content_hash  # precompute
+        # First occurrence wins on duplicate ids, like the old linear scan
+        catalogue = Catalogue(vacatures, {v.id: v for v in reversed(vacatures)}, source)
+        _catalogues[path] = catalogue
+        return catalogue
+
+def load_vacatures(path: str = None) -> List[Vacature]:
+    """Load vacatures from CSV (cached, see load_catalogue)"""
+    return load_catalogue(path).vacatures
+
+def catalogue_for(vacatures: List[Vacature]) -> Optional[Catalogue]:
+    """The cached catalogue `vacatures` came from, if it is one (not a filtered copy)"""
+    return next((c for c in _catalogues.values() if c.vacatures is vacatures), None)
+
+# ============================================
+# EMBEDDING BACKENDS
+# ============================================
+
+class EmbeddingBackend(ABC):
+    """Turns texts into a (len(texts), dim) float32 array"""
+    name: str
+    
+    @abstractmethod
+    def embed(self, texts: List[str]) -> np.ndarray:
+        ...
+
+class HFBackend(EmbeddingBackend):
+    """HuggingFace Inference API, one HTTPS round-trip per batch"""
+    name = "hf"
+    
+    def __init__(self, token: str, model: str, batch_size: int):
         from huggingface_hub import InferenceClient
-        client = InferenceClient(token=token)
-        result = client.feature_extraction(texts, model=CONFIG["hf_model"])
-        if hasattr(result[0], 'tolist'):
-            return [r.tolist() for r in result]
-        return list(result)
-    except Exception as e:
-        print(f"HF error: {e}")
-        return []
+        self.client = InferenceClient(token=token)
+        self.model = model
+        self.batch_size = batch_size
+    
+    def embed(self, texts: List[str]) -> np.ndarray:
+        chunks = [np.asarray(self.client.feature_extraction(texts[i:i + self.batch_size], model=self.model),
+                             dtype=np.float32)
+                  for i in range(0, len(texts), self.batch_size)]
+        return np.concatenate(chunks)
 
-def cosine_sim(a: List[float], b: List[float]) -> float:
-    """Cosine similarity between two vectors"""
-    dot = sum(x*y for x,y in zip(a,b))
-    na = sum(x*x for x in a)**0.5
-    nb = sum(x*x for x in b)**0.5
-    return dot/(na*nb) if na and nb else 0
+class LocalBackend(EmbeddingBackend):
+    """
+    In-process sentence-transformers model on CPU (torch or ONNX Runtime).
 
-def match_kandidaat_vacatures(kandidaat: Kandidaat, vacatures: List[Vacature]) -> List[Match]:
-    """AI-powered matching"""
-    texts = [kandidaat.search_text()] + [v.search_text() for v in vacatures]
-    embs = get_embeddings(texts)
+    All encodes run on one worker thread, so they never overlap and respect
+    EMBEDDING_THREADS. Concurrent callers are coalesced: small requests wait up
+    to `batch_wait` for others and are encoded together in one forward pass.
+    """
+    name = "local"
     
-    results = []
+    def __init__(self, model: str, batch_size: int, max_length: int, threads: int = 0,
+                 onnx: bool = False, batch_wait: float = 0.005):
+        from sentence_transformers import SentenceTransformer
+        kwargs = {}
+        if onnx:
+            self.name = "onnx"
+            kwargs["backend"] = "onnx"
+            if threads:
+                import onnxruntime
+                options = onnxruntime.SessionOptions()
+                options.intra_op_num_threads = threads
+                kwargs["model_kwargs"] = {"session_options": options}
+        elif threads:
+            import torch
+            torch.set_num_threads(threads)
+        
+        self.model = SentenceTransformer(model, device="cpu", **kwargs)
+        self.model.max_seq_length = max_length
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.queue: "Queue[tuple]" = Queue()
+        threading.Thread(target=self._batch_worker, daemon=True).start()
     
-    if len(embs) >= 2:
-        # AI matching
-        k_emb = embs[0]
-        for i, v in enumerate(vacatures):
-            ai = (cosine_sim(k_emb, embs[i+1]) + 1) / 2
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        return self.model.encode(texts, batch_size=self.batch_size, convert_to_numpy=True,
+                                 normalize_embeddings=True, show_progress_bar=False).astype(np.float32)
+    
+    def embed(self, texts: List[str]) -> np.ndarray:
+        # Large requests go through the queue too; the worker encodes them on their own
+        future = Future()
+        self.queue.put((texts, future))
+        return future.result()
+    
+    def _batch_worker(self):
+        while True:
+            pending = [self.queue.get()]
+            size = len(pending[0][0])
+            deadline = time.monotonic() + self.batch_wait
+            while size < self.batch_size:
+                try:
+                    item = self.queue.get(timeout=max(0, deadline - time.monotonic()))
+                except Empty:
+                    break
+                pending.append(item)
+                size += len(item[0])
             
-            # Keyword bonus
-            kw = 0
-            if kandidaat.gewenste_functie.lower() in v.titel.lower():
-                kw += 0.3
-            skill_match = len(set(s.lower() for s in kandidaat.skills) & 
-                           set(s.lower() for s in v.skills))
-            kw += skill_match * 0.1
+            try:
+                vectors = self._encode([t for texts, _ in pending for t in texts])
+            except Exception as e:
+                for _, future in pending:
+                    future.set_exception(e)
+                continue
+            offset = 0
+            for texts, future in pending:
+                future.set_result(vectors[offset:offset + len(texts)])
+                offset += len(texts)
+
+_backend: Optional[EmbeddingBackend] = None
+_backend_resolved = False  # set once a backend was chosen, including "none"
+_backend_lock = threading.Lock()
+
+def get_backend() -> Optional[EmbeddingBackend]:
+    """Process-wide embedding backend per CONFIG["embedding_backend"]; None means keyword-only matching"""
+    global _backend, _backend_resolved
+    with _backend_lock:
+        if _backend_resolved:
+            return _backend
+        _backend_resolved = True
+        
+        choice = CONFIG["embedding_backend"]
+        if choice in ("auto", "local", "onnx"):
+            try:
+                _backend = LocalBackend(CONFIG["hf_model"], CONFIG["embedding_batch_size"],
+                                        CONFIG["embedding_max_length"], CONFIG["embedding_threads"],
+                                        onnx=choice == "onnx", batch_wait=CONFIG["embedding_batch_wait"])
+            except Exception as e:
+                print(f"Local embedding model unavailable ({e})")
+        if _backend is None and choice in ("auto", "hf") and CONFIG["hf_token"]:
+            try:
+                _backend = HFBackend(CONFIG["hf_token"], CONFIG["hf_model"], CONFIG["embedding_batch_size"])
+            except ImportError as e:
+                print(f"HF backend unavailable ({e})")
+        if _backend is None:
+            print("No embedding backend, using keyword matching")
+        return _backend
+
+def get_embeddings(texts: List[str]) -> np.ndarray:
+    """Embeddings for `texts`, from the cache or the configured backend (empty on failure)"""
+    backend = get_backend()
+    if backend is None or not texts:
+        return np.empty((0, 0), dtype=np.float32)
+    
+    cache = get_embedding_cache()
+    vectors = cache.get_many(texts)
+    missing = list(dict.fromkeys(t for t, vec in zip(texts, vectors) if vec is None))
+    if missing:
+        try:
+            embs = np.asarray(backend.embed(missing), dtype=np.float32)
+            if embs.ndim != 2 or len(embs) != len(missing):
+                raise ValueError(f"unexpected embedding shape {embs.shape}")
+        except Exception as e:
+            print(f"Embedding error ({backend.name}): {e}")
+            return np.empty((0, 0), dtype=np.float32)
+        cache.put_many(missing, embs)
+        new = dict(zip(missing, embs))
+        vectors = [new[t] if vec is None else vec for t, vec in zip(texts, vectors)]
+    return np.stack(vectors)
+
+# ============================================
+# EMBEDDING CACHE
+# ============================================
+
+class EmbeddingCache:
+    """
+    Embeddings by model + normalized text: an in-process LRU in front of SQLite.
+
+    Keys are a SHA-1 of the model id and the whitespace-normalized text, so the
+    same CV or vacature text is embedded once across sessions. The database is
+    kept under `max_bytes` by dropping the least recently read vectors.
+    """
+    
+    def __init__(self, path: str, model: str, max_memory: int = 10000, max_bytes: int = 256 * 2**20):
+        self.model = model
+        self.max_memory = max_memory
+        self.max_bytes = max_bytes
+        self.memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                vector BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                accessed REAL NOT NULL
+            )
+        """)
+        self.db.execute("CREATE INDEX IF NOT EXISTS embeddings_accessed ON embeddings (accessed)")
+        self.db.commit()
+        self.disk_bytes = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM embeddings").fetchone()[0]
+    
+    def key(self, text: str) -> str:
+        return hashlib.sha1(f"{self.model}\0{' '.join(text.split())}".encode("utf-8")).hexdigest()
+    
+    def _rows(self, query: str, keys: List[str]) -> list:
+        """Run `query` with its IN ({}) list filled in chunks (SQLite caps bound parameters)"""
+        rows = []
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            rows += self.db.execute(query.format(",".join("?" * len(chunk))), chunk).fetchall()
+        return rows
+    
+    def _remember(self, key: str, vec: np.ndarray):
+        self.memory[key] = vec
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_memory:
+            self.memory.popitem(last=False)
+    
+    def get_many(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """Cached vector per text, None for misses"""
+        keys = [self.key(t) for t in texts]
+        with self.lock:
+            found = {}
+            for key in keys:
+                if key in self.memory:
+                    self.memory.move_to_end(key)
+                    found[key] = self.memory[key]
+            lookup = list(dict.fromkeys(k for k in keys if k not in found))
+            rows = self._rows("SELECT key, vector FROM embeddings WHERE key IN ({})", lookup)
+            for key, blob in rows:
+                found[key] = np.frombuffer(blob, dtype=np.float32)
+                self._remember(key, found[key])
+            if rows:
+                now = time.time()
+                self.db.executemany("UPDATE embeddings SET accessed = ? WHERE key = ?", [(now, key) for key, _ in rows])
+                self.db.commit()
             
-            score = ai * 0.6 + min(kw, 0.4)
-            results.append(Match(v, min(score, 1.0), ai))
-    else:
+            vectors = [found.get(key) for key in keys]
+            disk = set(lookup) & set(found)
+            for key, vec in zip(keys, vectors):
+                if vec is None:
+                    self.stats["misses"] += 1
+                elif key in disk:
+                    self.stats["disk_hits"] += 1
+                else:
+                    self.stats["memory_hits"] += 1
+            return vectors
+    
+    def put_many(self, texts: List[str], vectors: np.ndarray):
+        now = time.time()
+        with self.lock:
+            records = {}
+            for text, vec in zip(texts, vectors):
+                key = self.key(text)
+                vec = np.ascontiguousarray(vec, dtype=np.float32)
+                self._remember(key, vec)
+                records[key] = (key, vec.tobytes(), vec.nbytes, now)
+            replaced = self._rows("SELECT size FROM embeddings WHERE key IN ({})", list(records))
+            self.db.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)", records.values())
+            self.disk_bytes += sum(r[2] for r in records.values()) - sum(size for size, in replaced)
+            if self.disk_bytes > self.max_bytes:
+                self._evict()
+            self.db.commit()
+    
+    def _evict(self):
+        """Drop least recently read vectors until the database is at 90% of max_bytes"""
+        target = self.max_bytes * 0.9
+        while self.disk_bytes > target:
+            rows = self.db.execute("SELECT key, size FROM embeddings ORDER BY accessed LIMIT 1000").fetchall()
+            if not rows:
+                self.disk_bytes = 0
+                break
+            drop = []
+            for key, size in rows:
+                drop.append((key,))
+                self.disk_bytes -= size
+                if self.disk_bytes <= target:
+                    break
+            self.db.executemany("DELETE FROM embeddings WHERE key = ?", drop)
+            self.stats["evictions"] += len(drop)
+    
+    def status(self) -> dict:
+        with self.lock:
+            lookups = self.stats["memory_hits"] + self.stats["disk_hits"] + self.stats["misses"]
+            return {
+                **self.stats,
+                "hit_rate": (lookups - self.stats["misses"]) / lookups if lookups else 0.0,
+                "memory_entries": len(self.memory),
+                "disk_entries": self.db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0],
+                "disk_mb": self.disk_bytes / 2**20,
+                "max_mb": self.max_bytes / 2**20,
+            }
+
+_embedding_cache: Optional[EmbeddingCache] = None
+_embedding_cache_lock = threading.Lock()
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Process-wide embedding cache"""
+    global _embedding_cache
+    with _embedding_cache_lock:
+        if _embedding_cache is None:
+            path = CONFIG["embedding_cache_db"] or os.path.join(CONFIG["index_dir"], "embedding_cache.db")
+            args = (CONFIG["hf_model"], CONFIG["embedding_cache_memory"], CONFIG["embedding_cache_mb"] * 2**20)
+            try:
+                _embedding_cache = EmbeddingCache(path, *args)
+            except (OSError, sqlite3.Error) as e:
+                # Read-only or missing index dir: keep matching with a memory-only cache
+                print(f"Embedding cache unavailable ({e}), keeping it in memory only", file=sys.stderr)
+                _embedding_cache = EmbeddingCache(":memory:", *args)
+        return _embedding_cache
+
+# ============================================
+# EMBEDDING INDEX
+# ============================================
+
+class EmbeddingIndex:
+    """
+    Vacature embeddings persisted across calls, keyed by a hash of search_text().
+
+    embeddings.npy holds the normalized float32 vectors (memory-mapped on load),
+    index.json maps content hash -> row. Only new or changed vacatures get embedded.
+    """
+    
+    def __init__(self, directory: str, model: str):
+        self.directory = directory
+        self.model = model
+        self.matrix_path = os.path.join(directory, "embeddings.npy")
+        self.meta_path = os.path.join(directory, "index.json")
+        self.lock = threading.Lock()
+        self.matrix: Optional[np.ndarray] = None
+        self.rows: Dict[str, int] = {}
+        self._catalogue = None  # (hashes, matrix) of the last catalogue served
+        self._ann = None  # (matrix, ANN index) built for that catalogue
+        self._load()
+    
+    def _load(self):
+        try:
+            with open(self.meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("model") != self.model:
+                return
+            self.matrix = np.load(self.matrix_path, mmap_mode="r")
+            self.rows = {h: i for i, h in enumerate(meta["hashes"])}
+        except (OSError, ValueError, KeyError) as e:
+            if os.path.exists(self.meta_path):
+                print(f"Embedding index unreadable, rebuilding: {e}")
+            self.matrix, self.rows = None, {}
+    
+    def _save(self, hashes: List[str], matrix: np.ndarray):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = self.matrix_path + ".tmp.npy"
+        np.save(tmp, matrix)
+        os.replace(tmp, self.matrix_path)
+        with open(self.meta_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"model": self.model, "dim": int(matrix.shape[1]), "hashes": hashes}, f)
+        os.replace(self.meta_path + ".tmp", self.meta_path)
+        self.matrix = np.load(self.matrix_path, mmap_mode="r")
+        self.rows = {h: i for i, h in enumerate(hashes)}
+    
+    def vectors(self, vacatures: List[Vacature]) -> Optional[np.ndarray]:
+        """Normalized embedding matrix aligned with `vacatures`, or None if embedding failed"""
+        hashes = [v.content_hash for v in vacatures]
+        with self.lock:
+            if self._catalogue and self._catalogue[0] == hashes:
+                return self._catalogue[1]
+            
+            missing = list(dict.fromkeys(h for h in hashes if h not in self.rows))
+            if missing:
+                texts = {h: v.search_text() for h, v in zip(hashes, vacatures)}
+                embs = get_embeddings([texts[h] for h in missing])
+                if len(embs) < len(missing):
+                    return None
+                new = embedding_matrix(embs)
+                if catalogue_for(vacatures) is not None:
+                    # Full catalogue: rewrite with it only, so stale vacatures don't pile up
+                    keep = list(dict.fromkeys(h for h in hashes if h in self.rows))
+                else:
+                    # Filtered subset: append, keeping the rows of the rest of the catalogue
+                    keep = sorted(self.rows, key=self.rows.get)
+                parts = [self.matrix[[self.rows[h] for h in keep]]] if keep else []
+                self._save(keep + missing, np.concatenate(parts + [new]) if parts else new)
+            
+            matrix = np.ascontiguousarray(self.matrix[[self.rows[h] for h in hashes]])
+            self._catalogue = (hashes, matrix)
+            return matrix
+    
+    def ann_for(self, matrix: np.ndarray) -> Optional["AnnIndex"]:
+        """ANN index over `matrix` (built once per catalogue), or None when exact search is used"""
+        backend = CONFIG["ann_backend"]
+        if backend == "off" or len(matrix) < CONFIG["ann_min_vacatures"]:
+            return None
+        with self.lock:
+            if self._ann is None or self._ann[0] is not matrix:
+                self._ann = (matrix, build_ann(matrix, backend))
+            return self._ann[1]
+
+_index: Optional[EmbeddingIndex] = None
+
+def get_index() -> EmbeddingIndex:
+    """Process-wide embedding index"""
+    global _index
+    if _index is None:
+        _index = EmbeddingIndex(CONFIG["index_dir"], CONFIG["hf_model"])
+    return _index
+
+# ============================================
+# ANN INDEX
+# ============================================
+
+class AnnIndex(ABC):
+    """Approximate nearest neighbours over normalized vectors (inner product)"""
+    
+    @abstractmethod
+    def search(self, queries: np.ndarray, n: int) -> List[np.ndarray]:
+        """Per query: indices of (approximately) the n most similar rows"""
+
+class IVFIndex(AnnIndex):
+    """
+    Inverted-file index in plain NumPy: spherical k-means buckets,
+    a query only scans the members of its `nprobe` closest buckets.
+    """
+    
+    def __init__(self, matrix: np.ndarray, nprobe: int = 32, iterations: int = 10, seed: int = 0):
+        n = len(matrix)
+        nlist = max(1, int(np.sqrt(n)))
+        rng = np.random.default_rng(seed)
+        centroids = matrix[rng.choice(n, nlist, replace=False)].copy()
+        
+        for _ in range(iterations):
+            assign = self._assign(matrix, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, matrix)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            empty = norms[:, 0] == 0
+            centroids = np.where(empty[:, None], centroids, sums / np.where(norms == 0, 1, norms))
+        
+        assign = self._assign(matrix, centroids)
+        self.order = np.argsort(assign, kind="stable")
+        self.vectors = np.ascontiguousarray(matrix[self.order])
+        self.offsets = np.concatenate([[0], np.cumsum(np.bincount(assign, minlength=nlist))])
+        self.centroids = centroids.astype(np.float32)
+        self.nprobe = min(nprobe, nlist)
+    
+    @staticmethod
+    def _assign(matrix: np.ndarray, centroids: np.ndarray, chunk: int = 8192) -> np.ndarray:
+        return np.concatenate([np.argmax(matrix[i:i + chunk] @ centroids.T, axis=1)
+                               for i in range(0, len(matrix), chunk)])
+    
+    def search(self, queries: np.ndarray, n: int) -> List[np.ndarray]:
+        probes = np.argsort(-(queries @ self.centroids.T), axis=1)[:, :self.nprobe]
+        results = []
+        for q, buckets in zip(queries, probes):
+            members = np.concatenate([np.arange(self.offsets[b], self.offsets[b + 1]) for b in buckets])
+            best = top_indices(self.vectors[members] @ q, n)
+            results.append(self.order[members[best]])
+        return results
+
+class HNSWIndex(AnnIndex):
+    """hnswlib graph index (optional dependency)"""
+    
+    def __init__(self, matrix: np.ndarray, m: int = 16, ef_construction: int = 200):
+        import hnswlib
+        self.index = hnswlib.Index(space="ip", dim=matrix.shape[1])
+        self.index.init_index(max_elements=len(matrix), ef_construction=ef_construction, M=m)
+        self.index.add_items(matrix, np.arange(len(matrix)))
+        self.size = len(matrix)
+    
+    def search(self, queries: np.ndarray, n: int) -> List[np.ndarray]:
+        n = min(n, self.size)
+        self.index.set_ef(max(n, 50))
+        labels, _ = self.index.knn_query(queries, k=n)
+        return [row.astype(np.int64) for row in labels]
+
+def build_ann(matrix: np.ndarray, backend: str = "auto") -> AnnIndex:
+    if backend in ("auto", "hnsw"):
+        try:
+            return HNSWIndex(matrix)
+        except ImportError:
+            if backend == "hnsw":
+                print("hnswlib not installed, falling back to IVF index")
+    return IVFIndex(matrix, CONFIG["ivf_nprobe"])
+
+# ============================================
+# KANDIDATEN STORE
+# ============================================
+
+class KandidaatStore:
+    """
+    Persistent kandidaten with their embeddings (SQLite), for vacature -> kandidaten matching.
+
+    All vectors are mirrored in one in-memory matrix that grows by doubling, so
+    adding kandidaten never rebuilds the index. A kandidaat is keyed by email
+    (or name when there is none) and only re-embedded when its search text changes.
+    """
+    
+    def __init__(self, path: str, model: str):
+        self.model = model
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS kandidaten (
+                key TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                model TEXT,
+                embedding BLOB,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        self.db.commit()
+        self.lock = threading.Lock()
+        self.kandidaten: List[Kandidaat] = []
+        self.hashes: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.missing = set()  # rows without a vector for the current model
+        self.vectors = np.zeros((0, 0), dtype=np.float32)
+        
+        for key, data, text_hash, model_name, blob in self.db.execute(
+                "SELECT key, data, text_hash, model, embedding FROM kandidaten ORDER BY rowid"):
+            vec = np.frombuffer(blob, dtype=np.float32) if blob and model_name == model else None
+            self._put(key, Kandidaat(**json.loads(data)), text_hash, vec)
+    
+    @staticmethod
+    def key(k: Kandidaat) -> str:
+        return k.email.strip().lower() or f"naam:{k.volledige_naam.strip().lower()}"
+    
+    @staticmethod
+    def text_hash(k: Kandidaat) -> str:
+        return hashlib.sha1(k.search_text().encode("utf-8")).hexdigest()
+    
+    def __len__(self):
+        return len(self.kandidaten)
+    
+    def _put(self, key: str, k: Kandidaat, text_hash: str, vec: Optional[np.ndarray]):
+        row = self.rows.get(key)
+        if row is None:
+            row = self.rows[key] = len(self.kandidaten)
+            self.kandidaten.append(k)
+            self.hashes.append(text_hash)
+        else:
+            self.kandidaten[row], self.hashes[row] = k, text_hash
+        
+        if vec is None:
+            self.missing.add(row)
+            return
+        if self.vectors.shape[1] != len(vec):
+            # First vector, or the model's dimension changed: start a fresh buffer
+            self.missing.update(range(len(self.kandidaten)))
+            self.vectors = np.zeros((max(1024, row + 1), len(vec)), dtype=np.float32)
+        elif row >= len(self.vectors):
+            grown = np.zeros((max(row + 1, 2 * len(self.vectors)), self.vectors.shape[1]), dtype=np.float32)
+            grown[:len(self.vectors)] = self.vectors
+            self.vectors = grown
+        self.vectors[row] = vec
+        self.missing.discard(row)
+    
+    def _embed(self, items: List[tuple]) -> bool:
+        """Embed (key, kandidaat, hash) items and persist them; False if embedding failed"""
+        embs = get_embeddings([k.search_text() for _, k, _ in items])
+        ok = len(embs) == len(items)
+        vectors = embedding_matrix(embs) if ok else [None] * len(items)
+        now = datetime.now().isoformat()
+        records = []
+        for (key, k, text_hash), vec in zip(items, vectors):
+            self._put(key, k, text_hash, vec)
+            records.append((key, json.dumps(asdict(k), ensure_ascii=False), text_hash,
+                            self.model if vec is not None else None,
+                            vec.tobytes() if vec is not None else None, now))
+        self.db.executemany("INSERT OR REPLACE INTO kandidaten VALUES (?, ?, ?, ?, ?, ?)", records)
+        self.db.commit()
+        return ok
+    
+    def add(self, kandidaten: List[Kandidaat]) -> dict:
+        """Insert or update kandidaten; only new or changed profiles are embedded"""
+        stats = {"added": 0, "updated": 0, "unchanged": 0}
+        with self.lock:
+            items = {}
+            for k in kandidaten:
+                key, text_hash = self.key(k), self.text_hash(k)
+                row = self.rows.get(key)
+                if row is None:
+                    stats["added"] += key not in items
+                elif self.hashes[row] == text_hash and row not in self.missing and self.kandidaten[row] == k:
+                    stats["unchanged"] += 1
+                    continue
+                else:
+                    stats["updated"] += key not in items
+                items[key] = (key, k, text_hash)
+            if items:
+                stats["embedded"] = self._embed(list(items.values()))
+        return stats
+    
+    def matrix(self) -> Optional[np.ndarray]:
+        """Normalized vectors aligned with self.kandidaten, embedding any that are missing"""
+        with self.lock:
+            if self.missing:
+                keys = {row: key for key, row in self.rows.items()}
+                pending = [(keys[r], self.kandidaten[r], self.hashes[r]) for r in sorted(self.missing)]
+                if not self._embed(pending):
+                    return None
+            return self.vectors[:len(self.kandidaten)]
+
+_kandidaten: Optional[KandidaatStore] = None
+
+def get_kandidaten_store() -> KandidaatStore:
+    """Process-wide kandidaten store"""
+    global _kandidaten
+    if _kandidaten is None:
+        path = CONFIG["kandidaten_db"] or os.path.join(CONFIG["index_dir"], "kandidaten.db")
+        _kandidaten = KandidaatStore(path, CONFIG["hf_model"])
+    return _kandidaten
+
+# ============================================
+# MATCHING
+# ============================================
+
+def embedding_matrix(embs) -> np.ndarray:
+    """Stack embeddings into an L2-normalized float32 matrix (one row per text)"""
+    m = np.asarray(embs, dtype=np.float32)
+    if m.ndim == 1:
+        m = m[np.newaxis, :]
+    norms = np.linalg.norm(m, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return m / norms
+
+def ai_scores(queries: np.ndarray, vacature_matrix: np.ndarray) -> np.ndarray:
+    """Cosine similarity mapped to 0..1 for a vector (N,) or a matrix of queries (Q, N)"""
+    return (queries @ vacature_matrix.T + 1) / 2
+
+def top_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first"""
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    idx = np.argpartition(-scores, k - 1)[:k]
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+def keyword_bonus(kandidaat: Kandidaat, v: Vacature) -> float:
+    """Title/skill overlap bonus on top of the AI score (capped at 0.4)"""
+    kw = 0
+    if kandidaat.functie_lower in v.titel_lower:
+        kw += 0.3
+    kw += len(kandidaat.skill_set & v.skill_set) * 0.1
+    return min(kw, 0.4)
+
+def bonus_shortlist(ai: np.ndarray, top_k: Optional[int] = None) -> np.ndarray:
+    """Rows that can still reach the top-k once the keyword bonus is added"""
+    if not top_k or top_k >= len(ai):
+        return np.arange(len(ai))
+    # The bonus adds at most 0.4, so anything below the k-th AI-only score minus 0.4 can't make it
+    base = ai * 0.6
+    threshold = base[top_indices(base, top_k)[-1]]
+    return np.flatnonzero(base + 0.4 >= threshold)
+
+def rank_vacatures(kandidaat: Kandidaat, vacatures: List[Vacature], ai: np.ndarray,
+                   top_k: Optional[int] = None) -> List[Match]:
+    """Combine AI scores with the keyword bonus; only vacatures that can still reach the top-k get rescored"""
+    results = []
+    for i in bonus_shortlist(ai, top_k):
+        v = vacatures[i]
+        score = float(ai[i]) * 0.6 + keyword_bonus(kandidaat, v)
+        results.append(Match(v, min(score, 1.0), float(ai[i])))
+    
+    results.sort(key=lambda x: x.score, reverse=True)
+    return results[:top_k] if top_k else results
+
+def keyword_score(kandidaat: Kandidaat, v: Vacature) -> float:
+    """Score without embeddings: title hit plus share of the vacature's skills covered"""
+    score = 0
+    if kandidaat.functie_lower in v.titel_lower:
+        score += 0.5
+    if v.skill_set:
+        score += len(kandidaat.skill_set & v.skill_set) / len(v.skill_set) * 0.5
+    return score
+
+def keyword_match(kandidaat: Kandidaat, vacatures: List[Vacature], top_k: Optional[int] = None) -> List[Match]:
+    """Fallback matching without embeddings"""
+    catalogue = catalogue_for(vacatures)
+    rows = catalogue.keyword_rows(kandidaat) if catalogue else range(len(vacatures))
+    
+    results = []
+    for i in rows:
+        results.append(Match(vacatures[i], keyword_score(kandidaat, vacatures[i]), 0))
+    
+    results.sort(key=lambda x: x.score, reverse=True)
+    if catalogue and (not top_k or len(results) < top_k):
+        # Vacatures without any hit score 0 and follow in catalogue order
+        hits = set(rows.tolist())
+        for i, v in enumerate(vacatures):
+            if top_k and len(results) >= top_k:
+                break
+            if i not in hits:
+                results.append(Match(v, 0, 0))
+    return results[:top_k] if top_k else results
+
+def match_kandidaat_vacatures(kandidaat: Kandidaat, vacatures: List[Vacature],
+                              top_k: Optional[int] = None) -> List[Match]:
+    """AI-powered matching"""
+    return match_kandidaten_vacatures([kandidaat], vacatures, top_k)[0]
+
+def match_kandidaten_vacatures(kandidaten: List[Kandidaat], vacatures: List[Vacature],
+                               top_k: Optional[int] = None) -> List[List[Match]]:
+    """Match several kandidaten at once: one embedding call and one matrix product for all of them"""
+    if not vacatures:
+        return [[] for _ in kandidaten]
+    
+    # Vacatures come from the persistent index; only the kandidaten are embedded per call
+    embs = get_embeddings([k.search_text() for k in kandidaten])
+    vacature_matrix = get_index().vectors(vacatures) if len(embs) == len(kandidaten) else None
+    
+    if vacature_matrix is None:
         # Fallback: keyword matching
-        for v in vacatures:
-            score = 0
-            if kandidaat.gewenste_functie.lower() in v.titel.lower():
-                score += 0.5
-            skills_k = set(s.lower() for s in kandidaat.skills)
-            skills_v = set(s.lower() for s in v.skills)
-            if skills_v:
-                score += len(skills_k & skills_v) / len(skills_v) * 0.5
-            results.append(Match(v, score, 0))
+        return [keyword_match(k, vacatures, top_k) for k in kandidaten]
+    
+    queries = embedding_matrix(embs)
+    ann = get_index().ann_for(vacature_matrix) if top_k else None
+    if ann is None:
+        ai = ai_scores(queries, vacature_matrix)
+        return [rank_vacatures(k, vacatures, ai[row], top_k) for row, k in enumerate(kandidaten)]
+    
+    # Large catalogue: only the ANN shortlist gets exact scores and the keyword rescore
+    pools = ann.search(queries, max(CONFIG["ann_candidates"], top_k))
+    return [rank_vacatures(k, [vacatures[i] for i in pool], ai_scores(queries[row], vacature_matrix[pool]), top_k)
+            for row, (k, pool) in enumerate(zip(kandidaten, pools))]
+
+def match_vacature_kandidaten_scores(v: Vacature, top_k: int = 20) -> List[KandidaatMatch]:
+    """Reverse matching: best stored kandidaten for one catalogue vacature"""
+    store = get_kandidaten_store()
+    if not len(store):
+        return []
+    
+    catalogue = load_catalogue()
+    row = catalogue.rows.get(v.id)
+    vacature_matrix = get_index().vectors(catalogue.vacatures) if row is not None else None
+    kandidaat_matrix = store.matrix() if vacature_matrix is not None else None
+    kandidaten = store.kandidaten
+    
+    results = []
+    if kandidaat_matrix is None:
+        # Fallback: keyword matching
+        for k in kandidaten:
+            results.append(KandidaatMatch(k, keyword_score(k, v), 0))
+    else:
+        ai = ai_scores(vacature_matrix[row], kandidaat_matrix)
+        for i in bonus_shortlist(ai, top_k):
+            k = kandidaten[i]
+            score = float(ai[i]) * 0.6 + keyword_bonus(k, v)
+            results.append(KandidaatMatch(k, min(score, 1.0), float(ai[i])))
     
     results.sort(key=lambda x: x.score, reverse=True)
-    return results
+    return results[:top_k]
 
-def generate_excel(kandidaat: Kandidaat, matches: List[Match]) -> str:
-    """Generate Excel report"""
+def leading_int(value) -> int:
+    """Whole number at the start of a spreadsheet value ("5 jaar" -> 5, "3,5" -> 3), else 0"""
+    if isinstance(value, (int, float)):
+        return int(value) if value == value else 0
+    match = re.match(r"\s*(\d+)", str(value or ""))
+    return int(match.group(1)) if match else 0
+
+def parse_kandidaat(row: dict) -> Kandidaat:
+    """Kandidaat from a CSV/JSONL record (skills as list or comma-separated string)"""
+    skills = row.get("skills") or []
+    if isinstance(skills, str):
+        skills = [s.strip() for s in skills.split(",") if s.strip()]
+    return Kandidaat(
+        voornaam=str(row.get("voornaam", "")).strip(),
+        achternaam=str(row.get("achternaam", "")).strip(),
+        email=str(row.get("email", "")).strip(),
+        gewenste_functie=str(row.get("functie") or row.get("gewenste_functie") or "").strip(),
+        jaren_ervaring=leading_int(row.get("jaren_ervaring")),
+        skills=skills,
+        locatie=str(row.get("locatie", "")).strip(),
+    )
+
+def iter_kandidaten(path: str) -> Iterator[Kandidaat]:
+    """Stream kandidaten from a ;-separated CSV or a JSONL file"""
+    with open(path, encoding="utf-8") as f:
+        if path.lower().endswith((".jsonl", ".json")):
+            for line in f:
+                if line.strip():
+                    yield parse_kandidaat(json.loads(line))
+        else:
+            for row in csv.DictReader(f, delimiter=";"):
+                yield parse_kandidaat(row)
+
+def match_kandidaten_file(input_path: str, output_path: str, top_k: int = 10,
+                          batch_size: int = 256) -> dict:
+    """
+    Match every kandidaat in `input_path` and stream the top-k per kandidaat to
+    `output_path` (.jsonl, or .csv/.xlsx with one row per match). Kandidaten are
+    embedded and scored `batch_size` at a time.
+    """
+    vacatures = load_vacatures()
+    kandidaten = iter_kandidaten(input_path)
+    stats = {"kandidaten": 0, "matches": 0, "preview": []}
+    
+    def results():
+        while True:
+            batch = list(itertools.islice(kandidaten, batch_size))
+            if not batch:
+                break
+            for k, matches in zip(batch, match_kandidaten_vacatures(batch, vacatures, top_k)):
+                stats["kandidaten"] += 1
+                stats["matches"] += len(matches)
+                if len(stats["preview"]) < 5 and matches:
+                    stats["preview"].append((k, matches[0]))
+                yield k, matches
+    
+    def match_rows():
+        for k, matches in results():
+            for rank, m in enumerate(matches, 1):
+                yield [k.email, k.volledige_naam, rank, m.vacature.id, m.vacature.titel,
+                       m.vacature.bedrijf, round(m.score, 4), round(m.ai_score, 4)]
+    
+    headers = ["email", "naam", "rank", "vacature_id", "titel", "bedrijf", "score", "ai_score"]
+    suffix = output_path.lower().rsplit(".", 1)[-1]
+    
+    if suffix == "xlsx":
+        ReportWriter = report_writer()
+        if not ReportWriter:
+            raise ValueError("openpyxl niet geïnstalleerd, gebruik .jsonl of .csv")
+        with ReportWriter(output_path, header_color="1E3A5F") as report:
+            report.add_sheet("Matches", headers, match_rows(), zebra=True)
+        return stats
+    
+    with open(output_path, "w", encoding="utf-8", newline="") as out:
+        if suffix == "csv":
+            writer = csv.writer(out, delimiter=";")
+            writer.writerow(headers)
+            writer.writerows(match_rows())
+        else:
+            for k, matches in results():
+                out.write(json.dumps({
+                    "kandidaat": {"naam": k.volledige_naam, "email": k.email, "functie": k.gewenste_functie},
+                    "matches": [{"vacature_id": m.vacature.id, "titel": m.vacature.titel,
+                                 "bedrijf": m.vacature.bedrijf, "score": round(m.score, 4),
+                                 "ai_score": round(m.ai_score, 4)} for m in matches],
+                }, ensure_ascii=False) + "\n")
+    return stats
+
+# ============================================
+# REPORTS & EMAIL
+# ============================================
+
+def report_writer():
+    """Streaming ReportWriter (excel_report.py next to this file), or None without openpyxl"""
     try:
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, PatternFill
+        from excel_report import ReportWriter
     except ImportError:
+        return None
+    return ReportWriter
+
+def generate_excel(kandidaat: Kandidaat, matches: List[Match]) -> str:
+    """Generate Excel report"""
+    ReportWriter = report_writer()
+    if not ReportWriter:
         return ""
     
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Matches"
-    
     headers = ["#", "Score", "Vacature", "Bedrijf", "Locatie", "Contact", "Email"]
-    for c, h in enumerate(headers, 1):
-        cell = ws.cell(1, c, h)
-        cell.fill = PatternFill("solid", fgColor="1E3A5F")
-        cell.font = Font(color="FFFFFF", bold=True)
-    
-    for i, m in enumerate(matches[:10], 1):
-        ws.cell(i+1, 1, i)
-        ws.cell(i+1, 2, f"{int(m.score*100)}%")
-        ws.cell(i+1, 3, m.vacature.titel)
-        ws.cell(i+1, 4, m.vacature.bedrijf)
-        ws.cell(i+1, 5, m.vacature.locatie)
-        ws.cell(i+1, 6, m.vacature.contact_naam)
-        ws.cell(i+1, 7, m.vacature.contact_email)
+    rows = ([i, f"{int(m.score*100)}%", m.vacature.titel, m.vacature.bedrijf, m.vacature.locatie,
+             m.vacature.contact_naam, m.vacature.contact_email] for i, m in enumerate(matches[:10], 1))
     
     path = f"/tmp/Matches_{kandidaat.achternaam}_{datetime.now():%Y%m%d_%H%M%S}.xlsx"
-    wb.save(path)
+    with ReportWriter(path, header_color="1E3A5F") as report:
+        report.add_sheet("Matches", headers, rows)
     return path
 
-def send_match_email(kandidaat: Kandidaat, matches: List[Match], excel_path: str = None) -> dict:
-    """Send email with matches"""
-    key = CONFIG["resend_api_key"]
-    if not key:
-        return {"success": False, "error": "No RESEND_API_KEY"}
-    
-    if not kandidaat.email:
-        return {"success": False, "error": "No email address"}
-    
+def build_match_email(kandidaat: Kandidaat, matches: List[Match], excel_path: str = None) -> dict:
+    """Resend payload for a match email; the Excel attachment is read and encoded once here"""
     # Build HTML
     rows = ""
     for i, m in enumerate(matches[:5], 1):
@@ -294,19 +1237,209 @@ def send_match_email(kandidaat: Kandidaat, matches: List[Match], excel_path: str
                 "filename": os.path.basename(excel_path),
                 "content": base64.b64encode(f.read()).decode()
             }]
+    return data
+
+def send_match_email(kandidaat: Kandidaat, matches: List[Match], excel_path: str = None) -> dict:
+    """Queue email with matches (sent in the background by the email queue)"""
+    key = CONFIG["resend_api_key"]
+    if not key:
+        return {"success": False, "error": "No RESEND_API_KEY"}
     
-    req = urllib.request.Request(
-        "https://api.resend.com/emails",
-        json.dumps(data).encode(),
-        {"Authorization": f"Bearer {key}", "Content-Type": "application/json"}
-    )
+    if not kandidaat.email:
+        return {"success": False, "error": "No email address"}
     
-    try:
+    email_id = get_email_queue().enqueue(build_match_email(kandidaat, matches, excel_path))
+    return {"success": True, "queued": email_id, "to": kandidaat.email}
+
+# ============================================
+# EMAIL QUEUE
+# ============================================
+
+class EmailQueue:
+    """
+    SQLite outbox for Resend with a background sender.
+
+    Mails without attachments go out through /emails/batch (up to 100 per
+    request); mails with attachments, which the batch endpoint doesn't accept,
+    through /emails. Up to `concurrency` requests run at once. 429/5xx/network
+    errors are retried with full-jitter backoff (Retry-After honoured); other
+    4xx responses fail the mail. Each request carries an Idempotency-Key that is
+    stored with its mails when they are grouped, and a retry resends the same
+    group under the same key, so a retry after a timeout can't deliver it twice.
+    """
+    
+    BATCH_LIMIT = 100
+    linger = 0.25  # seconds
+    
+    def __init__(self, path: str, concurrency: int = 4, max_attempts: int = 5):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt REAL NOT NULL DEFAULT 0,
+                resend_id TEXT,
+                error TEXT,
+                created_at TEXT NOT NULL,
+                sent_at TEXT,
+                batch_key TEXT
+            )
+        """)
+        if "batch_key" not in [c[1] for c in self.db.execute("PRAGMA table_info(outbox)")]:
+            self.db.execute("ALTER TABLE outbox ADD COLUMN batch_key TEXT")
+        # Mails that were in flight when the process stopped go out again
+        self.db.execute("UPDATE outbox SET status = 'pending' WHERE status = 'sending'")
+        self.db.commit()
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.worker: Optional[threading.Thread] = None
+    
+    def enqueue(self, payload: dict) -> int:
+        with self.lock:
+            cur = self.db.execute("INSERT INTO outbox (payload, created_at) VALUES (?, ?)",
+                                  (json.dumps(payload, ensure_ascii=False), datetime.now().isoformat()))
+            self.db.commit()
+        self.start()
+        self.wakeup.set()
+        return cur.lastrowid
+    
+    def status(self, email_id: int = 0) -> dict:
+        with self.lock:
+            if email_id:
+                row = self.db.execute(
+                    "SELECT id, status, attempts, resend_id, error, created_at, sent_at, payload FROM outbox WHERE id = ?",
+                    (email_id,)).fetchone()
+                if not row:
+                    return {}
+                return {"id": row[0], "status": row[1], "attempts": row[2], "resend_id": row[3], "error": row[4],
+                        "created_at": row[5], "sent_at": row[6], "to": json.loads(row[7]).get("to")}
+            return dict(self.db.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall())
+    
+    def start(self):
+        with self.lock:
+            if self.worker is None or not self.worker.is_alive():
+                self.worker = threading.Thread(target=self._run, daemon=True)
+                self.worker.start()
+    
+    # ----- worker -----
+    
+    def _claim(self) -> List[Tuple[str, List[tuple]]]:
+        """Due mails as (idempotency key, group); a group keeps its key and members across retries"""
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT id, payload, attempts, batch_key FROM outbox WHERE status = 'pending' AND next_attempt <= ? "
+                "ORDER BY id LIMIT ?", (time.time(), self.BATCH_LIMIT * self.concurrency)).fetchall()
+            # The LIMIT may cut a retried group short: claim the rest of it too
+            keys = {r[3] for r in rows if r[3]}
+            if keys:
+                seen = {r[0] for r in rows}
+                rows += [r for r in self.db.execute(
+                    f"SELECT id, payload, attempts, batch_key FROM outbox WHERE status = 'pending' "
+                    f"AND batch_key IN ({','.join('?' * len(keys))}) ORDER BY id", list(keys)) if r[0] not in seen]
+            
+            groups: Dict[str, List[tuple]] = {}
+            for email_id, payload, attempts, key in rows:
+                if key:
+                    groups.setdefault(key, []).append((email_id, json.loads(payload), attempts))
+            fresh = [(r[0], json.loads(r[1]), r[2]) for r in rows if not r[3]]
+            plain = [c for c in fresh if not c[1].get("attachments")]
+            new_groups = [plain[i:i + self.BATCH_LIMIT] for i in range(0, len(plain), self.BATCH_LIMIT)]
+            new_groups += [[c] for c in fresh if c[1].get("attachments")]
+            for group in new_groups:
+                # Random, not derived from row ids: those restart when outbox.db is recreated
+                key = f"outbox-{uuid.uuid4()}"
+                groups[key] = group
+            
+            self.db.executemany("UPDATE outbox SET status = 'sending', batch_key = ? WHERE id = ?",
+                                [(key, c[0]) for key, group in groups.items() for c in group])
+            self.db.commit()
+        return list(groups.items())
+    
+    def _next_due(self) -> Optional[float]:
+        with self.lock:
+            row = self.db.execute("SELECT MIN(next_attempt) FROM outbox WHERE status = 'pending'").fetchone()
+        return row[0]
+    
+    def _run(self):
+        with ThreadPoolExecutor(self.concurrency) as pool:
+            while True:
+                # Cleared before looking, so an enqueue from now on wakes the wait below
+                self.wakeup.clear()
+                groups = self._claim()
+                if groups:
+                    list(pool.map(self._send_group, groups))
+                
+                due = self._next_due()
+                if self.wakeup.wait(None if due is None else max(0.0, due - time.time())):
+                    time.sleep(self.linger)  # let a burst of enqueues collect into one batch
+    
+    def _send_group(self, claimed: Tuple[str, List[tuple]]):
+        key, group = claimed
+        try:
+            if len(group) == 1:
+                res = self._post("/emails", group[0][1], key)
+                ids = [res.get("id")]
+            else:
+                res = self._post("/emails/batch", [payload for _, payload, _ in group], key)
+                ids = [item.get("id") for item in res.get("data", [])] or [None] * len(group)
+            
+            now = datetime.now().isoformat()
+            with self.lock:
+                self.db.executemany("UPDATE outbox SET status = 'sent', resend_id = ?, sent_at = ?, error = NULL, "
+                                    "attempts = attempts + 1 WHERE id = ?",
+                                    [(resend_id, now, email_id) for (email_id, _, _), resend_id in zip(group, ids)])
+                self.db.commit()
+        except urllib.error.HTTPError as e:
+            retryable = e.code == 429 or e.code >= 500
+            retry_after = e.headers.get("Retry-After") if e.headers else None
+            self._failed(group, f"HTTP {e.code}: {e.read()[:200].decode(errors='replace')}", retryable, retry_after)
+        except Exception as e:
+            # Network errors, bad responses, sqlite hiccups: retry rather than kill the sender thread
+            self._failed(group, f"{type(e).__name__}: {e}", True, None)
+    
+    def _post(self, path: str, body, idempotency_key: str) -> dict:
+        req = urllib.request.Request(
+            CONFIG["resend_api_url"] + path,
+            json.dumps(body).encode(),
+            {"Authorization": f"Bearer {CONFIG['resend_api_key']}", "Content-Type": "application/json",
+             "Idempotency-Key": idempotency_key}
+        )
         with urllib.request.urlopen(req, timeout=30) as r:
-            res = json.loads(r.read())
-            return {"success": True, "id": res.get("id"), "to": kandidaat.email}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+            return json.loads(r.read() or b"{}")
+    
+    def _failed(self, group: List[tuple], error: str, retryable: bool, retry_after: Optional[str]):
+        # Members of a group were always sent together: one attempt count and one retry time
+        attempts = max(c[2] for c in group) + 1
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = random.uniform(0, min(300, 2 * 2 ** attempts))
+        if retryable and attempts < self.max_attempts:
+            updates = [("pending", attempts, time.time() + delay, error, email_id) for email_id, _, _ in group]
+        else:
+            updates = [("failed", attempts, 0, error, email_id) for email_id, _, _ in group]
+        with self.lock:
+            self.db.executemany("UPDATE outbox SET status = ?, attempts = ?, next_attempt = ?, error = ? WHERE id = ?",
+                                updates)
+            self.db.commit()
+        # stdout carries the MCP protocol; the error itself is on the rows for email_status
+        print(f"Email send failed ({len(group)} mail(s)): {error}", file=sys.stderr)
+
+_email_queue: Optional[EmailQueue] = None
+
+def get_email_queue() -> EmailQueue:
+    """Process-wide outbox; its sender thread resumes any mail left pending by a previous run"""
+    global _email_queue
+    if _email_queue is None:
+        path = CONFIG["email_queue_db"] or os.path.join(CONFIG["index_dir"], "outbox.db")
+        _email_queue = EmailQueue(path, CONFIG["email_concurrency"], CONFIG["email_max_attempts"])
+        _email_queue.start()
+    return _email_queue
 
 # ============================================
 # MCP SERVER
@@ -344,8 +1477,7 @@ def zoek_vacatures(
     )
     
     vacatures = load_vacatures()
-    matches = match_kandidaat_vacatures(kandidaat, vacatures)
-    top = matches[:max_results]
+    top = match_kandidaat_vacatures(kandidaat, vacatures, max_results)
     
     result = f"🎯 **{len(top)} vacatures gevonden voor '{functie}'**\n\n"
     
@@ -400,8 +1532,7 @@ def match_kandidaat(
     )
     
     vacatures = load_vacatures()
-    matches = match_kandidaat_vacatures(kandidaat, vacatures)
-    top = matches[:10]
+    top = match_kandidaat_vacatures(kandidaat, vacatures, 10)
     
     # Generate Excel
     excel_path = generate_excel(kandidaat, top)
@@ -428,6 +1559,47 @@ def match_kandidaat(
     
     return result
 
+@mcp.tool()
+def match_kandidaten_batch(
+    input_path: str,
+    output_path: str = "",
+    top_k: int = 10,
+    batch_size: int = 256
+) -> str:
+    """
+    Match een hele lijst kandidaten in één keer tegen alle vacatures.
+    
+    Args:
+        input_path: CSV (;-gescheiden) of JSONL met kandidaten
+                    (voornaam, achternaam, email, functie, skills, locatie, jaren_ervaring)
+        output_path: Resultaatbestand, .jsonl, .csv of .xlsx (default: /tmp/Matches_batch_<tijd>.jsonl)
+        top_k: Aantal vacatures per kandidaat (default 10)
+        batch_size: Kandidaten per embedding/scoring batch (default 256)
+    
+    Returns:
+        Samenvatting met pad naar het resultaatbestand
+    """
+    if not os.path.exists(input_path):
+        return f"❌ Bestand niet gevonden: {input_path}"
+    
+    output_path = output_path or f"/tmp/Matches_batch_{datetime.now():%Y%m%d_%H%M%S}.jsonl"
+    started = time.monotonic()
+    try:
+        stats = match_kandidaten_file(input_path, output_path, max(1, top_k), max(1, batch_size))
+    except (ValueError, KeyError, json.JSONDecodeError) as e:
+        return f"❌ **Batch matching mislukt**\n\nFout: {e}"
+    elapsed = time.monotonic() - started
+    
+    result = f"🎯 **{stats['kandidaten']} kandidaten gematcht** in {elapsed:.1f}s\n\n"
+    result += f"📄 Resultaten: {output_path}\n"
+    result += f"🔢 {stats['matches']} matches (top {top_k} per kandidaat)\n\n"
+    for k, m in stats["preview"]:
+        result += f"• {k.volledige_naam} → **{m.vacature.titel}** @ {m.vacature.bedrijf} ({int(m.score*100)}%)\n"
+    if stats["kandidaten"] > len(stats["preview"]):
+        result += f"\n... en {stats['kandidaten'] - len(stats['preview'])} meer in het resultaatbestand\n"
+    
+    return result
+
 @mcp.tool()
 def stuur_matching_email(
     voornaam: str,
@@ -463,32 +1635,181 @@ def stuur_matching_email(
     )
     
     vacatures = load_vacatures()
-    matches = match_kandidaat_vacatures(kandidaat, vacatures)
-    top = matches[:10]
+    top = match_kandidaat_vacatures(kandidaat, vacatures, 10)
     
     # Generate Excel
     excel_path = generate_excel(kandidaat, top)
     
-    # Send email
+    # Queue email; the background sender delivers it
     result = send_match_email(kandidaat, top, excel_path)
     
     if result["success"]:
-        return f"""✅ **Email verzonden!**
+        top3 = "\n".join(f"{i}. {m.vacature.titel} @ {m.vacature.bedrijf} ({int(m.score*100)}%)"
+                         for i, m in enumerate(top[:3], 1))
+        return f"""📬 **Email in de wachtrij!**
 
 📧 Naar: {email}
 👤 Kandidaat: {kandidaat.volledige_naam}
 🎯 Matches: {len(top)} vacatures
-📊 Excel bijlage: ✓
+📊 Excel bijlage: {'✓' if excel_path else '✗'}
 
 Top 3 matches in email:
-1. {top[0].vacature.titel} @ {top[0].vacature.bedrijf} ({int(top[0].score*100)}%)
-2. {top[1].vacature.titel} @ {top[1].vacature.bedrijf} ({int(top[1].score*100)}%)
-3. {top[2].vacature.titel} @ {top[2].vacature.bedrijf} ({int(top[2].score*100)}%)
+{top3}
 
-Email ID: {result.get('id', 'N/A')}"""
+Wachtrij ID: {result['queued']} (status via `email_status`)"""
     else:
         return f"❌ **Email verzenden mislukt**\n\nFout: {result.get('error', 'Onbekend')}"
 
+@mcp.tool()
+def kandidaat_opslaan(
+    voornaam: str,
+    achternaam: str,
+    email: str,
+    functie: str,
+    skills: str = "",
+    locatie: str = "",
+    jaren_ervaring: int = 0
+) -> str:
+    """
+    Sla een kandidaat op in de kandidatenpool (voor match_vacature_kandidaten).
+    
+    Args:
+        voornaam: Voornaam van de kandidaat
+        achternaam: Achternaam van de kandidaat
+        email: Email adres (uniek per kandidaat)
+        functie: Gewenste functie
+        skills: Komma-gescheiden skills
+        locatie: Gewenste locatie
+        jaren_ervaring: Jaren werkervaring
+    
+    Returns:
+        Bevestiging
+    """
+    kandidaat = parse_kandidaat({
+        "voornaam": voornaam, "achternaam": achternaam, "email": email, "functie": functie,
+        "skills": skills, "locatie": locatie, "jaren_ervaring": jaren_ervaring,
+    })
+    stats = get_kandidaten_store().add([kandidaat])
+    status = "toegevoegd" if stats["added"] else "bijgewerkt" if stats["updated"] else "ongewijzigd"
+    return f"✅ {kandidaat.volledige_naam} {status} ({len(get_kandidaten_store())} kandidaten in pool)"
+
+@mcp.tool()
+def kandidaten_importeren(input_path: str, batch_size: int = 256) -> str:
+    """
+    Importeer kandidaten uit een CSV (;-gescheiden) of JSONL bestand in de kandidatenpool.
+    Bestaande kandidaten (zelfde email) worden bijgewerkt; alleen gewijzigde profielen worden opnieuw ge-embed.
+    
+    Args:
+        input_path: Pad naar CSV/JSONL (voornaam, achternaam, email, functie, skills, locatie, jaren_ervaring)
+        batch_size: Kandidaten per embedding batch (default 256)
+    
+    Returns:
+        Aantal toegevoegde/bijgewerkte kandidaten
+    """
+    if not os.path.exists(input_path):
+        return f"❌ Bestand niet gevonden: {input_path}"
+    
+    store = get_kandidaten_store()
+    totals = {"added": 0, "updated": 0, "unchanged": 0}
+    kandidaten = iter_kandidaten(input_path)
+    try:
+        while True:
+            batch = list(itertools.islice(kandidaten, max(1, batch_size)))
+            if not batch:
+                break
+            stats = store.add(batch)
+            for key in totals:
+                totals[key] += stats[key]
+    except (ValueError, KeyError, json.JSONDecodeError) as e:
+        return f"❌ **Import mislukt**\n\nFout: {e}"
+    
+    return f"""✅ **Kandidatenpool bijgewerkt**
+
+➕ Toegevoegd: {totals['added']}
+🔄 Bijgewerkt: {totals['updated']}
+⏸️ Ongewijzigd: {totals['unchanged']}
+👥 Totaal in pool: {len(store)}"""
+
+@mcp.tool()
+def match_vacature_kandidaten(vacature_id: str, top_k: int = 20) -> str:
+    """
+    Vind de beste kandidaten uit de kandidatenpool voor een vacature.
+    
+    Args:
+        vacature_id: ID van de vacature
+        top_k: Aantal kandidaten (default 20)
+    
+    Returns:
+        Ranglijst van kandidaten met scores
+    """
+    v = load_catalogue().by_id.get(vacature_id)
+    if not v:
+        return f"❌ Vacature met ID '{vacature_id}' niet gevonden."
+    
+    matches = match_vacature_kandidaten_scores(v, max(1, top_k))
+    if not matches:
+        return "❌ Geen kandidaten in de pool. Gebruik `kandidaat_opslaan` of `kandidaten_importeren`."
+    
+    result = f"👥 **Top {len(matches)} kandidaten voor {v.titel}** @ {v.bedrijf}\n\n"
+    for i, m in enumerate(matches, 1):
+        k = m.kandidaat
+        result += f"{i}. **{k.volledige_naam}** — **{int(m.score*100)}%**\n"
+        result += f"   💼 {k.gewenste_functie} | 📍 {k.locatie} | {k.jaren_ervaring} jaar\n"
+        if k.email:
+            result += f"   📧 {k.email}\n"
+    
+    return result
+
+@mcp.tool()
+def email_status(email_id: int = 0) -> str:
+    """
+    Status van verstuurde/wachtende emails.
+    
+    Args:
+        email_id: Wachtrij ID uit stuur_matching_email (leeg = overzicht van de wachtrij)
+    
+    Returns:
+        Status van de email of van de hele wachtrij
+    """
+    queue = get_email_queue()
+    if not email_id:
+        counts = queue.status()
+        if not counts:
+            return "📭 Geen emails in de wachtrij."
+        icons = {"pending": "⏳", "sending": "📤", "sent": "✅", "failed": "❌"}
+        return "📬 **Email wachtrij**\n\n" + "\n".join(
+            f"{icons.get(status, '•')} {status}: {count}" for status, count in sorted(counts.items()))
+    
+    info = queue.status(email_id)
+    if not info:
+        return f"❌ Email met ID {email_id} niet gevonden."
+    result = f"📧 **Email {info['id']}** naar {', '.join(info['to'] or [])}\n\n"
+    result += f"Status: {info['status']} (pogingen: {info['attempts']})\n"
+    result += f"Aangemaakt: {info['created_at']}\n"
+    if info["sent_at"]:
+        result += f"Verzonden: {info['sent_at']} (Resend ID: {info['resend_id'] or 'N/A'})\n"
+    if info["error"] and info["status"] != "sent":
+        result += f"Laatste fout: {info['error']}\n"
+    return result
+
+@mcp.tool()
+def cache_status() -> str:
+    """
+    Hit/miss statistieken van de embedding cache (geheugen + schijf).
+    
+    Returns:
+        Aantal hits per laag, misses, evictions en de grootte van de cache
+    """
+    info = get_embedding_cache().status()
+    result = "🗄️ **Embedding cache**\n\n"
+    result += f"Hit rate: {info['hit_rate']:.0%}\n"
+    result += f"⚡ Geheugen hits: {info['memory_hits']} ({info['memory_entries']} vectoren in geheugen)\n"
+    result += f"💾 Schijf hits: {info['disk_hits']} ({info['disk_entries']} vectoren, "
+    result += f"{info['disk_mb']:.1f}/{info['max_mb']:.0f} MB)\n"
+    result += f"🌐 Misses (berekend): {info['misses']}\n"
+    result += f"🧹 Evictions: {info['evictions']}\n"
+    return result
+
 @mcp.tool()
 def lijst_vacatures(
     locatie: str = "",
@@ -504,13 +1825,8 @@ def lijst_vacatures(
     Returns:
         Lijst van alle vacatures
     """
-    vacatures = load_vacatures()
-    
-    # Apply filters
-    if locatie:
-        vacatures = [v for v in vacatures if locatie.lower() in v.locatie.lower()]
-    if min_salaris > 0:
-        vacatures = [v for v in vacatures if v.salaris_min >= min_salaris]
+    catalogue = load_catalogue()
+    vacatures = [catalogue.vacatures[i] for i in catalogue.filter_rows(locatie, min_salaris)]
     
     result = f"📋 **{len(vacatures)} vacatures beschikbaar**\n\n"
     
@@ -532,11 +1848,9 @@ def vacature_details(vacature_id: str) -> str:
     Returns:
         Volledige vacature details
     """
-    vacatures = load_vacatures()
-    
-    for v in vacatures:
-        if v.id == vacature_id:
-            return f"""📋 **{v.titel}**
+    v = load_catalogue().by_id.get(vacature_id)
+    if v:
+        return f"""📋 **{v.titel}**
 
 🏢 **Bedrijf:** {v.bedrijf}
 📍 **Locatie:** {v.locatie}
@@ -564,9 +1878,12 @@ def get_config_status() -> str:
     """Server configuratie status"""
     return json.dumps({
         "hf_configured": bool(CONFIG["hf_token"]),
+        "embedding_backend": CONFIG["embedding_backend"],
         "resend_configured": bool(CONFIG["resend_api_key"]),
         "hf_model": CONFIG["hf_model"],
         "vacatures_path": CONFIG["vacatures_path"],
+        "index_dir": CONFIG["index_dir"],
+        "ann_backend": CONFIG["ann_backend"],
         "typeform_url": CONFIG["typeform_url"],
     }, indent=2)
 
@@ -577,6 +1894,7 @@ def get_config_status() -> str:
 if __name__ == "__main__":
     print("🚀 CV-Vacancy Matcher MCP Server")
     print("=" * 40)
+    print(f"Embeddings: {CONFIG['embedding_backend']} ({CONFIG['hf_model']})")
     print(f"HF Token: {'✓' if CONFIG['hf_token'] else '✗'}")
     print(f"Resend Key: {'✓' if CONFIG['resend_api_key'] else '✗'}")
     print(f"Vacatures: {CONFIG['vacatures_path']}")
@@ -584,10 +1902,19 @@ if __name__ == "__main__":
     print("Tools beschikbaar:")
     print("  • zoek_vacatures")
     print("  • match_kandidaat")
+    print("  • match_kandidaten_batch")
     print("  • stuur_matching_email")
+    print("  • email_status")
+    print("  • cache_status")
     print("  • lijst_vacatures")
     print("  • vacature_details")
+    print("  • kandidaat_opslaan")
+    print("  • kandidaten_importeren")
+    print("  • match_vacature_kandidaten")
     print()
     print("Start met: fastmcp dev server.py")
     
+    if CONFIG["resend_api_key"]:
+        get_email_queue()  # resume mail left in the outbox
+    
     mcp.run()
@@ -14,7 +14,6 @@ import random
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 import time
-import pandas as pd
 from pathlib import Path
 import logging
 
@@ -347,40 +346,14 @@ class EnhancedJobEnricher:
         logger.info(f"CSV report saved: {output_file}")
 
     def _save_excel_report(self, jobs, output_file):
-        """Save enriched data to Excel with formatting"""
+        """Save enriched data to Excel with formatting (streamed, see excel_report.py)"""
         try:
-            # Create DataFrame
-            df = pd.DataFrame(jobs)
-
-            # Create Excel writer with formatting
-            with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Vacatures', index=False)
-
-                # Get workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Vacatures']
-
-                # Add some basic formatting
-                from openpyxl.styles import Font, PatternFill, Alignment
-
-                # Header formatting
-                header_font = Font(bold=True, color='FFFFFF')
-                header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-
-                for cell in worksheet[1]:  # First row
-                    cell.font = header_font
-                    cell.fill = header_fill
-                    cell.alignment = Alignment(horizontal='center')
-
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+            from excel_report import ReportWriter
+
+            # Same column order as a DataFrame built from the dicts
+            columns = list(dict.fromkeys(key for job in jobs for key in job))
+            with ReportWriter(output_file) as report:
+                report.add_sheet('Vacatures', columns, ([job.get(c) for c in columns] for job in jobs))
 
             logger.info(f"Excel report saved: {output_file}")
         except ImportError:
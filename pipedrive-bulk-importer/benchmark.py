@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Pipedrive Bulk Importer Benchmark
+Runs do_import and import_from_csv against fake_pipedrive.py and reports
+rows/sec, p50/p99 request latency and API calls per row.
+
+    python3 benchmark.py --sizes 100 1000 10000
+    python3 benchmark.py --sizes 1000 --error-rate 0.02 --json after.json --baseline before.json
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+import statistics
+from typing import Dict, List, Optional
+
+from fake_pipedrive import FakePipedrive, start_fake_pipedrive
+
+# =============================================================================
+# DATA GENERATION
+# =============================================================================
+
+CSV_COLUMNS = ['bedrijfsnaam', 'deal_titel', 'functietitel', 'voornaam', 'achternaam',
+               'email', 'telefoon', 'functie_contact', 'stad']
+
+def generate_rows(count: int) -> List[Dict]:
+    """JobDigger-like rows: ~7 vacatures per employer, ~2 per contact"""
+    rows = []
+    for i in range(count):
+        org = i // 7
+        contact = i // 2
+        rows.append({
+            'bedrijfsnaam': f"Werkgever {org} B.V.",
+            'deal_titel': f"Werkgever {org} - Vacature {i}",
+            'functietitel': f"Vacature {i}",
+            'voornaam': 'Contact',
+            'achternaam': str(contact),
+            'email': f"contact{contact}@werkgever{org}.nl",
+            'telefoon': '0612345678',
+            'functie_contact': 'HR Manager',
+            'stad': 'Arnhem',
+        })
+    return rows
+
+def as_sheet(rows: List[Dict]) -> List[List[str]]:
+    """Rows in the Google Sheet column layout expected by validate_row/parse_sheet_row"""
+    header = ['id', 'deal_titel', 'bedrijfsnaam', 'functietitel', 'voornaam', 'achternaam', 'email',
+              'telefoon', 'functie_contact', 'website', 'stad', 'provincie', 'postcode']
+    data = [header]
+    for i, row in enumerate(rows, 1):
+        data.append([str(i), row['deal_titel'], row['bedrijfsnaam'], row['functietitel'], row['voornaam'],
+                     row['achternaam'], row['email'], row['telefoon'], row['functie_contact'], '',
+                     row['stad'], 'Gelderland', '6811AA'])
+    return data
+
+def write_csv(rows: List[Dict], path: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(';'.join(CSV_COLUMNS) + '\n')
+        for row in rows:
+            f.write(';'.join(row[c] for c in CSV_COLUMNS) + '\n')
+
+def seed_existing(state: FakePipedrive, rows: List[Dict], fraction: float):
+    """Make the first `fraction` of employers and contacts already exist in Pipedrive"""
+    orgs = list(dict.fromkeys(r['bedrijfsnaam'] for r in rows))
+    persons = list(dict.fromkeys((f"{r['voornaam']} {r['achternaam']}", r['email']) for r in rows))
+    state.seed(orgs[:int(len(orgs) * fraction)], persons[:int(len(persons) * fraction)])
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def percentile(values: List[float], pct: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100)[pct - 1]
+
+async def run_case(server, state: FakePipedrive, latencies: List[float], mode: str,
+                   size: int, args, workdir: str) -> Dict:
+    rows = generate_rows(size)
+    state.reset()
+    seed_existing(state, rows, args.existing)
+    latencies.clear()
+    # Every case starts with a cold entity cache
+    if os.path.exists(server.ENTITY_CACHE_PATH):
+        os.remove(server.ENTITY_CACHE_PATH)
+
+    start = time.perf_counter()
+    if mode == 'do_import':
+        sheet = as_sheet(rows)
+
+        async def fetch_sheet(spreadsheet_id, worksheet_name, max_rows=None):
+            return sheet
+
+        server.fetch_google_sheet_data = fetch_sheet
+        result = await server.do_import('benchmark', 'Voor_Pipedrive', None, True, False,
+                                        args.concurrency, prewarm=not args.no_prewarm)
+    else:
+        path = os.path.join(workdir, f'benchmark_{size}.csv')
+        write_csv(rows, path)
+        result = await server.import_from_csv(path, max_concurrency=args.concurrency,
+                                              prewarm=not args.no_prewarm)
+    elapsed = time.perf_counter() - start
+
+    api = server.import_progress[result.job_id].api
+    calls = sum(state.calls.values())
+    return {
+        'mode': mode,
+        'rows': size,
+        'seconds': round(elapsed, 2),
+        'rows_per_sec': round(size / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 1),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 1),
+        'api_calls': calls,
+        'calls_per_row': round(calls / size, 2),
+        'retries': api.get('retries', 0),
+        'throttled': api.get('throttled', 0),
+        'deals_created': result.deals_created,
+        'errors': len(result.errors),
+    }
+
+def print_table(results: List[Dict], baseline: Optional[Dict[str, Dict]]):
+    header = f"{'mode':<16}{'rows':>7}{'rows/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'calls/row':>11}{'retries':>9}{'429s':>7}{'errors':>8}"
+    if baseline:
+        header += f"{'vs base':>10}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        line = (f"{r['mode']:<16}{r['rows']:>7}{r['rows_per_sec']:>9}{r['p50_ms']:>9}{r['p99_ms']:>9}"
+                f"{r['calls_per_row']:>11}{r['retries']:>9}{r['throttled']:>7}{r['errors']:>8}")
+        if baseline:
+            base = baseline.get(f"{r['mode']}:{r['rows']}")
+            if base:
+                change = (r['rows_per_sec'] / base['rows_per_sec'] - 1) * 100
+                line += f"{change:>+9.1f}%"
+            else:
+                line += f"{'n/a':>10}"
+        print(line)
+
+async def main(args):
+    workdir = tempfile.mkdtemp(prefix='pipedrive-benchmark-')
+    state = FakePipedrive(args.latency, args.burst, args.window, args.error_rate)
+    httpd, base_url = start_fake_pipedrive(state)
+
+    # server.py reads its configuration at import time
+    os.environ.update({
+        'PIPEDRIVE_API_KEY': 'benchmark',
+        'PIPEDRIVE_BASE_URL': base_url,
+        'PIPEDRIVE_RATE_LIMIT_BURST': str(args.burst),
+        'PIPEDRIVE_RATE_LIMIT_WINDOW': str(args.window),
+        'PIPEDRIVE_CACHE_PATH': os.path.join(workdir, 'entity_cache.db'),
+        'PIPEDRIVE_JOURNAL_PATH': os.path.join(workdir, 'import_jobs.db'),
+    })
+    import server
+
+    # Time every HTTP round-trip the client makes
+    latencies: List[float] = []
+    send = server.PipedriveClient._send
+
+    def timed_send(self, *send_args):
+        start = time.perf_counter()
+        try:
+            return send(self, *send_args)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    server.PipedriveClient._send = timed_send
+
+    results = []
+    for mode in args.modes:
+        for size in args.sizes:
+            print(f"Running {mode} with {size} rows...", file=sys.stderr)
+            results.append(await run_case(server, state, latencies, mode, size, args, workdir))
+    httpd.shutdown()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = {f"{r['mode']}:{r['rows']}": r for r in json.load(f)['results']}
+    print_table(results, baseline)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'config': vars(args), 'results': results}, f, indent=2)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the bulk importer against a fake Pipedrive")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--modes', nargs='+', default=['do_import', 'import_from_csv'],
+                        choices=['do_import', 'import_from_csv'])
+    parser.add_argument('--latency', type=float, default=0.05, help="Mean fake request latency (seconds)")
+    parser.add_argument('--burst', type=int, default=80, help="Rate limit: requests per window")
+    parser.add_argument('--window', type=float, default=2.0, help="Rate limit window (seconds)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests failing with 503")
+    parser.add_argument('--existing', type=float, default=0.0,
+                        help="Fraction of orgs/persons that already exist in Pipedrive")
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--no-prewarm', action='store_true', help="Skip the entity cache pre-warm")
+    parser.add_argument('--json', help="Write results to this JSON file")
+    parser.add_argument('--baseline', help="Compare rows/sec against an earlier --json file")
+    asyncio.run(main(parser.parse_args()))
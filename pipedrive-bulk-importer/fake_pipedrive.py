@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Fake Pipedrive API for benchmarking the bulk importer locally
+Covers organizations/persons/deals search, list and create with configurable
+latency, rate limiting and error injection. Stdlib only.
+
+Standalone:
+    python3 fake_pipedrive.py --port 8765 --latency 0.05
+    PIPEDRIVE_BASE_URL=http://127.0.0.1:8765/v1 python3 server.py
+"""
+
+import json
+import random
+import threading
+import time
+import argparse
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+# =============================================================================
+# STATE
+# =============================================================================
+
+class FakePipedrive:
+    """In-memory Pipedrive data plus the knobs that shape its responses"""
+
+    def __init__(self, latency: float = 0.05, burst: int = 80, window: float = 2.0,
+                 error_rate: float = 0.0):
+        self.latency = latency
+        self.burst = burst
+        self.window = window
+        self.error_rate = error_rate
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.orgs: Dict[int, Dict] = {}
+            self.persons: Dict[int, Dict] = {}
+            self.deals: Dict[int, Dict] = {}
+            self.person_by_email: Dict[str, int] = {}
+            self.next_id = 1
+            self.tokens = float(self.burst)
+            self.refilled = time.monotonic()
+            self.calls: Counter = Counter()
+
+    def seed(self, org_names: List[str], persons: List[Tuple[str, str]]):
+        """Pre-populate existing orgs and (name, email) persons"""
+        for name in org_names:
+            self.create('organizations', {'name': name})
+        for name, email in persons:
+            self.create('persons', {'name': name, 'email': [email]})
+
+    def take_token(self) -> Tuple[bool, int, float]:
+        """Returns (allowed, remaining, seconds until a token is available)"""
+        with self.lock:
+            now = time.monotonic()
+            rate = self.burst / self.window
+            self.tokens = min(self.burst, self.tokens + (now - self.refilled) * rate)
+            self.refilled = now
+            if self.tokens < 1:
+                return False, 0, (1 - self.tokens) / rate
+            self.tokens -= 1
+            return True, int(self.tokens), 0.0
+
+    def create(self, kind: str, data: Dict) -> Dict:
+        with self.lock:
+            entity_id = self.next_id
+            self.next_id += 1
+            now = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')  # Pipedrive times are UTC
+            record = dict(data, id=entity_id, add_time=now, update_time=now)
+            if kind == 'organizations':
+                self.orgs[entity_id] = record
+            elif kind == 'persons':
+                record['email'] = [{'value': e, 'primary': i == 0} for i, e in enumerate(data.get('email') or [])]
+                self.persons[entity_id] = record
+                for email in data.get('email') or []:
+                    self.person_by_email[email.lower()] = entity_id
+            else:
+                self.deals[entity_id] = record
+            return record
+
+    def search_orgs(self, term: str) -> List[Dict]:
+        term = term.lower()
+        with self.lock:
+            return [{'id': o['id'], 'name': o['name']} for o in self.orgs.values() if term in o['name'].lower()]
+
+    def search_persons(self, term: str) -> List[Dict]:
+        with self.lock:
+            person_id = self.person_by_email.get(term.lower())
+            if not person_id:
+                return []
+            person = self.persons[person_id]
+            return [{'id': person_id, 'name': person['name'], 'emails': [e['value'] for e in person['email']]}]
+
+    def search_deals(self, term: str, org_id: Optional[int]) -> List[Dict]:
+        with self.lock:
+            return [{'id': d['id'], 'title': d['title'], 'organization': {'id': d.get('org_id')}}
+                    for d in self.deals.values()
+                    if d.get('title') == term and (org_id is None or d.get('org_id') == org_id)]
+
+    def list_page(self, kind: str, start: int, limit: int) -> Tuple[List[Dict], bool]:
+        with self.lock:
+            records = list((self.orgs if kind == 'organizations' else self.persons).values())
+        records.sort(key=lambda r: r['update_time'], reverse=True)
+        return records[start:start + limit], start + limit < len(records)
+
+# =============================================================================
+# HTTP HANDLER
+# =============================================================================
+
+def make_handler(state: FakePipedrive):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        def _reply(self, status: int, body: Dict, headers: Optional[Dict] = None):
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, str(value))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _handle(self, method: str):
+            url = urlparse(self.path)
+            query = {k: v[0] for k, v in parse_qs(url.query).items()}
+            endpoint = url.path.split('/v1/', 1)[-1].strip('/')
+            body = {}
+            if method == 'POST':
+                length = int(self.headers.get('Content-Length') or 0)
+                body = json.loads(self.rfile.read(length) or b'{}')
+            state.calls[f"{method} {endpoint}"] += 1
+
+            time.sleep(state.latency * random.uniform(0.5, 1.5))
+
+            allowed, remaining, wait = state.take_token()
+            headers = {
+                'x-ratelimit-limit': state.burst,
+                'x-ratelimit-remaining': remaining,
+                'x-ratelimit-reset': round(max(wait, state.window), 2),
+            }
+            if not allowed:
+                headers['Retry-After'] = round(wait, 2)
+                return self._reply(429, {'success': False, 'error': 'Rate limit exceeded'}, headers)
+            if state.error_rate and random.random() < state.error_rate:
+                return self._reply(503, {'success': False, 'error': 'Injected failure'}, headers)
+
+            if method == 'GET' and endpoint in ('organizations/search', 'persons/search'):
+                if not query.get('term'):
+                    return self._reply(400, {
+                        'success': False, 'error': "querystring must have required property 'term'"
+                    }, headers)
+                search = state.search_orgs if endpoint.startswith('organizations') else state.search_persons
+                items = [{'result_score': 1, 'item': item} for item in search(query['term'])]
+                return self._reply(200, {'success': True, 'data': {'items': items}}, headers)
+
+            if method == 'GET' and endpoint == 'deals/search':
+                org_id = int(query['organization_id']) if query.get('organization_id') else None
+                items = [{'result_score': 1, 'item': item} for item in state.search_deals(query.get('term', ''), org_id)]
+                return self._reply(200, {'success': True, 'data': {'items': items}}, headers)
+
+            if method == 'GET' and endpoint.startswith('deals/') and endpoint[6:].isdigit():
+                deal = state.deals.get(int(endpoint[6:]))
+                if not deal:
+                    return self._reply(404, {'success': False, 'error': 'Deal not found'}, headers)
+                return self._reply(200, {'success': True, 'data': deal}, headers)
+
+            if method == 'GET' and endpoint in ('organizations', 'persons'):
+                start = int(query.get('start', 0))
+                items, more = state.list_page(endpoint, start, int(query.get('limit', 100)))
+                return self._reply(200, {
+                    'success': True,
+                    'data': items,
+                    'additional_data': {'pagination': {
+                        'start': start, 'more_items_in_collection': more, 'next_start': start + len(items)
+                    }}
+                }, headers)
+
+            if method == 'POST' and endpoint in ('organizations', 'persons', 'deals'):
+                for ref, table in (('org_id', state.orgs), ('person_id', state.persons)):
+                    if body.get(ref) and body[ref] not in table:
+                        return self._reply(404, {'success': False, 'error': f'{ref} not found'}, headers)
+                record = state.create(endpoint, body)
+                return self._reply(201, {'success': True, 'data': {'id': record['id']}}, headers)
+
+            return self._reply(404, {'success': False, 'error': f'Unknown endpoint {method} {endpoint}'}, headers)
+
+        def do_GET(self):
+            self._handle('GET')
+
+        def do_POST(self):
+            self._handle('POST')
+
+    return Handler
+
+def start_fake_pipedrive(state: FakePipedrive, port: int = 0) -> Tuple[ThreadingHTTPServer, str]:
+    """Serve `state` on a background thread; returns (server, base_url)"""
+    httpd = ThreadingHTTPServer(('127.0.0.1', port), make_handler(state))
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd, f"http://127.0.0.1:{httpd.server_address[1]}/v1"
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake Pipedrive API for local benchmarks")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.05, help="Mean seconds per request")
+    parser.add_argument('--burst', type=int, default=80, help="Requests allowed per window")
+    parser.add_argument('--window', type=float, default=2.0, help="Rate limit window (seconds)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests answered with 503")
+    args = parser.parse_args()
+
+    state = FakePipedrive(args.latency, args.burst, args.window, args.error_rate)
+    httpd, base_url = start_fake_pipedrive(state, args.port)
+    print(f"Fake Pipedrive listening on {base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        httpd.shutdown()
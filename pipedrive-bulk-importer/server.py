@@ -11,10 +11,17 @@ import time
 import uuid
 import asyncio
 import csv
-from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
+import sqlite3
+import functools
+import random
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Tuple, Iterator, Iterable, Callable, Deque
+from dataclasses import dataclass, asdict, field
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from urllib3.exceptions import NewConnectionError
 
 # MCP SDK
 try:
@@ -31,7 +38,7 @@ except ImportError:
 # =============================================================================
 
 PIPEDRIVE_API_KEY = os.getenv('PIPEDRIVE_API_KEY')
-PIPEDRIVE_BASE_URL = 'https://api.pipedrive.com/v1'
+PIPEDRIVE_BASE_URL = os.getenv('PIPEDRIVE_BASE_URL', 'https://api.pipedrive.com/v1')
 
 DEFAULT_PIPELINE_ID = 14  # Corporate Recruiter Outreach
 DEFAULT_STAGE_ID = 95     # lead
@@ -60,11 +67,49 @@ CUSTOM_FIELDS = {
     # 'via_bemiddelaar': 'custom_field_id_here',  # Kolom Q
 }
 
-RATE_LIMIT_DELAY = 0.2
+# Pipedrive rate limits: burst of requests per rolling window (per API token)
+RATE_LIMIT_BURST = int(os.getenv('PIPEDRIVE_RATE_LIMIT_BURST', '80'))
+RATE_LIMIT_WINDOW = float(os.getenv('PIPEDRIVE_RATE_LIMIT_WINDOW', '2.0'))
+MAX_CONCURRENT_REQUESTS = int(os.getenv('PIPEDRIVE_MAX_CONCURRENCY', '10'))
+STREAM_QUEUE_SIZE = 500  # Rows buffered between CSV import pipeline stages
+REQUEST_TIMEOUT = 30
+ESTIMATED_REQUEST_LATENCY = 0.35  # seconds per Pipedrive call, used by the import planner
 
-# In-memory job storage (in production: use Redis/DB)
+# Retries for 429 / transient 5xx: Retry-After when given, else jittered exponential backoff
+MAX_RETRIES = 6                # per request
+RETRY_BUDGET = int(os.getenv('PIPEDRIVE_RETRY_BUDGET', '500'))  # per import
+BACKOFF_BASE = 0.5             # seconds
+BACKOFF_MAX = 30.0             # seconds
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# POST/PUT may already have been applied on a 500/502/504, so only retry when the
+# request is known not to have been processed; other failures search before re-posting
+RETRYABLE_STATUS_WRITE = {429, 503}
+AMBIGUOUS_STATUS_WRITE = {500, 502, 504}
+CLOCK_SKEW = 30.0              # seconds allowed between our clock and Pipedrive's add_time
+MIN_RATE_FRACTION = 0.1        # throttling never drops below 10% of the configured rate
+
+# Local org/person id cache, pre-warmed from Pipedrive and reused between imports
+ENTITY_CACHE_PATH = os.getenv(
+    'PIPEDRIVE_CACHE_PATH',
+    os.path.join(os.path.expanduser('~'), '.pipedrive-bulk-importer', 'entity_cache.db')
+)
+ENTITY_CACHE_TTL = int(os.getenv('PIPEDRIVE_CACHE_TTL', str(30 * 24 * 3600)))  # seconds
+PREWARM_PAGE_SIZE = 500  # Pipedrive max page size for list endpoints
+
+# Durable job journal: per-row checkpoints so crashed imports can be resumed
+IMPORT_JOURNAL_PATH = os.getenv(
+    'PIPEDRIVE_JOURNAL_PATH',
+    os.path.join(os.path.expanduser('~'), '.pipedrive-bulk-importer', 'import_jobs.db')
+)
+
+# In-memory job storage for this process (durable copy lives in the journal)
 import_jobs: Dict[str, Dict] = {}
 
+# Live progress and background tasks for imports started by this process
+import_progress: Dict[str, 'ImportProgress'] = {}
+background_tasks: Dict[str, asyncio.Task] = {}
+RECENT_ERRORS_LIMIT = 20
+
 # =============================================================================
 # DATA MODELS
 # =============================================================================
@@ -87,31 +132,447 @@ class ImportResult:
     duration_seconds: float
     timestamp: str
 
+@dataclass
+class ImportProgress:
+    """Live counters for a running import, polled by get_import_status"""
+    job_id: str
+    source: str
+    status: str = 'running'
+    total_rows: Optional[int] = None
+    rows_done: int = 0
+    rows_failed: int = 0
+    stages: Dict[str, int] = field(default_factory=dict)
+    api: Dict[str, int] = field(default_factory=dict)  # PipedriveClient.stats, updated live
+    recent_errors: Deque[Dict] = field(default_factory=lambda: deque(maxlen=RECENT_ERRORS_LIMIT))
+    started_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    
+    def bump(self, stage: str, amount: int = 1):
+        self.stages[stage] = self.stages.get(stage, 0) + amount
+    
+    def add_error(self, error: Dict):
+        self.rows_failed += 1
+        self.recent_errors.append(error)
+    
+    def finish(self, success: bool):
+        self.status = 'completed' if success else 'failed'
+        self.finished_at = time.time()
+    
+    def snapshot(self) -> Dict:
+        elapsed = (self.finished_at or time.time()) - self.started_at
+        rows_per_sec = self.rows_done / elapsed if elapsed > 0 else 0.0
+        eta = None
+        if self.status == 'running' and self.total_rows is not None and rows_per_sec > 0:
+            eta = round(max(self.total_rows - self.rows_done, 0) / rows_per_sec, 1)
+        return {
+            'job_id': self.job_id,
+            'source': self.source,
+            'status': self.status,
+            'rows_done': self.rows_done,
+            'rows_failed': self.rows_failed,
+            'total_rows': self.total_rows,
+            'rows_per_sec': round(rows_per_sec, 2),
+            'eta_seconds': eta,
+            'elapsed_seconds': round(elapsed, 1),
+            'stages': dict(self.stages),
+            'api': dict(self.api),
+            'recent_errors': list(self.recent_errors),
+        }
+
+def track_progress(job_id: str, source: str) -> ImportProgress:
+    """Register fresh live progress for a job (also when it is resumed)"""
+    progress = ImportProgress(job_id, source)
+    import_progress[job_id] = progress
+    return progress
+
+class EntityCache:
+    """SQLite-backed org/person id cache, keyed by normalize_org_name / lowercased email"""
+    
+    KINDS = ('organizations', 'persons')
+    
+    def __init__(self, path: str = ENTITY_CACHE_PATH, ttl: int = ENTITY_CACHE_TTL):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.ttl = ttl
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS entities (
+                kind TEXT NOT NULL,
+                key TEXT NOT NULL,
+                entity_id INTEGER NOT NULL,
+                cached_at REAL NOT NULL,
+                PRIMARY KEY (kind, key)
+            );
+            CREATE INDEX IF NOT EXISTS idx_entities_id ON entities (kind, entity_id);
+            CREATE TABLE IF NOT EXISTS sync_state (
+                kind TEXT PRIMARY KEY,
+                update_time TEXT,
+                full_sync_at REAL NOT NULL
+            );
+        """)
+    
+    def load(self, kind: str) -> Dict[str, int]:
+        """All entries of `kind` younger than the TTL"""
+        cutoff = time.time() - self.ttl
+        rows = self.conn.execute(
+            'SELECT key, entity_id FROM entities WHERE kind = ? AND cached_at >= ?', (kind, cutoff)
+        )
+        return dict(rows)
+    
+    def put_many(self, kind: str, items: Dict[str, int]):
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO entities VALUES (?, ?, ?, ?)',
+                [(kind, key, entity_id, now) for key, entity_id in items.items()]
+            )
+    
+    def invalidate(self, kind: str, entity_id: int):
+        with self.conn:
+            self.conn.execute('DELETE FROM entities WHERE kind = ? AND entity_id = ?', (kind, entity_id))
+    
+    def sync_marker(self, kind: str) -> Optional[str]:
+        """Newest update_time seen for `kind`, or None when a full export is due"""
+        row = self.conn.execute(
+            'SELECT update_time, full_sync_at FROM sync_state WHERE kind = ?', (kind,)
+        ).fetchone()
+        if not row or row[1] < time.time() - self.ttl:
+            return None
+        return row[0]
+    
+    def store_sync(self, kind: str, items: Dict[str, int], update_time: Optional[str], full: bool):
+        """Store a pre-warm page set; a full export replaces everything cached for `kind`"""
+        now = time.time()
+        with self.conn:
+            if full:
+                self.conn.execute('DELETE FROM entities WHERE kind = ?', (kind,))
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO entities VALUES (?, ?, ?, ?)',
+                [(kind, key, entity_id, now) for key, entity_id in items.items()]
+            )
+            self.conn.execute("""
+                INSERT INTO sync_state (kind, update_time, full_sync_at) VALUES (?, ?, ?)
+                ON CONFLICT (kind) DO UPDATE SET
+                    update_time = excluded.update_time,
+                    full_sync_at = CASE WHEN ? THEN excluded.full_sync_at ELSE full_sync_at END
+            """, (kind, update_time, now, full))
+    
+    def close(self):
+        self.conn.close()
+
+class ImportJournal:
+    """SQLite journal of import jobs and the Pipedrive ids written for each row"""
+    
+    ROW_FIELDS = ('org_id', 'person_id', 'deal_id', 'org_created', 'person_created')
+    
+    def __init__(self, path: str = IMPORT_JOURNAL_PATH):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                params TEXT NOT NULL,
+                status TEXT NOT NULL,
+                result TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS job_rows (
+                job_id TEXT NOT NULL,
+                row INTEGER NOT NULL,
+                org_id INTEGER,
+                person_id INTEGER,
+                deal_id INTEGER,
+                org_created INTEGER NOT NULL DEFAULT 0,
+                person_created INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (job_id, row)
+            );
+        """)
+    
+    def start_job(self, job_id: str, source: str, params: Dict):
+        now = datetime.now().isoformat()
+        with self.conn:
+            self.conn.execute("""
+                INSERT INTO jobs (job_id, source, params, status, created_at, updated_at)
+                VALUES (?, ?, ?, 'running', ?, ?)
+                ON CONFLICT (job_id) DO UPDATE SET status = 'running', updated_at = excluded.updated_at
+            """, (job_id, source, json.dumps(params), now, now))
+    
+    def finish_job(self, job_id: str, result: Dict):
+        with self.conn:
+            self.conn.execute(
+                'UPDATE jobs SET status = ?, result = ?, updated_at = ? WHERE job_id = ?',
+                ('completed' if result['success'] else 'failed', json.dumps(result),
+                 datetime.now().isoformat(), job_id)
+            )
+    
+    def record(self, job_id: str, row: int, **fields):
+        """Checkpoint ids written for a row; a row is committed once it has a deal_id"""
+        columns = [f for f in self.ROW_FIELDS if f in fields]
+        updates = ', '.join(f"{c} = excluded.{c}" for c in columns)
+        with self.conn:
+            self.conn.execute(
+                f"INSERT INTO job_rows (job_id, row, {', '.join(columns)}) "
+                f"VALUES (?, ?, {', '.join('?' for _ in columns)}) "
+                f"ON CONFLICT (job_id, row) DO UPDATE SET {updates}",
+                (job_id, row, *(fields[c] for c in columns))
+            )
+    
+    def row_states(self, job_id: str) -> Dict[int, Dict]:
+        rows = self.conn.execute('SELECT * FROM job_rows WHERE job_id = ?', (job_id,))
+        return {r['row']: dict(r) for r in rows}
+    
+    def totals(self, job_id: str) -> Dict[str, int]:
+        """Distinct orgs/persons created and deals written across all attempts of a job"""
+        row = self.conn.execute("""
+            SELECT COUNT(DISTINCT CASE WHEN org_created THEN org_id END) AS orgs_created,
+                   COUNT(DISTINCT CASE WHEN person_created THEN person_id END) AS persons_created,
+                   COUNT(deal_id) AS deals_created,
+                   MAX(CASE WHEN deal_id IS NOT NULL THEN row END) AS last_committed_row
+            FROM job_rows WHERE job_id = ?
+        """, (job_id,)).fetchone()
+        return dict(row)
+    
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        row = self.conn.execute('SELECT * FROM jobs WHERE job_id = ?', (job_id,)).fetchone()
+        if not row:
+            return None
+        job = {
+            'job_id': row['job_id'],
+            'source': row['source'],
+            'params': json.loads(row['params']),
+            'status': row['status'],
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at'],
+            'checkpoint': self.totals(job_id),
+        }
+        if row['result']:
+            job['result'] = json.loads(row['result'])
+        return job
+    
+    def recent_jobs(self, limit: int) -> List[Dict]:
+        rows = self.conn.execute(
+            'SELECT job_id FROM jobs ORDER BY created_at DESC LIMIT ?', (limit,)
+        ).fetchall()
+        return [self.get_job(r['job_id']) for r in reversed(rows)]
+
+_journal: Optional[ImportJournal] = None
+
+def get_journal() -> Optional[ImportJournal]:
+    """Process-wide import journal, or None if it cannot be opened"""
+    global _journal
+    if _journal is None:
+        try:
+            _journal = ImportJournal()
+        except (OSError, sqlite3.Error) as e:
+            print(f"Import journal unavailable, imports will not be resumable: {e}")
+    return _journal
+
 # =============================================================================
 # PIPEDRIVE API CLIENT
 # =============================================================================
 
+class TokenBucket:
+    """Async token bucket: `capacity` requests per `window` seconds, refilled continuously
+    
+    The refill rate adapts to what Pipedrive reports: it is halved on every 429
+    and recovers additively on success (AIMD), tokens are capped by the
+    x-ratelimit-remaining header, and Retry-After pauses all callers.
+    """
+    
+    def __init__(self, capacity: int = RATE_LIMIT_BURST, window: float = RATE_LIMIT_WINDOW):
+        self.capacity = capacity
+        self.max_rate = capacity / window
+        self.rate = self.max_rate
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    async def acquire(self):
+        # Lock keeps waiters in FIFO order so no caller starves under load
+        async with self._lock:
+            while True:
+                paused = self.paused_until - time.monotonic()
+                if paused > 0:
+                    await asyncio.sleep(paused)
+                    continue
+                self._refill()
+                if self.tokens >= 1:
+                    break
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+            self.tokens -= 1
+    
+    def pause(self, seconds: float):
+        """Hold every caller for `seconds` (Retry-After / exhausted window)"""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+    
+    def throttle(self):
+        self._refill()
+        self.rate = max(self.max_rate * MIN_RATE_FRACTION, self.rate / 2)
+    
+    def recover(self):
+        if self.rate < self.max_rate:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+    
+    def observe(self, remaining: Optional[int], reset: Optional[float]):
+        """Sync with Pipedrive's view of the current window"""
+        if remaining is None:
+            return
+        self._refill()
+        self.tokens = min(self.tokens, float(remaining))
+        if remaining <= 0 and reset:
+            self.pause(reset)
+
+def _header_number(response: requests.Response, name: str) -> Optional[float]:
+    try:
+        return float(response.headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+def request_not_sent(error: Exception) -> bool:
+    """True when the connection failed before the request went out"""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+def write_outcome_unknown(error: Exception) -> bool:
+    """A failed POST that Pipedrive may still have applied"""
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return not request_not_sent(error)
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None) in AMBIGUOUS_STATUS_WRITE
+
+def retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Retry-After as seconds (the header may be a delay or an HTTP date)"""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
 class PipedriveClient:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+                 cache: Optional[EntityCache] = None, retry_budget: int = RETRY_BUDGET):
         self.api_key = api_key
         self.base_url = PIPEDRIVE_BASE_URL
         self.session = requests.Session()
-        self.org_cache: Dict[str, int] = {}
-        self.person_cache: Dict[str, int] = {}
+        # One pooled connection per concurrent request
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)  # local stand-ins (fake_pipedrive.py)
+        self.bucket = TokenBucket()
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        # Own worker threads: the default executor may have fewer than max_concurrency
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='pipedrive')
+        # Retries left for this client, i.e. for the import that owns it
+        self.retry_budget = retry_budget
+        self.stats: Dict[str, int] = {'requests': 0, 'retries': 0, 'throttled': 0}
+        # Keyed by normalize_org_name(name) / email.lower(), seeded from the on-disk cache
+        self.cache = cache
+        self.org_cache: Dict[str, int] = cache.load('organizations') if cache else {}
+        self.person_cache: Dict[str, int] = cache.load('persons') if cache else {}
+        # Ids actually created (not found) by this client
+        self.created: Dict[str, set] = {kind: set() for kind in EntityCache.KINDS}
+        # Ids resolved this run that still need writing to the on-disk cache
+        self._unsaved: Dict[str, Dict[str, int]] = {kind: {} for kind in EntityCache.KINDS}
+        # Set once the caches hold a full export; cache misses then skip the search call
+        self.prewarmed = False
+        # In-flight creates, so concurrent rows for the same org/email share one call
+        self._org_inflight: Dict[str, asyncio.Task] = {}
+        self._person_inflight: Dict[str, asyncio.Task] = {}
     
-    def _request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict:
-        url = f"{self.base_url}/{endpoint}"
-        params = {'api_token': self.api_key}
-        time.sleep(RATE_LIMIT_DELAY)
-        
+    async def _single_flight(self, inflight: Dict[str, asyncio.Task], key: str, factory) -> Optional[int]:
+        """Run factory() once per key; concurrent callers await the same task"""
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            inflight[key] = task
+        result = await task
+        if result is None and inflight.get(key) is task:
+            # Failed creates may be retried by a later row
+            del inflight[key]
+        return result
+    
+    def _send(self, method: str, url: str, params: Dict, data: Optional[Dict]) -> requests.Response:
+        """Blocking HTTP call, run in a worker thread by _request"""
         if method == 'GET':
-            response = self.session.get(url, params=params)
+            # GET payloads go on the querystring (search endpoints need `term` there)
+            return self.session.get(url, params={**params, **(data or {})}, timeout=REQUEST_TIMEOUT)
         elif method == 'POST':
-            response = self.session.post(url, params=params, json=data)
+            return self.session.post(url, params=params, json=data, timeout=REQUEST_TIMEOUT)
         elif method == 'PUT':
-            response = self.session.put(url, params=params, json=data)
+            return self.session.put(url, params=params, json=data, timeout=REQUEST_TIMEOUT)
         else:
             raise ValueError(f"Unsupported method: {method}")
+    
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff"""
+        return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+    
+    def _can_retry(self, attempt: int) -> bool:
+        return attempt < MAX_RETRIES and self.retry_budget > 0
+    
+    async def _request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict:
+        url = f"{self.base_url}/{endpoint}"
+        params = {'api_token': self.api_key}
+        retryable = RETRYABLE_STATUS if method == 'GET' else RETRYABLE_STATUS_WRITE
+        
+        attempt = 0
+        while True:
+            await self.bucket.acquire()
+            self.stats['requests'] += 1
+            try:
+                async with self.semaphore:
+                    response = await asyncio.get_running_loop().run_in_executor(
+                        self.executor, self._send, method, url, params, data
+                    )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                # A write may have been applied already unless it never went out
+                unsafe = method != 'GET' and not request_not_sent(e)
+                if unsafe or not self._can_retry(attempt):
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                self.bucket.observe(
+                    _header_number(response, 'x-ratelimit-remaining'),
+                    _header_number(response, 'x-ratelimit-reset')
+                )
+                if response.status_code == 429:
+                    self.stats['throttled'] += 1
+                    self.bucket.throttle()
+                elif response.ok:
+                    self.bucket.recover()
+                
+                if response.status_code not in retryable or not self._can_retry(attempt):
+                    break
+                delay = retry_after_seconds(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                if response.status_code == 429:
+                    # Everyone waits, not just this request
+                    self.bucket.pause(delay)
+            
+            attempt += 1
+            self.retry_budget -= 1
+            self.stats['retries'] += 1
+            await asyncio.sleep(delay)
         
         try:
             response.raise_for_status()
@@ -122,56 +583,181 @@ class PipedriveClient:
                 print(f"API Error details: {response.text}")
             raise
     
-    def find_organization(self, name: str) -> Optional[int]:
-        if name in self.org_cache:
-            return self.org_cache[name]
+    async def _post_new(self, endpoint: str, data: Dict, search: Callable) -> int:
+        """POST a new entity; when the outcome is unknown, search for it before posting again
         
+        `search(started)` gets the UTC time the first POST was sent.
+        """
+        started = datetime.now(timezone.utc)
         try:
-            result = self._request('GET', 'organizations/search', {'term': name})
+            return (await self._request('POST', endpoint, data))['data']['id']
+        except Exception as e:
+            if not write_outcome_unknown(e) or not self._can_retry(0):
+                raise
+            print(f"POST {endpoint} outcome unknown ({e}), searching before retrying")
+        existing_id = await search(started)
+        if existing_id:
+            return existing_id
+        self.retry_budget -= 1
+        self.stats['retries'] += 1
+        return (await self._request('POST', endpoint, data))['data']['id']
+    
+    async def _page_updates(self, endpoint: str, since: Optional[str]):
+        """Yield items from a list endpoint, newest update_time first, stopping at `since`"""
+        start = 0
+        while True:
+            result = await self._request('GET', endpoint, {
+                'start': start, 'limit': PREWARM_PAGE_SIZE, 'sort': 'update_time DESC'
+            })
+            for item in result.get('data') or []:
+                if since and (item.get('update_time') or '') <= since:
+                    return
+                yield item
+            pagination = (result.get('additional_data') or {}).get('pagination') or {}
+            if not pagination.get('more_items_in_collection'):
+                return
+            start = pagination['next_start']
+    
+    async def prewarm(self):
+        """Refresh the caches from /organizations and /persons (incrementally when cached)"""
+        for kind in EntityCache.KINDS:
+            since = self.cache.sync_marker(kind) if self.cache else None
+            newest = since
+            found: Dict[str, int] = {}
+            async for item in self._page_updates(kind, since):
+                if kind == 'organizations':
+                    key = normalize_org_name(item.get('name') or '')
+                    if key:
+                        found[key] = item['id']
+                else:
+                    for email in item.get('email') or []:
+                        if email.get('value'):
+                            found[email['value'].lower()] = item['id']
+                if not newest or (item.get('update_time') or '') > newest:
+                    newest = item.get('update_time')
+            
+            if self.cache:
+                self.cache.store_sync(kind, found, newest, full=since is None)
+                found = self.cache.load(kind)
+            if kind == 'organizations':
+                self.org_cache = found
+            else:
+                self.person_cache = found
+        self.prewarmed = True
+    
+    def _remember(self, kind: str, key: str, entity_id: int):
+        cache = self.org_cache if kind == 'organizations' else self.person_cache
+        cache[key] = entity_id
+        self._unsaved[kind][key] = entity_id
+    
+    def invalidate(self, kind: str, entity_id: int):
+        """Forget a cached id that Pipedrive no longer knows (404)"""
+        cache = self.org_cache if kind == 'organizations' else self.person_cache
+        inflight = self._org_inflight if kind == 'organizations' else self._person_inflight
+        for key in [k for k, v in cache.items() if v == entity_id]:
+            del cache[key]
+            inflight.pop(key, None)
+            self._unsaved[kind].pop(key, None)
+        if self.cache:
+            self.cache.invalidate(kind, entity_id)
+    
+    def _invalidate_on_404(self, error: Exception, **refs: Optional[int]):
+        response = getattr(error, 'response', None)
+        if getattr(response, 'status_code', None) != 404:
+            return
+        for kind, entity_id in refs.items():
+            if entity_id:
+                self.invalidate(kind, entity_id)
+    
+    def flush_cache(self):
+        """Write ids resolved or created during this import to the on-disk cache"""
+        if not self.cache:
+            return
+        for kind, items in self._unsaved.items():
+            if items:
+                self.cache.put_many(kind, items)
+                items.clear()
+    
+    def close(self):
+        self.executor.shutdown(wait=False)
+        self.session.close()
+    
+    async def find_organization(self, name: str) -> Optional[int]:
+        key = normalize_org_name(name)
+        if key in self.org_cache:
+            return self.org_cache[key]
+        if self.prewarmed:
+            return None
+        return await self.search_organization(name)
+    
+    async def search_organization(self, name: str) -> Optional[int]:
+        """Look the organization up in Pipedrive, bypassing the cache"""
+        key = normalize_org_name(name)
+        try:
+            result = await self._request('GET', 'organizations/search', {'term': name})
             if result.get('data') and result['data'].get('items'):
                 for item in result['data']['items']:
-                    if item['item']['name'].lower() == name.lower():
+                    if normalize_org_name(item['item']['name']) == key:
                         org_id = item['item']['id']
-                        self.org_cache[name] = org_id
+                        self._remember('organizations', key, org_id)
                         return org_id
         except Exception:
             pass
         return None
     
-    def create_organization(self, name: str, address: str) -> Optional[int]:
-        existing_id = self.find_organization(name)
+    async def create_organization(self, name: str, address: str) -> Optional[int]:
+        return await self._single_flight(
+            self._org_inflight, normalize_org_name(name),
+            lambda: self._create_organization(name, address)
+        )
+    
+    async def _create_organization(self, name: str, address: str) -> Optional[int]:
+        existing_id = await self.find_organization(name)
         if existing_id:
             return existing_id
         
         try:
             data = {'name': name, 'address': address}
-            result = self._request('POST', 'organizations', data)
-            org_id = result['data']['id']
-            self.org_cache[name] = org_id
+            org_id = await self._post_new('organizations', data, lambda started: self.search_organization(name))
+            self._remember('organizations', normalize_org_name(name), org_id)
+            self.created['organizations'].add(org_id)
             return org_id
         except Exception as e:
             print(f"Error creating org '{name}': {e}")
             return None
     
-    def find_person(self, email: str) -> Optional[int]:
-        if email in self.person_cache:
-            return self.person_cache[email]
-        
+    async def find_person(self, email: str) -> Optional[int]:
+        key = email.lower()
+        if key in self.person_cache:
+            return self.person_cache[key]
+        if self.prewarmed:
+            return None
+        return await self.search_person(email)
+    
+    async def search_person(self, email: str) -> Optional[int]:
+        """Look the person up in Pipedrive by email, bypassing the cache"""
+        key = email.lower()
         try:
-            result = self._request('GET', 'persons/search', {'term': email, 'fields': 'email'})
+            result = await self._request('GET', 'persons/search', {'term': email, 'fields': 'email'})
             if result.get('data') and result['data'].get('items'):
                 for item in result['data']['items']:
                     person_emails = item['item'].get('emails', [])
                     if any(e.lower() == email.lower() for e in person_emails):
                         person_id = item['item']['id']
-                        self.person_cache[email] = person_id
+                        self._remember('persons', key, person_id)
                         return person_id
         except Exception:
             pass
         return None
     
-    def create_person(self, name: str, email: str, phone: str, function: str, org_id: int) -> Optional[int]:
-        existing_id = self.find_person(email)
+    async def create_person(self, name: str, email: str, phone: str, function: str, org_id: int) -> Optional[int]:
+        return await self._single_flight(
+            self._person_inflight, email.lower(),
+            lambda: self._create_person(name, email, phone, function, org_id)
+        )
+    
+    async def _create_person(self, name: str, email: str, phone: str, function: str, org_id: int) -> Optional[int]:
+        existing_id = await self.find_person(email)
         if existing_id:
             return existing_id
         
@@ -183,15 +769,16 @@ class PipedriveClient:
                 'org_id': org_id,
                 # Note: functie field removed as it's not valid for persons in this setup
             }
-            result = self._request('POST', 'persons', data)
-            person_id = result['data']['id']
-            self.person_cache[email] = person_id
+            person_id = await self._post_new('persons', data, lambda started: self.search_person(email))
+            self._remember('persons', email.lower(), person_id)
+            self.created['persons'].add(person_id)
             return person_id
         except Exception as e:
             print(f"Error creating person '{name}': {e}")
+            self._invalidate_on_404(e, organizations=org_id)
             return None
     
-    def create_deal(self, title: str, org_id: int, person_id: Optional[int] = None, 
+    async def create_deal(self, title: str, org_id: int, person_id: Optional[int] = None, 
                    value: int = 15000, pipeline_id: int = DEFAULT_PIPELINE_ID, 
                    stage_id: int = DEFAULT_STAGE_ID, custom_fields: Optional[Dict] = None,
                    skip_automation: bool = True) -> Optional[int]:
@@ -225,10 +812,10 @@ class PipedriveClient:
                 data[CUSTOM_FIELDS['initial_email_sent']] = 'No'
                 data[CUSTOM_FIELDS['automation_sequence_status']] = 'not_started'
             # print(f"Creating deal with data: {data}")  # Debug - commented out for cleaner output
-            result = self._request('POST', 'deals', data)
-            return result['data']['id']
+            return await self._post_new('deals', data, lambda started: self.search_deal(title, org_id, started))
         except Exception as e:
             print(f"Error creating deal '{title}': {e}")
+            self._invalidate_on_404(e, organizations=org_id, persons=person_id)
             print(f"Deal data was: {data}")  # Debug
             # Try to get more error details
             if hasattr(e, 'response') and e.response:
@@ -239,6 +826,27 @@ class PipedriveClient:
                     print(f"Response text: {e.response.text}")
             return None
 
+    async def search_deal(self, title: str, org_id: int, created_after: datetime) -> Optional[int]:
+        """Deal with this exact title on the organization, added at or after `created_after`
+        
+        Older deals with the same title are someone else's; a deal whose add_time
+        can't be read raises rather than being taken for ours.
+        """
+        result = await self._request('GET', 'deals/search', {
+            'term': title, 'organization_id': org_id, 'exact_match': 'true'
+        })
+        for item in (result.get('data') or {}).get('items') or []:
+            if item['item'].get('title') != title:
+                continue
+            deal = (await self._request('GET', f"deals/{item['item']['id']}")).get('data') or {}
+            try:
+                added = datetime.strptime(deal['add_time'], '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
+            except (KeyError, TypeError, ValueError):
+                raise ValueError(f"Deal {item['item']['id']} has no readable add_time, can't tell if it is ours")
+            if (added - created_after).total_seconds() >= -CLOCK_SKEW:
+                return item['item']['id']
+        return None
+
 # =============================================================================
 # GOOGLE SHEETS INTEGRATION (via Zapier MCP)
 # =============================================================================
@@ -248,9 +856,15 @@ async def fetch_google_sheet_data(spreadsheet_id: str, worksheet_name: str,
     """
     Fetch data from Google Sheets using multiple URL approaches
     """
+    # The download blocks, so keep it off the event loop (other imports keep running)
+    return await asyncio.to_thread(_fetch_google_sheet_data, spreadsheet_id, worksheet_name, max_rows)
+
+def _fetch_google_sheet_data(spreadsheet_id: str, worksheet_name: str, 
+                             max_rows: Optional[int] = None) -> List[List[str]]:
     import requests
     import csv
     import io
+    import itertools
     
     print(f"🔄 Fetching Google Sheet data...")
     print(f"   Spreadsheet: {spreadsheet_id}")
@@ -274,17 +888,23 @@ async def fetch_google_sheet_data(spreadsheet_id: str, worksheet_name: str,
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             })
             
-            response = session.get(csv_url, timeout=10, allow_redirects=True)
+            # Stream the export instead of holding response.text in memory
+            response = session.get(csv_url, timeout=10, allow_redirects=True, stream=True)
             response.raise_for_status()
+            response.raw.decode_content = True
+            stream = io.TextIOWrapper(response.raw, encoding=response.encoding or 'utf-8', newline='')
             
             # Check if response contains valid CSV data (not HTML error page)
-            if response.text.strip().startswith('<HTML>') or '<TITLE>' in response.text:
+            first_line = stream.readline()
+            is_html = 'text/html' in response.headers.get('Content-Type', '')
+            if is_html or first_line.strip().upper().startswith(('<HTML', '<!DOCTYPE')):
                 print(f"   ❌ Attempt {i}: Got HTML redirect/error page")
+                response.close()
                 continue
             
             # Parse CSV data
             csv_data = []
-            reader = csv.reader(io.StringIO(response.text))
+            reader = csv.reader(itertools.chain([first_line], stream))
             
             for row_idx, row in enumerate(reader):
                 if max_rows and row_idx >= max_rows + 1:  # +1 for header
@@ -292,6 +912,7 @@ async def fetch_google_sheet_data(spreadsheet_id: str, worksheet_name: str,
                 # Clean empty strings and strip whitespace
                 clean_row = [cell.strip() for cell in row]
                 csv_data.append(clean_row)
+            response.close()
             
             if len(csv_data) > 1:  # Has header + data
                 print(f"   ✅ Success! Fetched {len(csv_data)-1} data rows (+ header)")
@@ -374,19 +995,87 @@ async def validate_sheet_data(spreadsheet_id: str, worksheet_name: str,
 # IMPORT LOGIC
 # =============================================================================
 
+def parse_sheet_row(row: List[str]) -> Dict:
+    """Map a validated JobDigger sheet row to the fields used for org/person/deal"""
+    # CORRECTE JobDigger data structuur
+    # 0: rij_nummer, 1: deal_titel (NEGEREN), 2: bedrijfsnaam, 3: functietitel, 4: voornaam,
+    # 5: achternaam, 6: email, 7: telefoon, 8: functie_contact, 9: website, 10: stad,
+    # 11: provincie, 12: postcode, 13: vacature_url, 14: datum_gevonden, 15: via_bemiddelaar
+    
+    bedrijfsnaam = row[2].strip()  # Kolom B -> bedrijfsnaam
+    functietitel = row[3].strip()  # Kolom C -> functietitel
+    voornaam = row[4].strip()
+    achternaam = row[5].strip()
+    
+    stad = row[10].strip() if len(row) > 10 else ''
+    provincie = row[11].strip() if len(row) > 11 else ''
+    postcode = row[12].strip() if len(row) > 12 else ''
+    
+    # Deal information - GECORRIGEERD (Optie C)
+    if functietitel:
+        deal_titel = f"{bedrijfsnaam} - {functietitel}"
+    else:
+        deal_titel = f"Recruitment - {bedrijfsnaam}"
+    
+    return {
+        'bedrijfsnaam': bedrijfsnaam,
+        'functietitel': functietitel,
+        'naam': f"{voornaam} {achternaam}".strip(),
+        'email': row[6].strip(),
+        'telefoon': row[7].strip() if len(row) > 7 else '',
+        'functie_contact': row[8].strip() if len(row) > 8 else '',
+        'address': f"{stad}, {provincie} {postcode}".strip(),
+        'deal_titel': deal_titel,
+        'locatie': f"{stad}, {provincie}".strip(', '),
+    }
+
+def open_entity_cache() -> Optional[EntityCache]:
+    """Open the on-disk entity cache, or run without one if it is unavailable"""
+    try:
+        return EntityCache()
+    except (OSError, sqlite3.Error) as e:
+        print(f"Entity cache unavailable, continuing without it: {e}")
+        return None
+
+async def prewarm_client(client: PipedriveClient):
+    """Refresh the client caches from Pipedrive before an import"""
+    try:
+        await client.prewarm()
+    except Exception as e:
+        # Fall back to per-row search calls
+        print(f"Cache pre-warm failed, continuing without it: {e}")
+
 async def do_import(spreadsheet_id: str, worksheet_name: str, 
                    max_rows: Optional[int], skip_invalid: bool, 
-                   test_mode: bool) -> ImportResult:
-    """Perform the actual import"""
+                   test_mode: bool,
+                   max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+                   pipelined: bool = True,
+                   prewarm: bool = True,
+                   job_id: Optional[str] = None) -> ImportResult:
+    """Perform the actual import (pass the job_id of an earlier run to resume it)"""
     
-    job_id = str(uuid.uuid4())[:8]
+    job_id = job_id or str(uuid.uuid4())[:8]
     start_time = time.time()
+    progress = track_progress(job_id, 'google_sheet')
     
-    # Fetch data
-    data = await fetch_google_sheet_data(spreadsheet_id, worksheet_name, max_rows)
+    # Journal the job so a crash can be resumed from the first uncommitted row
+    journal = get_journal()
+    done: Dict[int, Dict] = {}
+    if journal:
+        journal.start_job(job_id, 'google_sheet', {
+            'spreadsheet_id': spreadsheet_id, 'worksheet_name': worksheet_name,
+            'max_rows': max_rows, 'skip_invalid': skip_invalid, 'test_mode': test_mode,
+            'max_concurrency': max_concurrency, 'pipelined': pipelined, 'prewarm': prewarm,
+        })
+        done = journal.row_states(job_id)
+    
+    def checkpoint(idx: int, **fields):
+        if journal:
+            journal.record(job_id, idx, **fields)
     
-    # Initialize client
-    client = PipedriveClient(PIPEDRIVE_API_KEY)
+    def add_error(error: Dict):
+        stats['errors'].append(error)
+        progress.add_error(error)
     
     stats = {
         'orgs_created': 0,
@@ -394,105 +1083,167 @@ async def do_import(spreadsheet_id: str, worksheet_name: str,
         'deals_created': 0,
         'errors': []
     }
+    cache = None
+    client = None
     
-    # Process rows
-    for idx, row in enumerate(data[1:], start=2):  # Skip header
-        # Validate
-        errors = validate_row(row, idx)
-        if errors:
-            if skip_invalid:
-                stats['errors'].append({'row': idx, 'errors': [asdict(e) for e in errors]})
-                continue
-            else:
-                break
-        
-        # Parse row - CORRECTE JobDigger data structuur
-        # 0: rij_nummer, 1: deal_titel (NEGEREN), 2: bedrijfsnaam, 3: functietitel, 4: voornaam,
-        # 5: achternaam, 6: email, 7: telefoon, 8: functie_contact, 9: website, 10: stad,
-        # 11: provincie, 12: postcode, 13: vacature_url, 14: datum_gevonden, 15: via_bemiddelaar
-        
-        bedrijfsnaam = row[2].strip()  # Kolom B -> bedrijfsnaam
-        functietitel = row[3].strip()  # Kolom C -> functietitel
-        voornaam = row[4].strip()
-        achternaam = row[5].strip()
-        naam = f"{voornaam} {achternaam}".strip()
-        email = row[6].strip()
-        telefoon = row[7].strip() if len(row) > 7 else ''
-        functie_contact = row[8].strip() if len(row) > 8 else ''
-        
-        stad = row[10].strip() if len(row) > 10 else ''
-        provincie = row[11].strip() if len(row) > 11 else ''
-        postcode = row[12].strip() if len(row) > 12 else ''
-        address = f"{stad}, {provincie} {postcode}".strip()
-        
-        # Deal information - GECORRIGEERD (Optie C)
-        if functietitel:
-            deal_titel = f"{bedrijfsnaam} - {functietitel}"
-        else:
-            deal_titel = f"Recruitment - {bedrijfsnaam}"
+    try:
+        # Fetch data
+        data = await fetch_google_sheet_data(spreadsheet_id, worksheet_name, max_rows)
+    
+        # Initialize client
+        cache = open_entity_cache()
+        client = PipedriveClient(PIPEDRIVE_API_KEY, max_concurrency, cache)
+        progress.api = client.stats
+        if prewarm:
+            await prewarm_client(client)
+    
+        # Validate up front so the pipeline only sees importable rows
+        rows = []
+        progress.total_rows = len(data) - 1
+        for idx, row in enumerate(data[1:], start=2):  # Skip header
+            errors = validate_row(row, idx)
+            if errors:
+                if skip_invalid:
+                    add_error({'row': idx, 'errors': [asdict(e) for e in errors]})
+                    progress.rows_done += 1
+                    continue
+                else:
+                    break
+            progress.bump('validated')
+            rows.append((idx, parse_sheet_row(row)))
+        progress.total_rows = progress.rows_done + len(rows)
+    
+        async def process_row(idx: int, parsed: Dict):
+            # Ids already written for this row by an earlier attempt are reused as-is
+            state = done.get(idx, {})
         
-        locatie = f"{stad}, {provincie}".strip(', ')
+            # Create org (rows sharing a bedrijfsnaam await the same in-flight create)
+            org_id = state.get('org_id')
+            if not org_id:
+                org_id = await client.create_organization(parsed['bedrijfsnaam'], parsed['address'])
+                if not org_id:
+                    add_error({'row': idx, 'error': 'Failed to create org'})
+                    return
+                checkpoint(idx, org_id=org_id, org_created=org_id in client.created['organizations'])
+            stats['orgs_created'] += 1
+            progress.bump('orgs')
         
-        # Create org
-        org_id = client.create_organization(bedrijfsnaam, address)
-        if not org_id:
-            stats['errors'].append({'row': idx, 'error': 'Failed to create org'})
-            continue
-        stats['orgs_created'] += 1
+            # Create person
+            person_id = state.get('person_id')
+            if not person_id:
+                person_id = await client.create_person(
+                    parsed['naam'], parsed['email'], parsed['telefoon'], parsed['functie_contact'], org_id
+                )
+                if not person_id:
+                    add_error({'row': idx, 'error': 'Failed to create person'})
+                    return
+                checkpoint(idx, person_id=person_id, person_created=person_id in client.created['persons'])
+            stats['persons_created'] += 1
+            progress.bump('persons')
         
-        # Create person
-        person_id = client.create_person(naam, email, telefoon, functie_contact, org_id)
-        if not person_id:
-            stats['errors'].append({'row': idx, 'error': 'Failed to create person'})
-            continue
-        stats['persons_created'] += 1
-        
-        # Create deal
-        deal_id = client.create_deal(
-            deal_titel, 
-            org_id, 
-            person_id, 
-            15000, 
-            DEFAULT_PIPELINE_ID, 
-            DEFAULT_STAGE_ID,
-            {
-                'vacature_titel': functietitel,
-                'locatie': locatie,
-                'contact_phone': telefoon,  # Add phone to deal
-            }
+            if state.get('deal_id'):
+                stats['deals_created'] += 1
+                progress.bump('deals')
+                return
+        
+            # Create deal
+            deal_id = await client.create_deal(
+                parsed['deal_titel'], 
+                org_id, 
+                person_id, 
+                15000, 
+                DEFAULT_PIPELINE_ID, 
+                DEFAULT_STAGE_ID,
+                {
+                    'vacature_titel': parsed['functietitel'],
+                    'locatie': parsed['locatie'],
+                    'contact_phone': parsed['telefoon'],  # Add phone to deal
+                }
+            )
+            if not deal_id:
+                add_error({'row': idx, 'error': 'Failed to create deal'})
+                return
+            checkpoint(idx, deal_id=deal_id)
+            stats['deals_created'] += 1
+            progress.bump('deals')
+    
+        if pipelined:
+            # Keep a window of rows in flight: org creates for upcoming rows overlap
+            # with person/deal creates for rows whose org is already known
+            row_slots = asyncio.Semaphore(max_concurrency * 2)
+        
+            async def bounded(idx: int, parsed: Dict):
+                async with row_slots:
+                    await process_row(idx, parsed)
+                    progress.rows_done += 1
+        
+            # Let every row settle before re-raising, so nothing runs on a closed client
+            outcomes = await asyncio.gather(*(bounded(idx, parsed) for idx, parsed in rows),
+                                            return_exceptions=True)
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    raise outcome
+            stats['errors'].sort(key=lambda e: e['row'])
+        else:
+            for idx, parsed in rows:
+                await process_row(idx, parsed)
+                progress.rows_done += 1
+    
+        duration = time.time() - start_time
+    
+        result = ImportResult(
+            job_id=job_id,
+            success=len(stats['errors']) == 0,
+            orgs_created=stats['orgs_created'],
+            persons_created=stats['persons_created'],
+            deals_created=stats['deals_created'],
+            errors=stats['errors'],
+            duration_seconds=round(duration, 2),
+            timestamp=datetime.now().isoformat()
         )
-        if not deal_id:
-            stats['errors'].append({'row': idx, 'error': 'Failed to create deal'})
-            continue
-        stats['deals_created'] += 1
-    
-    duration = time.time() - start_time
-    
-    result = ImportResult(
-        job_id=job_id,
-        success=len(stats['errors']) == 0,
-        orgs_created=stats['orgs_created'],
-        persons_created=stats['persons_created'],
-        deals_created=stats['deals_created'],
-        errors=stats['errors'],
-        duration_seconds=round(duration, 2),
-        timestamp=datetime.now().isoformat()
-    )
     
-    # Store job
-    import_jobs[job_id] = asdict(result)
+        # Store job
+        import_jobs[job_id] = asdict(result)
+        progress.finish(result.success)
+        if journal:
+            journal.finish_job(job_id, asdict(result))
+    
+        return result
+    
+    except Exception as e:
+        duration = time.time() - start_time
+        result = ImportResult(
+            job_id=job_id,
+            success=False,
+            orgs_created=stats['orgs_created'],
+            persons_created=stats['persons_created'],
+            deals_created=stats['deals_created'],
+            errors=stats['errors'] + [{'error': str(e)}],
+            duration_seconds=round(duration, 2),
+            timestamp=datetime.now().isoformat()
+        )
+        import_jobs[job_id] = asdict(result)
+        progress.add_error({'error': str(e)})
+        progress.finish(False)
+        if journal:
+            journal.finish_job(job_id, asdict(result))
+        return result
     
-    return result
+    finally:
+        if client:
+            client.flush_cache()
+            client.close()
+        if cache:
+            cache.close()
 
 # =============================================================================
 # CSV HELPER FUNCTIONS
 # =============================================================================
 
-def parse_csv(filepath: str, delimiter: str = ';', encoding: str = 'utf-8', max_rows: Optional[int] = None) -> List[Dict]:
-    """Parse CSV file into list of dictionaries"""
-    rows = []
+def iter_csv(filepath: str, delimiter: str = ';', encoding: str = 'utf-8', max_rows: Optional[int] = None) -> Iterator[Dict]:
+    """Yield CSV rows as dictionaries, one at a time"""
     try:
-        with open(filepath, 'r', encoding=encoding) as f:
+        with open(filepath, 'r', encoding=encoding, newline='') as f:
             # Handle BOM
             first_char = f.read(1)
             if first_char != '\ufeff':
@@ -503,14 +1254,26 @@ def parse_csv(filepath: str, delimiter: str = ';', encoding: str = 'utf-8', max_
                 if max_rows and i > max_rows:
                     break
                 # Clean empty strings
-                cleaned_row = {k: v.strip() if v else '' for k, v in row.items()}
-                rows.append(cleaned_row)
-        return rows
+                yield {k: v.strip() if v else '' for k, v in row.items()}
     except FileNotFoundError:
         raise Exception(f"CSV file not found: {filepath}")
     except Exception as e:
         raise Exception(f"Failed to parse CSV: {str(e)}")
 
+def parse_csv(filepath: str, delimiter: str = ';', encoding: str = 'utf-8', max_rows: Optional[int] = None) -> List[Dict]:
+    """Parse CSV file into list of dictionaries"""
+    return list(iter_csv(filepath, delimiter, encoding, max_rows))
+
+def count_csv_rows(filepath: str, max_rows: Optional[int] = None) -> Optional[int]:
+    """Cheap data-row count (newlines minus header) used for progress ETA"""
+    try:
+        with open(filepath, 'rb') as f:
+            lines = sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b''))
+    except OSError:
+        return None
+    rows = max(lines - 1, 0)
+    return min(rows, max_rows) if max_rows else rows
+
 def normalize_org_name(name: str) -> str:
     """Normalize organization name for deduplication"""
     if not name:
@@ -547,105 +1310,296 @@ def map_csv_to_pipedrive(row: Dict) -> Dict:
         'address': row.get('stad', '').strip()  # Use stad as address
     }
 
+def plan_import(rows: Iterable[Dict], org_cache: Dict[str, int], person_cache: Dict[str, int],
+                cache_complete: bool = False,
+                max_concurrency: int = MAX_CONCURRENT_REQUESTS) -> Dict:
+    """Dry-run plan for import_from_csv: what would be created and what it costs
+    
+    Works purely from the parsed rows and the entity caches, without touching
+    the network. When `cache_complete` is False, every org/email missing from
+    the cache costs one search call before it is created (the search may
+    still find it, so creates are an upper bound in that case).
+    """
+    new_orgs: Dict[str, str] = {}
+    new_persons: Dict[str, str] = {}
+    deals: List[Dict] = []
+    invalid: List[Dict] = []
+    existing_orgs = set()
+    existing_persons = set()
+    
+    for i, row in enumerate(rows, 1):
+        is_valid, error_msg = validate_csv_row(row)
+        if is_valid:
+            mapped_data = map_csv_to_pipedrive(row)
+            try:
+                int(mapped_data['deal_value'])
+            except ValueError:
+                is_valid, error_msg = False, f"Invalid deal_value: {mapped_data['deal_value']}"
+        if not is_valid:
+            invalid.append({'row': i, 'error': error_msg})
+            continue
+        
+        org_key = normalize_org_name(mapped_data['bedrijfsnaam'])
+        if org_key in org_cache:
+            existing_orgs.add(org_key)
+        else:
+            new_orgs.setdefault(org_key, mapped_data['bedrijfsnaam'])
+        
+        email_key = mapped_data['email'].lower()
+        if email_key:
+            if email_key in person_cache:
+                existing_persons.add(email_key)
+            else:
+                new_persons.setdefault(email_key, mapped_data['contactpersoon'] or 'Unknown')
+        
+        deals.append({'row': i, 'title': mapped_data['deal_titel'], 'organization': mapped_data['bedrijfsnaam']})
+    
+    search_calls = 0 if cache_complete else len(new_orgs) + len(new_persons)
+    create_calls = len(new_orgs) + len(new_persons) + len(deals)
+    api_calls = search_calls + create_calls
+    
+    # Bound by whichever is slower: the rate limit or request latency at max concurrency
+    rate = RATE_LIMIT_BURST / RATE_LIMIT_WINDOW
+    seconds = max(api_calls / rate, api_calls * ESTIMATED_REQUEST_LATENCY / max_concurrency)
+    
+    return {
+        'rows': len(deals) + len(invalid),
+        'valid_rows': len(deals),
+        'invalid_rows': invalid,
+        'organizations_to_create': [{'key': k, 'name': v} for k, v in new_orgs.items()],
+        'persons_to_create': [{'email': k, 'name': v} for k, v in new_persons.items()],
+        'deals_to_create': deals,
+        'existing_organizations': len(existing_orgs),
+        'existing_persons': len(existing_persons),
+        'cache_complete': cache_complete,
+        'estimated_api_calls': {
+            'search': search_calls,
+            'create': create_calls,
+            'total': api_calls,
+            'per_row': round(api_calls / len(deals), 2) if deals else 0,
+        },
+        'estimated_seconds': round(seconds, 1),
+        'rate_limit': f"{RATE_LIMIT_BURST} calls / {RATE_LIMIT_WINDOW}s, {max_concurrency} concurrent",
+    }
+
+def plan_csv_import(filepath: str, max_rows: Optional[int] = None,
+                    max_concurrency: int = MAX_CONCURRENT_REQUESTS) -> Dict:
+    """Plan a CSV import against the local entity cache (no network calls)"""
+    cache = open_entity_cache()
+    org_cache = cache.load('organizations') if cache else {}
+    person_cache = cache.load('persons') if cache else {}
+    # A cache refreshed by a full export within the TTL is treated as authoritative
+    cache_complete = bool(cache) and all(cache.sync_marker(kind) for kind in EntityCache.KINDS)
+    if cache:
+        cache.close()
+    return plan_import(iter_csv(filepath, max_rows=max_rows), org_cache, person_cache,
+                       cache_complete, max_concurrency)
+
+async def push_csv_row(client: PipedriveClient, mapped_data: Dict,
+                       pipeline_id: int, stage_id: int,
+                       state: Optional[Dict] = None,
+                       checkpoint: Optional[Callable[..., None]] = None) -> Optional[int]:
+    """Create/find org and person for a mapped CSV row and create its deal
+    
+    `state` holds ids written by an earlier attempt at this row; `checkpoint`
+    is called with each id as soon as it is known.
+    """
+    state = state or {}
+    checkpoint = checkpoint or (lambda **fields: None)
+    
+    # Create/find organization (create_organization searches first)
+    org_id = state.get('org_id')
+    if not org_id:
+        org_id = await client.create_organization(
+            mapped_data['bedrijfsnaam'], 
+            mapped_data['address']
+        )
+        if org_id:
+            checkpoint(org_id=org_id, org_created=org_id in client.created['organizations'])
+    
+    # Create/find person
+    person_id = state.get('person_id')
+    if not person_id and mapped_data['email']:
+        if org_id:
+            person_id = await client.create_person(
+                mapped_data['contactpersoon'] or 'Unknown',
+                mapped_data['email'],
+                mapped_data['telefoon'],
+                mapped_data['functie'],
+                org_id
+            )
+        else:
+            person_id = await client.find_person(mapped_data['email'])
+        if person_id:
+            checkpoint(person_id=person_id, person_created=person_id in client.created['persons'])
+    
+    # Create deal
+    if not org_id:
+        return None
+    deal_id = await client.create_deal(
+        mapped_data['deal_titel'],
+        org_id,
+        person_id,
+        int(mapped_data['deal_value']),
+        pipeline_id,
+        stage_id,
+        {
+            'vacature_titel': mapped_data['vacature_titel'],
+            'locatie': mapped_data['locatie'],
+            'contact_phone': mapped_data['telefoon']  # Add phone to deal
+        }
+    )
+    if deal_id:
+        checkpoint(deal_id=deal_id)
+    return deal_id
+
 async def import_from_csv(filepath: str, max_rows: Optional[int] = None, 
                          pipeline_id: int = DEFAULT_PIPELINE_ID,
-                         stage_id: int = DEFAULT_STAGE_ID) -> ImportResult:
-    """Import data from CSV file into Pipedrive"""
+                         stage_id: int = DEFAULT_STAGE_ID,
+                         max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+                         prewarm: bool = True,
+                         job_id: Optional[str] = None) -> ImportResult:
+    """Import data from CSV file into Pipedrive
+    
+    Rows stream through parse -> validate/map -> push stages connected by
+    bounded queues, so memory stays flat and deals are created while the
+    file is still being read. Pass the job_id of an earlier run to resume it.
+    """
     
     if not PIPEDRIVE_API_KEY:
         raise Exception("PIPEDRIVE_API_KEY not configured")
     
     start_time = time.time()
-    job_id = str(uuid.uuid4())
+    job_id = job_id or str(uuid.uuid4())
+    progress = track_progress(job_id, 'csv')
+    
+    # Journal the job so a crash can be resumed from the first uncommitted row
+    journal = get_journal()
+    done: Dict[int, Dict] = {}
+    if journal:
+        journal.start_job(job_id, 'csv', {
+            'filepath': filepath, 'max_rows': max_rows, 'pipeline_id': pipeline_id,
+            'stage_id': stage_id, 'max_concurrency': max_concurrency, 'prewarm': prewarm,
+        })
+        done = journal.row_states(job_id)
+    
+    # Initialize counters
+    rows_read = 0
+    deals_created = 0
+    errors = []
+    cache = None
+    client = None
+    
+    def totals() -> Dict[str, int]:
+        if journal:
+            # Count work from earlier attempts of a resumed job as well
+            return journal.totals(job_id)
+        return {
+            'orgs_created': len(client.created['organizations']) if client else 0,
+            'persons_created': len(client.created['persons']) if client else 0,
+            'deals_created': deals_created,
+        }
     
     try:
-        # Parse CSV
-        csv_data = parse_csv(filepath, max_rows=max_rows)
-        if not csv_data:
-            raise Exception("No data found in CSV file")
+        progress.total_rows = count_csv_rows(filepath, max_rows)
+        
+        def add_error(error: Dict):
+            errors.append(error)
+            progress.add_error(error)
+            progress.rows_done += 1
         
-        # Initialize counters
-        orgs_created = 0
-        persons_created = 0
-        deals_created = 0
-        errors = []
+        def checkpoint(i: int, **fields):
+            if journal:
+                journal.record(job_id, i, **fields)
+            for stage in ('org_id', 'person_id', 'deal_id'):
+                if stage in fields:
+                    progress.bump(stage.replace('_id', 's'))
         
-        client = PipedriveClient(PIPEDRIVE_API_KEY)
+        cache = open_entity_cache()
+        client = PipedriveClient(PIPEDRIVE_API_KEY, max_concurrency, cache)
+        progress.api = client.stats
+        if prewarm:
+            await prewarm_client(client)
         
-        # Process each row
-        for i, row in enumerate(csv_data, 1):
+        # Two rows per request slot, so one row's next call is ready when another's returns
+        push_workers = max_concurrency * 2
+        raw_queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        mapped_queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        
+        async def read_rows():
+            nonlocal rows_read
+            try:
+                for i, row in enumerate(iter_csv(filepath, max_rows=max_rows), 1):
+                    rows_read = i
+                    progress.bump('read')
+                    await raw_queue.put((i, row))
+            finally:
+                await raw_queue.put(None)
+        
+        async def map_rows():
             try:
-                # Validate row
-                is_valid, error_msg = validate_csv_row(row)
-                if not is_valid:
-                    errors.append({
+                while (item := await raw_queue.get()) is not None:
+                    i, row = item
+                    if done.get(i, {}).get('deal_id'):
+                        # Committed by an earlier attempt
+                        progress.bump('skipped')
+                        progress.rows_done += 1
+                        continue
+                    
+                    # Validate row
+                    is_valid, error_msg = validate_csv_row(row)
+                    if not is_valid:
+                        add_error({
+                            'row': i,
+                            'error': error_msg,
+                            'data': row
+                        })
+                        continue
+                    
+                    # Map to Pipedrive format
+                    progress.bump('mapped')
+                    await mapped_queue.put((i, row, map_csv_to_pipedrive(row)))
+            finally:
+                for _ in range(push_workers):
+                    await mapped_queue.put(None)
+        
+        async def push_rows():
+            nonlocal deals_created
+            while (item := await mapped_queue.get()) is not None:
+                i, row, mapped_data = item
+                try:
+                    if await push_csv_row(client, mapped_data, pipeline_id, stage_id,
+                                          done.get(i), functools.partial(checkpoint, i)):
+                        deals_created += 1
+                    progress.rows_done += 1
+                except Exception as e:
+                    add_error({
                         'row': i,
-                        'error': error_msg,
+                        'error': str(e),
                         'data': row
                     })
-                    continue
-                
-                # Map to Pipedrive format
-                mapped_data = map_csv_to_pipedrive(row)
-                
-                # Create/find organization
-                org_id = client.find_organization(mapped_data['bedrijfsnaam'])
-                if not org_id:
-                    org_id = client.create_organization(
-                        mapped_data['bedrijfsnaam'], 
-                        mapped_data['address']
-                    )
-                    if org_id:
-                        orgs_created += 1
-                
-                # Create/find person
-                person_id = None
-                if mapped_data['email']:
-                    person_id = client.find_person(mapped_data['email'])
-                    if not person_id and org_id:
-                        person_id = client.create_person(
-                            mapped_data['contactpersoon'] or 'Unknown',
-                            mapped_data['email'],
-                            mapped_data['telefoon'],
-                            mapped_data['functie'],
-                            org_id
-                        )
-                        if person_id:
-                            persons_created += 1
-                
-                # Create deal
-                if org_id:
-                    deal_id = client.create_deal(
-                        mapped_data['deal_titel'],
-                        org_id,
-                        person_id,
-                        int(mapped_data['deal_value']),
-                        pipeline_id,
-                        stage_id,
-                        {
-                            'vacature_titel': mapped_data['vacature_titel'],
-                            'locatie': mapped_data['locatie'],
-                            'contact_phone': mapped_data['telefoon']  # Add phone to deal
-                        }
-                    )
-                    if deal_id:
-                        deals_created += 1
-                
-            except Exception as e:
-                errors.append({
-                    'row': i,
-                    'error': str(e),
-                    'data': row
-                })
         
+        outcomes = await asyncio.gather(
+            read_rows(), map_rows(), *(push_rows() for _ in range(push_workers)),
+            return_exceptions=True
+        )
+        
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                raise outcome
+        if not rows_read:
+            raise Exception("No data found in CSV file")
+        
+        errors.sort(key=lambda e: e['row'])
         duration = time.time() - start_time
         
+        counts = totals()
         result = ImportResult(
             job_id=job_id,
             success=len(errors) == 0,
-            orgs_created=orgs_created,
-            persons_created=persons_created,
-            deals_created=deals_created,
+            orgs_created=counts['orgs_created'],
+            persons_created=counts['persons_created'],
+            deals_created=counts['deals_created'],
             errors=errors,
             duration_seconds=duration,
             timestamp=datetime.now().isoformat()
@@ -653,23 +1607,62 @@ async def import_from_csv(filepath: str, max_rows: Optional[int] = None,
         
         # Store result
         import_jobs[job_id] = asdict(result)
+        progress.finish(result.success)
+        if journal:
+            journal.finish_job(job_id, asdict(result))
         
         return result
         
     except Exception as e:
         duration = time.time() - start_time
+        # Rows committed before the failure still count
+        counts = totals()
         result = ImportResult(
             job_id=job_id,
             success=False,
-            orgs_created=0,
-            persons_created=0,
-            deals_created=0,
-            errors=[{'error': str(e)}],
+            orgs_created=counts['orgs_created'],
+            persons_created=counts['persons_created'],
+            deals_created=counts['deals_created'],
+            errors=errors + [{'error': str(e)}],
             duration_seconds=duration,
             timestamp=datetime.now().isoformat()
         )
         import_jobs[job_id] = asdict(result)
+        progress.add_error({'error': str(e)})
+        progress.finish(False)
+        if journal:
+            journal.finish_job(job_id, asdict(result))
         return result
+    
+    finally:
+        if client:
+            client.flush_cache()
+            client.close()
+        if cache:
+            cache.close()
+
+def start_background_import(job_id: str, source: str, job) -> Dict:
+    """Run an import coroutine as a background task and return its job_id right away
+    
+    The coroutine registers its own progress as its first step, so there is one
+    ImportProgress per run for get_import_status to poll.
+    """
+    task = asyncio.create_task(job)
+    background_tasks[job_id] = task
+    
+    def on_done(finished: asyncio.Task):
+        background_tasks.pop(job_id, None)
+        if not finished.cancelled() and finished.exception():
+            progress = import_progress.get(job_id) or track_progress(job_id, source)
+            progress.add_error({'error': str(finished.exception())})
+            progress.finish(False)
+    
+    task.add_done_callback(on_done)
+    return {
+        'job_id': job_id,
+        'status': 'running',
+        'message': 'Import started in the background; poll get_import_status for progress'
+    }
 
 # =============================================================================
 # MCP SERVER
@@ -691,7 +1684,11 @@ async def list_tools() -> List[Tool]:
                     "worksheet_name": {"type": "string", "default": "Voor_Pipedrive"},
                     "max_rows": {"type": ["integer", "null"], "default": None},
                     "skip_invalid": {"type": "boolean", "default": True},
-                    "test_mode": {"type": "boolean", "default": False}
+                    "test_mode": {"type": "boolean", "default": False},
+                    "max_concurrency": {"type": "integer", "default": MAX_CONCURRENT_REQUESTS},
+                    "pipelined": {"type": "boolean", "default": True},
+                    "prewarm": {"type": "boolean", "default": True},
+                    "background": {"type": "boolean", "default": True}
                 },
                 "required": ["spreadsheet_id"]
             }
@@ -718,14 +1715,45 @@ async def list_tools() -> List[Tool]:
                     "filepath": {"type": "string"},
                     "max_rows": {"type": ["integer", "null"], "default": None},
                     "pipeline_id": {"type": "integer", "default": 14},
-                    "stage_id": {"type": "integer", "default": 95}
+                    "stage_id": {"type": "integer", "default": 95},
+                    "max_concurrency": {"type": "integer", "default": MAX_CONCURRENT_REQUESTS},
+                    "prewarm": {"type": "boolean", "default": True},
+                    "background": {"type": "boolean", "default": True}
+                },
+                "required": ["filepath"]
+            }
+        ),
+        Tool(
+            name="plan_csv_import",
+            description="Dry run for import_from_csv: orgs/persons/deals to create, estimated API calls and duration (no network)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "filepath": {"type": "string"},
+                    "max_rows": {"type": ["integer", "null"], "default": None},
+                    "max_concurrency": {"type": "integer", "default": MAX_CONCURRENT_REQUESTS},
+                    "list_limit": {"type": ["integer", "null"], "default": 100}
                 },
                 "required": ["filepath"]
             }
         ),
+        Tool(
+            name="resume_import",
+            description="Resume an interrupted import job from its first uncommitted row",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "job_id": {"type": "string"},
+                    "background": {"type": "boolean", "default": True},
+                    "prewarm": {"type": "boolean", "default": False,
+                                "description": "Re-sync the org/person cache first (resumed rows reuse journaled ids)"}
+                },
+                "required": ["job_id"]
+            }
+        ),
         Tool(
             name="get_import_status",
-            description="Get status of import job",
+            description="Get status of import job: live rows/sec, ETA, stage counters and recent errors",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -751,13 +1779,22 @@ async def call_tool(name: str, arguments: Dict) -> List[TextContent]:
     """Handle tool calls"""
     
     if name == "import_from_google_sheet":
-        result = await do_import(
+        job_id = str(uuid.uuid4())[:8]
+        job = do_import(
             arguments['spreadsheet_id'],
             arguments.get('worksheet_name', 'Voor_Pipedrive'),
             arguments.get('max_rows'),
             arguments.get('skip_invalid', True),
-            arguments.get('test_mode', False)
+            arguments.get('test_mode', False),
+            arguments.get('max_concurrency', MAX_CONCURRENT_REQUESTS),
+            arguments.get('pipelined', True),
+            arguments.get('prewarm', True),
+            job_id=job_id
         )
+        if arguments.get('background', True):
+            response = start_background_import(job_id, 'google_sheet', job)
+            return [TextContent(type="text", text=json.dumps(response, indent=2))]
+        result = await job
         
         response = {
             'job_id': result.job_id,
@@ -784,12 +1821,20 @@ async def call_tool(name: str, arguments: Dict) -> List[TextContent]:
         return [TextContent(type="text", text=json.dumps(result, indent=2))]
     
     elif name == "import_from_csv":
-        result = await import_from_csv(
+        job_id = str(uuid.uuid4())
+        job = import_from_csv(
             arguments['filepath'],
             arguments.get('max_rows'),
             arguments.get('pipeline_id', DEFAULT_PIPELINE_ID),
-            arguments.get('stage_id', DEFAULT_STAGE_ID)
+            arguments.get('stage_id', DEFAULT_STAGE_ID),
+            arguments.get('max_concurrency', MAX_CONCURRENT_REQUESTS),
+            arguments.get('prewarm', True),
+            job_id=job_id
         )
+        if arguments.get('background', True):
+            response = start_background_import(job_id, 'csv', job)
+            return [TextContent(type="text", text=json.dumps(response, indent=2))]
+        result = await job
         
         response = {
             'job_id': result.job_id,
@@ -804,15 +1849,90 @@ async def call_tool(name: str, arguments: Dict) -> List[TextContent]:
         
         return [TextContent(type="text", text=json.dumps(response, indent=2))]
     
+    elif name == "plan_csv_import":
+        try:
+            plan = plan_csv_import(
+                arguments['filepath'],
+                arguments.get('max_rows'),
+                arguments.get('max_concurrency', MAX_CONCURRENT_REQUESTS)
+            )
+        except Exception as e:
+            return [TextContent(type="text", text=json.dumps({'error': str(e)}))]
+        
+        # Totals are exact; entity lists are truncated for the response only
+        limit = arguments.get('list_limit', 100)
+        for key in ('organizations_to_create', 'persons_to_create', 'deals_to_create', 'invalid_rows'):
+            plan[f'{key}_count'] = len(plan[key])
+            if limit is not None:
+                plan[key] = plan[key][:limit]
+        return [TextContent(type="text", text=json.dumps(plan, indent=2))]
+    
+    elif name == "resume_import":
+        journal = get_journal()
+        job_id = arguments['job_id']
+        saved = journal.get_job(job_id) if journal else None
+        if not saved:
+            return [TextContent(type="text", text=json.dumps({'error': 'Job not found'}))]
+        if job_id in background_tasks:
+            return [TextContent(type="text", text=json.dumps({'error': 'Job is still running'}))]
+        
+        params = saved['params']
+        # The first attempt already pre-warmed; journaled rows need no lookups
+        prewarm = arguments.get('prewarm', False)
+        if saved['source'] == 'csv':
+            job = import_from_csv(
+                params['filepath'],
+                params.get('max_rows'),
+                params.get('pipeline_id', DEFAULT_PIPELINE_ID),
+                params.get('stage_id', DEFAULT_STAGE_ID),
+                params.get('max_concurrency', MAX_CONCURRENT_REQUESTS),
+                prewarm,
+                job_id=job_id
+            )
+        else:
+            job = do_import(
+                params['spreadsheet_id'],
+                params.get('worksheet_name', 'Voor_Pipedrive'),
+                params.get('max_rows'),
+                params.get('skip_invalid', True),
+                params.get('test_mode', False),
+                params.get('max_concurrency', MAX_CONCURRENT_REQUESTS),
+                params.get('pipelined', True),
+                prewarm,
+                job_id=job_id
+            )
+        if arguments.get('background', True):
+            response = start_background_import(job_id, saved['source'], job)
+            return [TextContent(type="text", text=json.dumps(response, indent=2))]
+        result = await job
+        
+        return [TextContent(type="text", text=json.dumps(asdict(result), indent=2))]
+    
     elif name == "get_import_status":
+        progress = import_progress.get(arguments['job_id'])
+        if progress:
+            # Live counters for jobs started by this process
+            job = progress.snapshot()
+            if arguments['job_id'] in import_jobs:
+                job['result'] = import_jobs[arguments['job_id']]
+            return [TextContent(type="text", text=json.dumps(job, indent=2))]
+        
         job = import_jobs.get(arguments['job_id'])
+        if not job:
+            # Jobs from earlier processes (including interrupted ones) live in the journal
+            journal = get_journal()
+            job = journal.get_job(arguments['job_id']) if journal else None
         if not job:
             return [TextContent(type="text", text=json.dumps({'error': 'Job not found'}))]
         return [TextContent(type="text", text=json.dumps(job, indent=2))]
     
     elif name == "list_recent_imports":
         limit = arguments.get('limit', 10)
-        recent = list(import_jobs.values())[-limit:]
+        journal = get_journal()
+        if journal:
+            recent = journal.recent_jobs(limit)
+        else:
+            recent = list(import_jobs.values())[-limit:]
         return [TextContent(type="text", text=json.dumps(recent, indent=2))]
     
     else: